@@ -0,0 +1 @@
+"""Offline benchmarks for the ResellerClub API client"""
@@ -0,0 +1,80 @@
+"""Compares the JSON decoders on customer search pages built from the recorded responses.
+
+Usage:
+    python -m benchmarks.decoding --records 500 --repeat 50
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Dict, List
+
+from src.resellerclub.client.customers import parse_search
+from src.resellerclub.client.decoders import orjson, orjson_decoder, stdlib_decoder
+
+from .server import RESPONSES_DIR
+
+
+def build_search_page(records: int) -> bytes:
+    """Builds a customer search page with `records` copies of the recorded customer"""
+    data = json.loads((RESPONSES_DIR / "customers" / "customers.txt").read_bytes())
+    customer = data["1"]
+    page = {"recsonpage": str(records), "recsindb": str(records)}
+    for i in range(1, records + 1):
+        page[str(i)] = dict(customer, **{"customer.customerid": str(i)})
+    return json.dumps(page).encode()
+
+
+def text_decoder(content: bytes):
+    """Decodes the bytes to text first, as `requests.Response.json` does"""
+    return json.loads(content.decode("utf-8"))
+
+
+def run(records: int, repeat: int) -> List[Dict]:
+    """Times each decoder, alone and followed by the search response parsing"""
+    content = build_search_page(records)
+    decoders = {"text": text_decoder, "stdlib": stdlib_decoder}
+    if orjson is not None:
+        decoders["orjson"] = orjson_decoder
+
+    results = []
+    for name, decoder in decoders.items():
+        decode = min(timeit.repeat(lambda: decoder(content), number=1, repeat=repeat))
+        full = min(
+            timeit.repeat(
+                lambda: parse_search(decoder(content)), number=1, repeat=repeat
+            )
+        )
+        results.append(
+            {
+                "decoder": name,
+                "bytes": len(content),
+                "decode": decode,
+                "decode_parse": full,
+            }
+        )
+        print(
+            f"{name:<8} decode {decode * 1000:>8.3f} ms  "
+            f"decode+parse {full * 1000:>8.3f} ms  ({len(content)} bytes)"
+        )
+    return results
+
+
+def main(argv: List[str] = None) -> List[Dict]:
+    """Runs the decoder benchmark from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.records, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
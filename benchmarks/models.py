@@ -0,0 +1,90 @@
+"""Compares the Customer search factory, which looks up the prefixed keys directly, with
+per-record key splitting.
+
+Usage:
+    python -m benchmarks.models --records 500 --repeat 50
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Dict, List
+
+from src.resellerclub.models.customer import Customer
+
+from .decoding import build_search_page
+
+
+def split_from_search(data: dict) -> Customer:
+    """Builds a Customer by splitting every key of the record, as the factory used to"""
+    customer_data = {k.split(".")[1]: v for k, v in data.items()}
+    return Customer(
+        _id=customer_data["customerid"],
+        username=customer_data["username"],
+        reseller_id=customer_data["resellerid"],
+        name=customer_data["name"],
+        company=customer_data["company"],
+        address=(None, customer_data["city"], None, customer_data["country"], None),
+        status=customer_data["customerstatus"],
+        total_receipts=float(customer_data["totalreceipts"]),
+        phones=(customer_data["telnocc"], customer_data["telno"]),
+        website_count=int(customer_data["websitecount"]),
+    )
+
+
+def time_factory(factory, records: List[dict], repeat: int) -> float:
+    """Returns the best time to build a Customer from every record"""
+    return min(
+        timeit.repeat(
+            lambda: [factory(record) for record in records], number=1, repeat=repeat
+        )
+    )
+
+
+def run(records: int, repeat: int) -> List[Dict]:
+    """Times the old and current factories on search records"""
+    page = json.loads(build_search_page(records))
+    search_records = [v for k, v in page.items() if k not in ("recsonpage", "recsindb")]
+
+    cases = {
+        "from_search": (split_from_search, Customer.from_search, search_records),
+    }
+    results = []
+    for name, (old, new, data) in cases.items():
+        assert old(data[0]) == new(data[0])
+        old_time = time_factory(old, data, repeat)
+        new_time = time_factory(new, data, repeat)
+        results.append(
+            {
+                "factory": name,
+                "records": records,
+                "old": old_time,
+                "new": new_time,
+                "speedup": old_time / new_time,
+            }
+        )
+        print(
+            f"{name:<13} old {old_time * 1000:>8.3f} ms  "
+            f"new {new_time * 1000:>8.3f} ms  ({old_time / new_time:.2f}x)"
+        )
+    return results
+
+
+def main(argv: List[str] = None) -> List[Dict]:
+    """Runs the factory benchmark from the command line"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.records, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,258 @@
+"""Runs the client benchmarks against a local server replaying the recorded responses.
+
+Usage:
+    python -m benchmarks.run --requests 500 --workers 16 --latency 0.005
+    python -m benchmarks.run --output results.json --compare previous.json
+
+Results are printed and, with --output, saved as JSON so they can be compared between
+releases with --compare.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from src.resellerclub import AsyncResellerClub, ResellerClub
+from src.resellerclub.__about__ import __version__
+from src.resellerclub.client.transport import AsyncTransport, Transport
+from src.resellerclub.client.urls import URLs
+
+from .server import ReplayServer
+
+API_URL = URLs.shared(test_mode=True).base_url
+
+SCENARIOS = {
+    "check_availability": lambda api: api.domains.check_availability(
+        ["github", "google"], ["com", "net"]
+    ),
+    "suggest_names": lambda api: api.domains.suggest_names("reseller"),
+    "search": lambda api: api.customers.search(10, 1),
+    "get_by_id": lambda api: api.customers.get_by_id(30930235),
+}
+
+MODES = ("serial", "threaded", "async")
+
+
+class ReplayTransport(Transport):
+    """Transport sending the requests to the replay server instead of the API"""
+
+    def __init__(self, server_url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.server_url = server_url
+
+    def request(self, method, url, params, timeout, stream=False):
+        url = url.replace(API_URL, self.server_url, 1)
+        return super().request(method, url, params, timeout, stream)
+
+
+class AsyncReplayTransport(AsyncTransport):
+    """Asyncio transport sending the requests to the replay server instead of the API"""
+
+    def __init__(self, server_url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.server_url = server_url
+
+    async def request(self, method, url, params, timeout, stream=False):
+        url = url.replace(API_URL, self.server_url, 1)
+        return await super().request(method, url, params, timeout, stream)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Returns the percentile of the values, using the nearest rank"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def timed(call: Callable, latencies: List[float]) -> bool:
+    """Calls `call`, appending its latency. Returns False if it raised an exception."""
+    start = time.perf_counter()
+    try:
+        call()
+        return True
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    finally:
+        latencies.append(time.perf_counter() - start)
+
+
+def run_serial(call: Callable, requests: int, workers: int) -> tuple:
+    """Runs the calls one after another"""
+    # pylint: disable=unused-argument
+    latencies = []
+    errors = sum(not timed(call, latencies) for _ in range(requests))
+    return latencies, errors
+
+
+def run_threaded(call: Callable, requests: int, workers: int) -> tuple:
+    """Runs the calls on a thread pool"""
+    latencies = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda _: timed(call, latencies), range(requests)))
+    return latencies, results.count(False)
+
+
+async def run_async(call: Callable, requests: int, workers: int) -> tuple:
+    """Runs the calls as asyncio tasks, at most `workers` at a time"""
+    latencies = []
+    semaphore = asyncio.Semaphore(workers)
+
+    async def timed_call() -> bool:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call()
+                return True
+            except Exception:  # pylint: disable=broad-exception-caught
+                return False
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    results = await asyncio.gather(*(timed_call() for _ in range(requests)))
+    return latencies, results.count(False)
+
+
+def summarize(
+    scenario: str, mode: str, latencies: List[float], errors: int, wall: float
+) -> dict:
+    """Builds the result record of a benchmark"""
+    return {
+        "scenario": scenario,
+        "mode": mode,
+        "requests": len(latencies),
+        "errors": errors,
+        "wall_time": wall,
+        "throughput": len(latencies) / wall if wall else 0.0,
+        "mean": statistics.fmean(latencies) if latencies else 0.0,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+    }
+
+
+def run_benchmarks(
+    server_url: str, scenarios: List[str], modes: List[str], requests: int, workers: int
+) -> List[dict]:
+    """Runs every scenario in every mode against the replay server"""
+    results = []
+    transport = ReplayTransport(server_url, pool_maxsize=workers)
+    api = ResellerClub("reseller", "key", transport=transport)
+    runners = {"serial": run_serial, "threaded": run_threaded}
+
+    for scenario in scenarios:
+        for mode in modes:
+            if mode == "async":
+                latencies, errors, wall = asyncio.run(
+                    run_async_scenario(server_url, scenario, requests, workers)
+                )
+            else:
+                call = lambda: SCENARIOS[scenario](api)  # pylint: disable=W0640
+                start = time.perf_counter()
+                latencies, errors = runners[mode](call, requests, workers)
+                wall = time.perf_counter() - start
+            results.append(summarize(scenario, mode, latencies, errors, wall))
+            print(format_result(results[-1]))
+
+    api.close()
+    return results
+
+
+async def run_async_scenario(
+    server_url: str, scenario: str, requests: int, workers: int
+) -> tuple:
+    """Runs a scenario with the asyncio client"""
+    transport = AsyncReplayTransport(
+        server_url, max_connections=workers, max_keepalive_connections=workers
+    )
+    async with AsyncResellerClub("reseller", "key", transport=transport) as api:
+        start = time.perf_counter()
+        latencies, errors = await run_async(
+            lambda: SCENARIOS[scenario](api), requests, workers
+        )
+        return latencies, errors, time.perf_counter() - start
+
+
+def format_result(result: dict) -> str:
+    """Formats a result record as a table row"""
+    return (
+        f"{result['scenario']:<20} {result['mode']:<9} "
+        f"{result['throughput']:>10.1f} req/s  "
+        f"p50 {result['p50'] * 1000:>8.2f} ms  "
+        f"p99 {result['p99'] * 1000:>8.2f} ms  "
+        f"errors {result['errors']}"
+    )
+
+
+def compare(results: List[dict], previous: List[dict]) -> None:
+    """Prints the change of throughput and p99 latency against previous results"""
+    previous = {(r["scenario"], r["mode"]): r for r in previous}
+    print("\nChange against previous results:")
+    for result in results:
+        before = previous.get((result["scenario"], result["mode"]))
+        if before is None:
+            continue
+        throughput = (result["throughput"] / before["throughput"] - 1) * 100
+        p99 = (result["p99"] / before["p99"] - 1) * 100 if before["p99"] else 0.0
+        print(
+            f"{result['scenario']:<20} {result['mode']:<9} "
+            f"throughput {throughput:+7.1f}%  p99 {p99:+7.1f}%"
+        )
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parses the command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with results saved with --output")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> Dict:
+    """Runs the benchmarks from the command line"""
+    args = parse_args(argv)
+    server = ReplayServer(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate
+    )
+    with server:
+        results = run_benchmarks(
+            server.url, args.scenarios, args.modes, args.requests, args.workers
+        )
+
+    report = {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "settings": vars(args),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f)["results"])
+    return report
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
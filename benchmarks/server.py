@@ -0,0 +1,110 @@
+"""Local HTTP server replaying the recorded API responses"""
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict
+from urllib.parse import urlsplit
+
+RESPONSES_DIR = Path(__file__).resolve().parent.parent / "tests" / "responses"
+
+# Recorded response replayed for each endpoint path
+DEFAULT_ROUTES = {
+    "/api/domains/available.json": "domains/availability/multiple_domains_multiple_tlds.txt",
+    "/api/domains/v5/suggest-names.json": "domains/suggest_names/keyword_only.txt",
+    "/api/customers/search.json": "customers/customers.txt",
+    "/api/customers/details-by-id.json": "customers/customer_details.txt",
+    "/api/customers/details.json": "customers/customer_details.txt",
+}
+
+ERROR_BODY = json.dumps({"status": "ERROR", "message": "Injected error"}).encode()
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """HTTP server answering every request with a recorded response.
+
+    Args:
+        latency (float, optional): Seconds added to every response. Defaults to 0.
+        jitter (float, optional): Maximum random seconds added on top of `latency`.
+            Defaults to 0.
+        error_rate (float, optional): Fraction of requests answered with a 500 error.
+            Defaults to 0.
+        routes (Dict[str, str], optional): Response file, relative to tests/responses, for each
+            endpoint path. Defaults to DEFAULT_ROUTES.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        routes: Dict[str, str] = None,
+        port: int = 0,
+    ) -> None:
+        super().__init__(("127.0.0.1", port), ReplayHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.responses = {
+            path: (RESPONSES_DIR / file).read_bytes()
+            for path, file in (routes or DEFAULT_ROUTES).items()
+        }
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def __enter__(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Answers requests with the recorded response of their endpoint"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: ReplayServer
+
+    def _reply(self) -> None:
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        delay = server.latency + random.uniform(0, server.jitter)
+        if delay:
+            time.sleep(delay)
+
+        body = server.responses.get(urlsplit(self.path).path)
+        status = 200
+        if body is None:
+            status, body = 404, json.dumps({"message": "Unknown endpoint"}).encode()
+        elif random.random() < server.error_rate:
+            status, body = 500, ERROR_BODY
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
@@ -1,3 +1,11 @@
-from .wrapper import ResellerClub
+from .client.timeouts import deadline
+from .tenants import AsyncResellerClubFactory, ResellerClubFactory
+from .wrapper import AsyncResellerClub, ResellerClub
 
-__all__ = ["ResellerClub"]
+__all__ = [
+    "AsyncResellerClub",
+    "AsyncResellerClubFactory",
+    "ResellerClub",
+    "ResellerClubFactory",
+    "deadline",
+]
@@ -0,0 +1,497 @@
+"""Asyncio API Clients
+
+The async clients share the endpoint methods of the sync clients through the
+`DomainsEndpoints` and `CustomersEndpoints` mixins, only the request itself is awaited.
+Every public method returns an awaitable.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Iterable, List, Literal, Tuple
+
+from ..exceptions import ResellerClubAPIException
+from ..models.customer import Customer
+from .base import ClientCore, Parser
+from .bulk import BulkSubmission, SubmitJob, SubmitResult
+from .columnar import CustomerColumns
+from .customers import (
+    BulkCustomers,
+    CustomersEndpoints,
+    PageQueue,
+    SearchResponse,
+    SearchStream,
+    SnapshotRefresh,
+    build_search_params,
+    check_recovery_error,
+    count_pages,
+    plan_submissions,
+    remaining_pages,
+    submitted_id,
+)
+from .domains import (
+    BulkAvailability,
+    ChunkError,
+    DomainsEndpoints,
+    chunk_availability_grid,
+)
+from .retry import RetryPolicy, retry_scope
+from .snapshot import CustomerSnapshot
+from .streaming import ObjectItemParser
+from .sync import RangeSearch, SyncChange, SyncState, Window, probe_outcome
+from .timeouts import Deadline, resolve_deadline
+from .transport import AsyncTransport
+
+
+async def run_within(limit: Deadline | None, func, *args, **kwargs) -> Any:
+    """Awaits `func` with the deadline applied, if there is one"""
+    if limit is None:
+        return await func(*args, **kwargs)
+    with limit.scope():
+        return await func(*args, **kwargs)
+
+
+class AsyncBaseClient(ClientCore):
+    """Base asyncio API Client class"""
+
+    transport_class = AsyncTransport
+
+    async def _wait_for_rate_limiter(self) -> None:
+        """Asyncio version of `BaseClient._wait_for_rate_limiter`"""
+        delay = self._rate_limiter_delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self, method: str, url: str, params: dict, stream: bool = False
+    ) -> Any:
+        """Asyncio version of `BaseClient._send`"""
+        await self._wait_for_rate_limiter()
+        options = self._request_options(url, stream)
+        start = time.monotonic()
+        try:
+            response = await self._transport.request(method, url, params, **options)
+        except Exception:
+            self._record_outcome(start)
+            raise
+        if stream and response.status_code == 500:
+            # The body tells errors reported by the API from server failures
+            await response.aread()
+        self._record_outcome(start, response)
+        return response
+
+    async def _attempt(
+        self, method: str, url: str, params: dict, stream: bool
+    ) -> Tuple[Any, Exception | None]:
+        """Asyncio version of `BaseClient._attempt`"""
+        try:
+            return await self._send(method, url, params, stream), None
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return None, error
+
+    @staticmethod
+    async def _discard(response: Any, stream: bool) -> None:
+        """Asyncio version of `BaseClient._discard`"""
+        if stream and response is not None:
+            await response.aclose()
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        idempotent: bool,
+        stream: bool = False,
+    ) -> Any:
+        """Asyncio version of `BaseClient._send_with_retries`"""
+        policy = self._get_retry_policy(idempotent)
+        if policy is None:
+            return await self._send(method, url, params, stream)
+
+        policy.record_request()
+        retry = 0
+        while True:
+            response, error = await self._attempt(method, url, params, stream)
+            delay = self._retry_delay(policy, retry, response, error)
+            if delay is None:
+                return self._final_attempt(response, error)
+            await self._discard(response, stream)
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def _perform_request(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        parser: Parser = None,
+        idempotent: bool = False,
+    ) -> Any:
+        """Asyncio version of `BaseClient._perform_request`"""
+        with self._call(method, url, params) as (event, request_params):
+            data = self._get_cached(method, url, request_params, event)
+            if data is None:
+                response = await self._send_with_retries(
+                    method, url, request_params, idempotent
+                )
+                data = self._read_response(method, url, request_params, response, event)
+            return self._parse(data, parser, event)
+
+    async def _stream_items(
+        self, url: str, params: dict, chunk_size: int = 65536
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Asyncio version of `BaseClient._stream_items`"""
+        with self._call("get", url, params) as (event, request_params):
+            response = await self._send_with_retries(
+                "get", url, request_params, True, stream=True
+            )
+            size = 0
+            try:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._decode_response(response, event)
+                parser = ObjectItemParser()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    size += len(chunk)
+                    for item in parser.feed(chunk):
+                        yield item
+                for item in parser.close():
+                    yield item
+            finally:
+                await response.aclose()
+                self._record_stream(event, response, size)
+
+
+class AsyncSearchStream(SearchStream):
+    """Customer search page parsed while it is being received. Iterate it with `async for`."""
+
+    def __iter__(self):
+        raise TypeError(f"{self.__class__.__name__} must be iterated with 'async for'")
+
+    async def __aiter__(self) -> AsyncIterator[Customer]:
+        async for key, value in self._items:
+            customer = self._read(key, value)
+            if customer is not None:
+                yield customer
+
+
+class AsyncDomainsClient(DomainsEndpoints, AsyncBaseClient):
+    """Asyncio Domains API Client"""
+
+    async def check_availability_bulk(
+        self,
+        domain_names: list,
+        tlds: list,
+        max_combinations: int = 100,
+        max_workers: int = 8,
+        deadline: float = None,
+    ) -> BulkAvailability:
+        """Asyncio version of `DomainsClient.check_availability_bulk`"""
+        limit = resolve_deadline(deadline)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def check(chunk):
+            async with semaphore:
+                return await run_within(limit, self.check_availability, *chunk)
+
+        chunks = list(chunk_availability_grid(domain_names, tlds, max_combinations))
+        results = await asyncio.gather(
+            *(check(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        availability, errors = [], []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                errors.append(ChunkError(*chunk, result))
+            else:
+                availability.extend(result)
+
+        return BulkAvailability(availability, errors)
+
+
+class AsyncCustomersClient(CustomersEndpoints, AsyncBaseClient):
+    """Asyncio Customers API Client"""
+
+    def iter_search(
+        self,
+        records: int = 100,
+        prefetch: bool = False,
+        deadline: float = None,
+        **filters,
+    ) -> AsyncIterator[Customer]:
+        """Asyncio version of `CustomersClient.iter_search`"""
+        limit = resolve_deadline(deadline)
+        return self._iter_search(limit, records, prefetch, filters)
+
+    async def _iter_search(
+        self, limit: Deadline | None, records: int, prefetch: bool, filters: dict
+    ) -> AsyncIterator[Customer]:
+
+        def fetch(page: int):
+            return run_within(limit, self.search, records, page, **filters)
+
+        response = await fetch(1)
+        pages = count_pages(response.db_records, records)
+        for page in range(2, pages + 2):
+            task = None
+            if prefetch and page <= pages:
+                task = asyncio.create_task(fetch(page))
+            try:
+                for customer in response:
+                    yield customer
+            except BaseException:
+                if task is not None:
+                    task.cancel()
+                raise
+            if page > pages:
+                return
+            response = await (task or fetch(page))
+
+    async def _run_concurrently(
+        self, func, items: list, max_workers: int, limit: Deadline | None
+    ) -> list:
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(item):
+            async with semaphore:
+                return await run_within(limit, func, item)
+
+        return await asyncio.gather(
+            *(call(item) for item in items), return_exceptions=True
+        )
+
+    async def _bulk_submit(
+        self,
+        operation: Literal["sign_up", "modify"],
+        customers: Iterable,
+        max_workers: int,
+        checkpoint: str | os.PathLike | None,
+        deadline: float,
+        validate: bool,
+    ) -> AsyncIterator[SubmitResult]:
+        limit = resolve_deadline(deadline)
+        submission = BulkSubmission(checkpoint, max_workers)
+        jobs = plan_submissions(operation, customers, submission.log, validate)
+
+        def start(job: SubmitJob) -> asyncio.Task:
+            return asyncio.create_task(run_within(limit, self._submit, operation, job))
+
+        try:
+            for result in submission.run(jobs, start):
+                if result is None:
+                    done, _ = await asyncio.wait(
+                        submission.in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for finished in submission.finish(done):
+                        yield finished
+                else:
+                    yield result
+        finally:
+            for task in submission.in_flight:
+                task.cancel()
+            submission.close()
+
+    async def _submit(
+        self, operation: Literal["sign_up", "modify"], job: SubmitJob
+    ) -> Any:
+        if job.recover:
+            try:
+                return int((await self.get_by_username(job.customer.username)).id)
+            except ResellerClubAPIException as error:
+                check_recovery_error(error)
+        result = await self._submit_request(operation, job.customer)
+        return submitted_id(operation, job.customer, result)
+
+    async def get_many_by_id(
+        self,
+        customer_ids: list,
+        details: bool = False,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        deadline: float = None,
+    ) -> BulkCustomers:
+        """Asyncio version of `CustomersClient.get_many_by_id`"""
+        lookup, items, merge = self._plan_get_many_by_id(
+            customer_ids, details, batch_size
+        )
+        limit = resolve_deadline(deadline)
+        return merge(await self._run_concurrently(lookup, items, max_workers, limit))
+
+    async def get_many_by_username(
+        self, usernames: list, max_workers: int = 8, deadline: float = None
+    ) -> BulkCustomers:
+        """Asyncio version of `CustomersClient.get_many_by_username`"""
+        lookup, items, merge = self._plan_get_many_by_username(usernames)
+        limit = resolve_deadline(deadline)
+        return merge(await self._run_concurrently(lookup, items, max_workers, limit))
+
+    def search_stream(self, records: int, page: int, **filters) -> AsyncSearchStream:
+        """Asyncio version of `CustomersClient.search_stream`"""
+        url = self._urls.customers.search
+        params = build_search_params(records, page, **filters)
+        return AsyncSearchStream(self._stream_items(url, params))
+
+    def export(
+        self,
+        records: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True,
+        deadline: float = None,
+        retry_policy: RetryPolicy = None,
+        **filters,
+    ) -> AsyncIterator[Customer]:
+        """Asyncio version of `CustomersClient.export`"""
+        limit = resolve_deadline(deadline)
+        policy = self._page_retry_policy(retry_policy)
+        pages = self._export_pages(
+            self.search, records, max_workers, ordered, limit, policy, filters
+        )
+        return self._export_customers(pages)
+
+    @staticmethod
+    async def _export_customers(
+        pages: AsyncIterator[SearchResponse],
+    ) -> AsyncIterator[Customer]:
+        try:
+            async for response in pages:
+                for customer in response:
+                    yield customer
+        finally:
+            # Cancel the pages still in flight if the iteration stops early
+            await pages.aclose()
+
+    def export_columns(
+        self,
+        records: int = 100,
+        max_workers: int = 8,
+        deadline: float = None,
+        retry_policy: RetryPolicy = None,
+        **filters,
+    ) -> Awaitable[CustomerColumns]:
+        """Asyncio version of `CustomersClient.export_columns`"""
+        limit = resolve_deadline(deadline)
+        policy = self._page_retry_policy(retry_policy)
+        pages = self._export_pages(
+            self.search_columns, records, max_workers, True, limit, policy, filters
+        )
+        return self._concat_pages(pages)
+
+    @staticmethod
+    async def _concat_pages(pages: AsyncIterator[CustomerColumns]) -> CustomerColumns:
+        return CustomerColumns.concat([page async for page in pages])
+
+    async def _export_pages(
+        self,
+        search,
+        records: int,
+        max_workers: int,
+        ordered: bool,
+        limit: Deadline | None,
+        policy: RetryPolicy | None,
+        filters: dict,
+    ) -> AsyncIterator[SearchResponse | CustomerColumns]:
+
+        async def fetch_page(page: int) -> SearchResponse | CustomerColumns:
+            with retry_scope(policy):
+                return await run_within(limit, search, records, page, **filters)
+
+        response = await fetch_page(1)
+        yield response
+        queue = PageQueue(
+            lambda page: asyncio.create_task(fetch_page(page)),
+            remaining_pages(response, records),
+            max_workers,
+        )
+        try:
+            while queue.pending:
+                if ordered:
+                    done = [queue.pending[0]]
+                else:
+                    done, _ = await asyncio.wait(
+                        queue.pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                for task in queue.take(done):
+                    yield await task
+        finally:
+            for task in queue.pending:
+                task.cancel()
+
+    async def write_snapshot(
+        self,
+        path: str | os.PathLike,
+        records: int = 500,
+        max_workers: int = 8,
+        deadline: float = None,
+        **filters,
+    ) -> int:
+        """Asyncio version of `CustomersClient.write_snapshot`"""
+        taken_at = datetime.now()
+        columns = await self.export_columns(
+            records, max_workers, deadline=deadline, **filters
+        )
+        return CustomerSnapshot.write(path, columns, taken_at)
+
+    async def refresh_snapshot(
+        self,
+        path: str | os.PathLike,
+        records: int = 500,
+        max_workers: int = 8,
+        deadline: float = None,
+        **filters,
+    ) -> int:
+        """Asyncio version of `CustomersClient.refresh_snapshot`"""
+        refresh = SnapshotRefresh.start(path, filters)
+        new = await self.export_columns(
+            records, max_workers, deadline=deadline, **refresh.filters
+        )
+        return refresh.finish(new)
+
+    async def search_range(
+        self,
+        creation_date_start: datetime,
+        creation_date_end: datetime,
+        records: int = 500,
+        max_workers: int = 8,
+        deadline: float = None,
+        **filters,
+    ) -> CustomerColumns:
+        """Asyncio version of `CustomersClient.search_range`"""
+        limit = resolve_deadline(deadline)
+        search = RangeSearch(creation_date_start, creation_date_end, records, filters)
+        while search.windows:
+            results = await self._run_concurrently(
+                self._probe_window, search.jobs(), max_workers, limit
+            )
+            search.add(results)
+        return search.result()
+
+    async def _probe_window(
+        self, job: Tuple[Window, int, dict]
+    ) -> Tuple[Window, CustomerColumns | List[Window]]:
+        window, records, filters = job
+        first_page = await self.search_columns(records, 1, **filters)
+        outcome = probe_outcome(window, first_page)
+        if outcome is None:
+            pages = [
+                await self.search_columns(records, page, **filters)
+                for page in remaining_pages(first_page, records)
+            ]
+            outcome = CustomerColumns.concat([first_page, *pages])
+        return window, outcome
+
+    async def sync(
+        self,
+        state: SyncState,
+        records: int = 500,
+        max_workers: int = 8,
+        full: bool = False,
+        deadline: float = None,
+        **filters,
+    ) -> List[SyncChange]:
+        """Asyncio version of `CustomersClient.sync`"""
+        started = datetime.now()
+        columns = await self.search_range(
+            state.start(full), started, records, max_workers, deadline, **filters
+        )
+        return state.apply([columns], started)
@@ -1,74 +1,466 @@
 """Base API classes"""
 
-import requests
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Tuple
 
-from ..exceptions import ResellerClubAPIException
+from ..exceptions import DeadlineExceededException, ResellerClubAPIException
+from .cache import ResponseCache
+from .decoders import Decoder, get_default_decoder
+from .instrumentation import RequestEvent, RequestHook
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, get_retry_policy
+from .streaming import ObjectItemParser
+from .timeouts import Timeout, Timeouts, get_deadline
+from .transport import (
+    TRANSIENT_STATUS_CODES,
+    AsyncTransport,
+    Transport,
+    is_api_error,
+)
 from .urls import URLs
 
+Parser = Callable[[Any], Any]
 
-class BaseClient:
-    """Base API Client class"""
+
+class ClientCore:
+    """Request building and response handling shared by the sync and asyncio API clients.
+
+    It does no I/O: `_get` and `_post` go through the `_perform_request` of the client, so
+    they return the result in the sync clients and an awaitable of it in the asyncio ones.
+    """
+
+    transport_class = None
+    # Sends a request and returns its result, or an awaitable of it
+    _perform_request: Callable[..., Any]
 
     def __init__(
         self,
         auth_userid: str,
         api_key: str,
         test_mode: bool = True,
+        transport: Transport | AsyncTransport = None,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        timeouts: Timeouts = None,
+        hooks: List[RequestHook] = None,
+        decoder: Decoder = None,
     ) -> None:
         self._auth_userid = auth_userid
         self._api_key = api_key
-        self._urls = URLs(test_mode)
+        self._urls = URLs.shared(test_mode)
+        self._transport = transport or self.transport_class()
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._timeouts = timeouts or Timeouts()
+        self._hooks = list(hooks or ())
+        self._decoder = decoder or get_default_decoder()
 
     def _build_params(self, **kwargs) -> dict:
         params = {"auth-userid": self._auth_userid, "api-key": self._api_key}
         params.update(kwargs)
         return params
 
-    def _perform_request(self, method: str, url: str, params: dict) -> dict:
-        """Perform a request to the API.
+    def _start_event(self, method: str, url: str) -> RequestEvent | None:
+        """Creates the event of a call and runs the before_request hooks.
+
+        Returns:
+            RequestEvent | None: The call event, None if there are no hooks
+        """
+        if not self._hooks:
+            return None
+        event = RequestEvent(self._urls.get_endpoint_name(url), method, url)
+        for hook in self._hooks:
+            hook.before_request(event)
+        return event
+
+    def _finish_event(
+        self, event: RequestEvent | None, error: Exception = None
+    ) -> None:
+        """Runs the after_response hooks, or the on_error hooks if the call failed"""
+        if event is None:
+            return
+        event.latency = time.perf_counter() - event.start
+        if error is None:
+            for hook in self._hooks:
+                hook.after_response(event)
+        else:
+            event.error = error
+            for hook in self._hooks:
+                hook.on_error(event)
+
+    def _decode_response(self, response, event: RequestEvent = None) -> Any:
+        """Decode a response, raising an exception if the API returned an error.
 
         Args:
-            method (str): Request method. Valid values are get, post, put, delete.
-            url (str): URL to request.
-            params (dict): Parameters to send in the request.
+            response: Response returned by the transport.
+            event (RequestEvent, optional): Event of the call, to record the response status,
+                size and decode time.
 
         Returns:
-            dict: dict with response data
+            Any: Response data
         """
-        params = self._build_params(**params)
-        func = getattr(requests, method)
-        response = func(url, params, timeout=120)
-
+        start = time.perf_counter()
+        if event is not None:
+            event.status_code = response.status_code
+            event.response_size = len(response.content)
         try:
-            data = response.json()
-        except requests.JSONDecodeError:
+            data = self._decoder(response.content)
+        except json.JSONDecodeError:
             response.raise_for_status()
+        if event is not None:
+            event.decode_time = time.perf_counter() - start
 
-        if not response.ok:
+        if response.status_code >= 400:
             raise ResellerClubAPIException(data["message"])
 
         return data
 
-    def _get(self, url: str, params: dict) -> dict:
+    def _get_timeout(self, url: str) -> Timeout:
+        """Returns the endpoint timeout, shortened to fit the deadline in effect.
+
+        Raises:
+            DeadlineExceededException: If the deadline in effect has passed.
+        """
+        timeout = self._timeouts.get(url)
+        limit = get_deadline()
+        if limit is None:
+            return timeout
+        remaining = limit.check()
+        return Timeout(min(timeout.connect, remaining), min(timeout.read, remaining))
+
+    @staticmethod
+    def _fits_deadline(delay: float) -> bool:
+        """Returns True if waiting `delay` seconds leaves time before the deadline in effect"""
+        limit = get_deadline()
+        return limit is None or delay < limit.remaining()
+
+    def _record_outcome(self, start: float, response=None) -> None:
+        """Reports the outcome of a request to the rate limiter, if there is one.
+
+        Transient statuses, such as throttling and gateway or server failures, and transport
+        errors count as failures. Errors the API reports, such as a lookup of an unknown
+        customer, say nothing about its load.
+
+        Args:
+            start (float): `time.monotonic()` value when the request was sent.
+            response (optional): Response returned by the transport, None if the request
+                failed before getting one.
+        """
+        if self._rate_limiter is None:
+            return
+        success = response is not None and (
+            response.status_code not in TRANSIENT_STATUS_CODES or is_api_error(response)
+        )
+        self._rate_limiter.record(success, time.monotonic() - start)
+
+    @staticmethod
+    def _parse(data: Any, parser: Parser = None, event: RequestEvent = None) -> Any:
+        """Builds the result of a call from the response data with the parser.
+
+        Args:
+            data (Any): Response data
+            parser (Parser, optional): Callable that builds the result from the response data.
+            event (RequestEvent, optional): Event of the call, to record the parse time.
+
+        Returns:
+            Any: Response data, parsed if a parser is given
+        """
+        if parser is None:
+            return data
+        if event is None:
+            return parser(data)
+        start = time.perf_counter()
+        result = parser(data)
+        event.parse_time = time.perf_counter() - start
+        return result
+
+    def _rate_limiter_delay(self) -> float:
+        """Reserves a request from the rate limiter, if there is one.
+
+        Returns:
+            float: Seconds to wait before sending the request
+
+        Raises:
+            DeadlineExceededException: If the wait would overrun the deadline in effect.
+        """
+        if self._rate_limiter is None:
+            return 0.0
+        delay = self._rate_limiter.reserve()
+        if delay and not self._fits_deadline(delay):
+            raise DeadlineExceededException(
+                "Deadline exceeded waiting for rate limiter"
+            )
+        return delay
+
+    def _request_options(self, url: str, stream: bool) -> dict:
+        """Returns the keyword arguments of a transport request.
+
+        Raises:
+            DeadlineExceededException: If the deadline in effect has passed.
+        """
+        options = {"timeout": self._get_timeout(url)}
+        # Only streamed requests pass the flag, so custom transports without it keep working
+        if stream:
+            options["stream"] = True
+        return options
+
+    def _get_retry_policy(self, idempotent: bool) -> RetryPolicy | None:
+        """Returns the policy retrying a request: the one of the client or, if it has none,
+        the one in effect. None if the request is not idempotent."""
+        if not idempotent:
+            return None
+        return self._retry_policy or get_retry_policy()
+
+    def _retry_delay(
+        self, policy: RetryPolicy, retry: int, response=None, error: Exception = None
+    ) -> float | None:
+        """Returns the seconds to wait before sending a request again, None if the attempt
+        is final because the policy gives up or the wait would overrun the deadline"""
+        delay = policy.get_delay(retry, response=response, error=error)
+        if delay is None or not self._fits_deadline(delay):
+            return None
+        return delay
+
+    @staticmethod
+    def _final_attempt(response: Any, error: Exception | None) -> Any:
+        """Returns the response of the last attempt of a request, or raises its error"""
+        if error is not None:
+            raise error
+        return response
+
+    @contextmanager
+    def _call(
+        self, method: str, url: str, params: dict
+    ) -> Iterator[Tuple[RequestEvent | None, dict]]:
+        """Runs the hooks around a call: before_request when the block starts, then
+        on_error if the block raises, or after_response once it is left in any other way,
+        including when a streaming caller stops early.
+
+        Yields:
+            Tuple[RequestEvent | None, dict]: Event of the call, None if there are no hooks,
+            and the parameters of the request with the credentials
+        """
+        event = self._start_event(method, url)
+        error = None
+        try:
+            yield event, self._build_params(**params)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._finish_event(event, error)
+
+    def _get_cached(
+        self, method: str, url: str, params: dict, event: RequestEvent = None
+    ) -> Any:
+        """Returns the cached response data of a GET request, None if it is not cached"""
+        if self._cache is None or method != "get":
+            return None
+        data = self._cache.get(url, params)
+        if data is not None and event is not None:
+            event.cached = True
+        return data
+
+    def _read_response(
+        self, method: str, url: str, params: dict, response, event: RequestEvent = None
+    ) -> Any:
+        """Decodes a response, storing its data in the cache if it answers a GET request"""
+        data = self._decode_response(response, event)
+        if self._cache is not None and method == "get":
+            self._cache.set(url, params, data)
+        return data
+
+    @staticmethod
+    def _record_stream(event: RequestEvent | None, response, size: int) -> None:
+        """Records the status and size received of a streamed response in the call event,
+        unless the error body was already recorded when it was decoded"""
+        if event is not None and event.response_size is None:
+            event.status_code = response.status_code
+            event.response_size = size
+
+    def _get(
+        self, url: str, params: dict, parser: Parser = None, idempotent: bool = True
+    ) -> Any:
         """Perform a GET request to the API
 
         Args:
             url (str): URL to request data from
             params (dict, optional): Parameters to send in the query string.
+            parser (Parser, optional): Callable that builds the result from the response data.
+            idempotent (bool, optional): Whether the request can be safely retried. Set it to
+                False for GET endpoints with side effects. Defaults to True.
 
         Returns:
-            dict: dict with response data
+            Any: Response data, parsed if a parser is given
         """
-        return self._perform_request("get", url, params)
+        return self._perform_request("get", url, params, parser, idempotent)
 
-    def _post(self, url: str, params: dict) -> dict:
-        """Perform a POST request to the API
+    def _post(self, url: str, params: dict, parser: Parser = None) -> Any:
+        """Perform a POST request to the API. POST requests are never retried.
 
         Args:
             url (str): URL to send the request to
             params (dict, optional): Parameters to send in the request body.
+            parser (Parser, optional): Callable that builds the result from the response data.
 
         Returns:
-            dict: dict with response data
+            Any: Response data, parsed if a parser is given
+        """
+        return self._perform_request("post", url, params, parser)
+
+
+class BaseClient(ClientCore):
+    """Base API Client class"""
+
+    transport_class = Transport
+
+    def _wait_for_rate_limiter(self) -> None:
+        """Waits for the rate limiter, if there is one.
+
+        Raises:
+            DeadlineExceededException: If the wait would overrun the deadline in effect.
+        """
+        delay = self._rate_limiter_delay()
+        if delay:
+            time.sleep(delay)
+
+    def _send(self, method: str, url: str, params: dict, stream: bool = False) -> Any:
+        """Sends a request through the rate limiter and the transport.
+
+        Args:
+            method (str): Request method. Valid values are get, post, put, delete.
+            url (str): URL to request.
+            params (dict): Parameters to send in the request.
+            stream (bool, optional): Return before the body is read. Defaults to False.
+
+        Returns:
+            Any: Response returned by the transport
+        """
+        self._wait_for_rate_limiter()
+        options = self._request_options(url, stream)
+        start = time.monotonic()
+        try:
+            response = self._transport.request(method, url, params, **options)
+        except Exception:
+            self._record_outcome(start)
+            raise
+        self._record_outcome(start, response)
+        return response
+
+    def _attempt(
+        self, method: str, url: str, params: dict, stream: bool
+    ) -> Tuple[Any, Exception | None]:
+        """Sends a request, returning its response, or the error it raised"""
+        try:
+            return self._send(method, url, params, stream), None
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return None, error
+
+    @staticmethod
+    def _discard(response: Any, stream: bool) -> None:
+        """Releases the connection of a streamed response that is retried"""
+        if stream and response is not None:
+            response.close()
+
+    def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        idempotent: bool,
+        stream: bool = False,
+    ) -> Any:
+        """Sends a request, retrying it on transient errors if it is idempotent, with the
+        retry policy of the client or, if it has none, the one in effect.
+
+        Args:
+            method (str): Request method. Valid values are get, post, put, delete.
+            url (str): URL to request.
+            params (dict): Parameters to send in the request.
+            idempotent (bool): Whether the request can be safely sent more than once.
+            stream (bool, optional): Return before the body is read. Defaults to False.
+
+        Returns:
+            Any: Response returned by the transport
+        """
+        policy = self._get_retry_policy(idempotent)
+        if policy is None:
+            return self._send(method, url, params, stream)
+
+        policy.record_request()
+        retry = 0
+        while True:
+            response, error = self._attempt(method, url, params, stream)
+            delay = self._retry_delay(policy, retry, response, error)
+            if delay is None:
+                return self._final_attempt(response, error)
+            self._discard(response, stream)
+            time.sleep(delay)
+            retry += 1
+
+    def _perform_request(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        parser: Parser = None,
+        idempotent: bool = False,
+    ) -> Any:
+        """Perform a request to the API.
+
+        Args:
+            method (str): Request method. Valid values are get, post, put, delete.
+            url (str): URL to request.
+            params (dict): Parameters to send in the request.
+            parser (Parser, optional): Callable that builds the result from the response data.
+                Defaults to None.
+            idempotent (bool, optional): Whether the request can be safely retried.
+                Defaults to False.
+
+        Returns:
+            Any: Response data, parsed if a parser is given
+        """
+        with self._call(method, url, params) as (event, request_params):
+            data = self._get_cached(method, url, request_params, event)
+            if data is None:
+                response = self._send_with_retries(
+                    method, url, request_params, idempotent
+                )
+                data = self._read_response(method, url, request_params, response, event)
+            return self._parse(data, parser, event)
+
+    def _stream_items(
+        self, url: str, params: dict, chunk_size: int = 65536
+    ) -> Iterator[Tuple[str, Any]]:
+        """Performs a GET request and yields the members of the response object as they are
+        received, without holding the whole body in memory. Streamed responses are not cached.
+
+        Args:
+            url (str): URL to request data from
+            params (dict): Parameters to send in the query string.
+            chunk_size (int, optional): Bytes read from the response at a time.
+                Defaults to 65536.
+
+        Yields:
+            Tuple[str, Any]: (key, value) pairs of the response object, in order
         """
-        return self._perform_request("post", url, params)
+        with self._call("get", url, params) as (event, request_params):
+            response = self._send_with_retries(
+                "get", url, request_params, True, stream=True
+            )
+            size = 0
+            try:
+                if response.status_code >= 400:
+                    self._decode_response(response, event)
+                parser = ObjectItemParser()
+                for chunk in response.iter_content(chunk_size):
+                    size += len(chunk)
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+            finally:
+                response.close()
+                self._record_stream(event, response, size)
@@ -0,0 +1,168 @@
+"""Bulk customer submissions"""
+
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple
+
+from ..models.customer import BaseCustomer
+
+
+class SubmitResult(NamedTuple):
+    """Represents the outcome of one customer of a bulk sign-up or modify"""
+
+    customer: BaseCustomer
+    customer_id: Any = None
+    error: Exception = None
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """The customer was submitted successfully, in this run or a previous one"""
+        return self.error is None
+
+
+class Checkpoint:
+    """Append-only log of a bulk submission, to resume it after an interruption.
+
+    Each line is a JSON object with the key of a customer (the username for sign-ups, the ID
+    for modifies) and either "submitted", written before its request is sent, or the
+    "customer_id" it got once the request succeeds. Keys with a customer ID are skipped when
+    the submission is run again. Keys submitted without a result may or may not have reached
+    the API, so sign-ups look them up before signing them up again.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Checkpoint constructor.
+
+        Args:
+            path (str | PathLike): File of the checkpoint. Created if it does not exist, and
+                read to resume the submission if it does.
+        """
+        self.path = path
+        self._completed: Dict[str, Any] = {}
+        self._submitted = set()
+        if os.path.exists(path):
+            self._load()
+        # pylint: disable-next=consider-using-with
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().split("\n")
+        # The last line is empty unless it was cut short by the interruption
+        if lines[-1]:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n")
+        for line in lines[:-1]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Line cut short by the interruption
+                continue
+            if "customer_id" in entry:
+                self._completed[entry["key"]] = entry["customer_id"]
+            else:
+                self._submitted.add(entry["key"])
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the checkpoint file"""
+        self._file.close()
+
+    def completed(self, key: Any) -> Any:
+        """Returns the customer ID recorded for a key, or None"""
+        return self._completed.get(str(key))
+
+    def interrupted(self, key: Any) -> bool:
+        """Returns whether a key was submitted without recording its result"""
+        key = str(key)
+        return key in self._submitted and key not in self._completed
+
+    def _write(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def submitted(self, key: Any) -> None:
+        """Records a key whose request is about to be sent"""
+        self._submitted.add(str(key))
+        self._write({"key": str(key), "submitted": True})
+
+    def done(self, key: Any, customer_id: Any) -> None:
+        """Records the customer ID of a key whose request succeeded"""
+        self._completed[str(key)] = customer_id
+        self._write({"key": str(key), "customer_id": customer_id})
+
+
+class SubmitJob(NamedTuple):
+    """A customer of a bulk sign-up or modify that needs a request"""
+
+    customer: BaseCustomer
+    key: Any
+    # The customer was submitted by an interrupted run, so it may already be signed up
+    recover: bool = False
+
+
+class BulkSubmission:
+    """Requests in flight of a bulk sign-up or modify, and its checkpoint.
+
+    `run` starts the requests with a function of the client, which waits for at least one
+    request to finish whenever `run` yields None, and passes the finished requests to
+    `finish`.
+    """
+
+    def __init__(self, checkpoint: str | os.PathLike | None, max_workers: int) -> None:
+        """Bulk submission constructor.
+
+        Args:
+            checkpoint (str | PathLike | None): File recording the progress, or None.
+            max_workers (int): Maximum number of requests in flight.
+        """
+        self.log = None if checkpoint is None else Checkpoint(checkpoint)
+        self.max_workers = max_workers
+        self.in_flight: Dict[Any, SubmitJob] = {}
+
+    def close(self) -> None:
+        """Close the checkpoint file, if there is one"""
+        if self.log is not None:
+            self.log.close()
+
+    def run(
+        self,
+        jobs: Iterable[SubmitResult | SubmitJob],
+        start: Callable[[SubmitJob], Any],
+    ) -> Iterator[SubmitResult | None]:
+        """Starts the request of each job with `start`, which returns its future or task,
+        after recording it in the checkpoint. Yields the results, which need no request, and
+        None whenever `max_workers` requests are in flight or, once every job is started,
+        until no request is left.
+        """
+        for job in jobs:
+            if isinstance(job, SubmitResult):
+                yield job
+                continue
+            if self.log is not None:
+                self.log.submitted(job.key)
+            self.in_flight[start(job)] = job
+            if len(self.in_flight) >= self.max_workers:
+                yield None
+        while self.in_flight:
+            yield None
+
+    def finish(self, done: Iterable) -> Iterator[SubmitResult]:
+        """Yields the result of the finished futures or tasks, recording them in the
+        checkpoint"""
+        for future in done:
+            job = self.in_flight.pop(future)
+            try:
+                customer_id = future.result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                yield SubmitResult(job.customer, error=error)
+                continue
+            if self.log is not None:
+                self.log.done(job.key, customer_id)
+            yield SubmitResult(job.customer, customer_id)
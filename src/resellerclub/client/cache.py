@@ -0,0 +1,140 @@
+"""Response cache"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    """Response cache counters"""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of API responses with a TTL per endpoint.
+
+    Only endpoints listed in `ttls` are cached. Endpoints are matched by the end of their URL, so
+    "domains/available.json" matches the live and test availability check URLs.
+    """
+
+    default_ttls = {
+        "domains/available.json": 30,
+        "domains/idn-available.json": 30,
+        "domains/thirdlevelname/available.json": 30,
+        "domains/premium/available.json": 600,
+        "domains/v5/suggest-names.json": 600,
+    }
+
+    # Parameters left out of the cache key
+    ignored_params = ("api-key",)
+
+    def __init__(self, max_size: int = 1024, ttls: Dict[str, float] = None) -> None:
+        """Response cache constructor.
+
+        Args:
+            max_size (int, optional): Maximum number of cached responses. The least recently
+                used response is evicted when the cache is full. Defaults to 1024.
+            ttls (Dict[str, float], optional): Seconds each endpoint response is kept, by
+                endpoint path. Defaults to `default_ttls`.
+        """
+        self.max_size = max_size
+        self.ttls = dict(self.default_ttls if ttls is None else ttls)
+        # Longest paths first so "domains/premium/available.json" wins over shorter matches
+        self._ttl_paths = sorted(self.ttls, key=len, reverse=True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, url: str) -> float | None:
+        """Returns the TTL for an endpoint URL, None if the endpoint is not cached"""
+        for path in self._ttl_paths:
+            if url.endswith(f"/{path}"):
+                return self.ttls[path]
+        return None
+
+    def make_key(self, url: str, params: dict) -> tuple:
+        """Builds a cache key that ignores the order of parameters and of list values.
+
+        Args:
+            url (str): Endpoint URL
+            params (dict): Request parameters
+
+        Returns:
+            tuple: Hashable cache key
+        """
+        items = []
+        for name, value in params.items():
+            if value is None or name in self.ignored_params:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = tuple(sorted(value))
+            items.append((name, value))
+        return (url, tuple(sorted(items)))
+
+    def get(self, url: str, params: dict, default: Any = None) -> Any:
+        """Returns the cached response for a request.
+
+        Args:
+            url (str): Endpoint URL
+            params (dict): Request parameters
+            default (Any, optional): Value returned on a cache miss. Defaults to None.
+
+        Returns:
+            Any: Cached response data or `default`
+        """
+        if self.get_ttl(url) is None:
+            return default
+
+        key = self.make_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, url: str, params: dict, data: Any) -> None:
+        """Stores the response of a request if its endpoint is cached.
+
+        Args:
+            url (str): Endpoint URL
+            params (dict): Request parameters
+            data (Any): Response data
+        """
+        ttl = self.get_ttl(url)
+        if ttl is None:
+            return
+
+        key = self.make_key(url, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Removes all the cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the cache counters"""
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries)
+            )
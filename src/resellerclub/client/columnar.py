@@ -0,0 +1,191 @@
+"""Columnar containers for bulk API results"""
+
+from array import array
+from itertools import compress
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+from ..models.customer import Customer
+
+# Keys of a search response that describe the page instead of a customer
+SEARCH_META_KEYS = ("recsonpage", "recsindb")
+
+
+class CustomerColumns:
+    """Customer search results stored column by column.
+
+    Every field is kept in one list, or one `array` for numeric fields, filled straight from
+    the search payload. Filters and aggregations work on whole columns, and Customer objects
+    are only built for the rows that are indexed or iterated.
+    """
+
+    # Column name: (search response key, array typecode or None for a list)
+    fields = {
+        "id": ("customer.customerid", None),
+        "username": ("customer.username", None),
+        "reseller_id": ("customer.resellerid", None),
+        "name": ("customer.name", None),
+        "company": ("customer.company", None),
+        "city": ("customer.city", None),
+        "country": ("customer.country", None),
+        "phone_country_code": ("customer.telnocc", None),
+        "phone": ("customer.telno", None),
+        "total_receipts": ("customer.totalreceipts", "d"),
+        "website_count": ("customer.websitecount", "q"),
+        "status": ("customer.customerstatus", None),
+    }
+
+    def __init__(
+        self,
+        columns: Dict[str, Sequence] = None,
+        page_records: int = None,
+        db_records: int = None,
+    ) -> None:
+        """Customer columns constructor.
+
+        Args:
+            columns (Dict[str, Sequence], optional): Values of each column in `fields`, all of
+                the same length. Defaults to empty columns.
+            page_records (int, optional): Number of records in the fetched page(s).
+            db_records (int, optional): Number of records matching the search.
+        """
+        self.columns = {
+            name: self._new_column(name, () if columns is None else columns[name])
+            for name in self.fields
+        }
+        self.page_records = page_records
+        self.db_records = db_records
+
+    @classmethod
+    def _new_column(cls, name: str, values: Iterable) -> Sequence:
+        typecode = cls.fields[name][1]
+        return list(values) if typecode is None else array(typecode, values)
+
+    @classmethod
+    def from_search(cls, data: dict) -> "CustomerColumns":
+        """Builds the columns from a customer search response"""
+        rows = [value for key, value in data.items() if key not in SEARCH_META_KEYS]
+        columns = {}
+        for name, (key, typecode) in cls.fields.items():
+            values = map(itemgetter(key), rows)
+            if typecode == "d":
+                values = map(float, values)
+            elif typecode == "q":
+                values = map(int, values)
+            columns[name] = values
+        return cls(columns, int(data["recsonpage"]), int(data["recsindb"]))
+
+    @classmethod
+    def concat(cls, parts: Iterable["CustomerColumns"]) -> "CustomerColumns":
+        """Joins the rows of several column sets, e.g. the pages of a search, in order"""
+        result = cls()
+        for part in parts:
+            result.extend(part)
+        return result
+
+    def extend(self, other: "CustomerColumns") -> None:
+        """Appends the rows of another column set"""
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+        self.page_records = (self.page_records or 0) + (other.page_records or 0)
+        if other.db_records is not None:
+            self.db_records = other.db_records
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} customers>"
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Returns the values of one row, by column name"""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def __getitem__(self, index: int | slice) -> "Customer | CustomerColumns":
+        if isinstance(index, slice):
+            columns = {name: column[index] for name, column in self.columns.items()}
+            return self.__class__(columns, db_records=self.db_records)
+
+        return self.build_customer(self.row(index))
+
+    @staticmethod
+    def build_customer(row: Dict[str, Any]) -> Customer:
+        """Builds a Customer from the values of one row, by column name"""
+        return Customer(
+            _id=row["id"],
+            username=row["username"],
+            reseller_id=row["reseller_id"],
+            name=row["name"],
+            company=row["company"],
+            # line1, city, state, country, zip_code
+            address=(None, row["city"], None, row["country"], None),
+            total_receipts=row["total_receipts"],
+            phones=(row["phone_country_code"], row["phone"]),
+            status=row["status"],
+            website_count=row["website_count"],
+        )
+
+    def __iter__(self) -> Iterator[Customer]:
+        return (self[index] for index in range(len(self)))
+
+    def mask(self, name: str, predicate: Callable[[Any], bool]) -> List[bool]:
+        """Evaluates a predicate on every value of a column.
+
+        Args:
+            name (str): Column name.
+            predicate (Callable[[Any], bool]): Function called with each value.
+
+        Returns:
+            List[bool]: One flag per row, to be given to `filter`
+        """
+        return [bool(predicate(value)) for value in self.columns[name]]
+
+    def filter(self, mask: Sequence[bool]) -> "CustomerColumns":
+        """Returns the rows whose flag in `mask` is true, as a new column set"""
+        if len(mask) != len(self):
+            raise ValueError(f"Mask has {len(mask)} values, expected {len(self)}")
+        columns = {
+            name: compress(column, mask) for name, column in self.columns.items()
+        }
+        return self.__class__(columns, db_records=self.db_records)
+
+    def group_sum(self, by: str, name: str) -> Dict[Any, float]:
+        """Sums a numeric column for each value of another column.
+
+        Args:
+            by (str): Column to group the rows by, e.g. "status".
+            name (str): Numeric column to sum, e.g. "total_receipts".
+
+        Returns:
+            Dict[Any, float]: Sum of `name` for each value of `by`
+        """
+        sums = {}
+        for key, value in zip(self.columns[by], self.columns[name]):
+            sums[key] = sums.get(key, 0) + value
+        return sums
+
+    def to_pandas(self):
+        """Returns the columns as a pandas DataFrame. Requires pandas."""
+        try:
+            import pandas  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError(
+                "CustomerColumns.to_pandas requires pandas. "
+                "Install it with: pip install resellerclub-python[pandas]"
+            ) from error
+        return pandas.DataFrame(
+            {name: list(column) for name, column in self.columns.items()}
+        )
+
+    def to_arrow(self):
+        """Returns the columns as a pyarrow Table. Requires pyarrow."""
+        try:
+            import pyarrow  # pylint: disable=import-outside-toplevel
+        except ImportError as error:
+            raise ImportError(
+                "CustomerColumns.to_arrow requires pyarrow. "
+                "Install it with: pip install resellerclub-python[arrow]"
+            ) from error
+        return pyarrow.table(
+            {name: list(column) for name, column in self.columns.items()}
+        )
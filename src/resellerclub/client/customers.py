@@ -1,10 +1,34 @@
 """Customers API Client"""
 
-from datetime import datetime
-from typing import Iterator, List, Literal, NamedTuple
+import math
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import chain, islice
+from datetime import datetime, timedelta
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Tuple,
+)
 
+from ..exceptions import DeadlineExceededException, ResellerClubAPIException
 from ..models.customer import Customer, NewCustomer
-from .base import BaseClient
+from ..models.customer import validate as validate_customer
+from .base import BaseClient, ClientCore
+from .bulk import BulkSubmission, Checkpoint, SubmitJob, SubmitResult
+from .columnar import CustomerColumns
+from .retry import RetryPolicy, retry_scope
+from .snapshot import CustomerSnapshot
+from .sync import RangeSearch, SyncChange, SyncState, Window, probe_outcome
+from .timeouts import Deadline, resolve_deadline, run_within
 
 
 class SearchResponse(NamedTuple):
@@ -21,10 +45,333 @@ class SearchResponse(NamedTuple):
         return self.customers.__iter__()
 
 
-class CustomersClient(BaseClient):
-    """Customers API Client"""
+def parse_search(data: dict) -> SearchResponse:
+    """Builds a SearchResponse from a customer search response"""
+    customers = [
+        Customer.from_search(value)
+        for key, value in data.items()
+        if key not in ("recsonpage", "recsindb")
+    ]
+    return SearchResponse(int(data["recsonpage"]), int(data["recsindb"]), customers)
+
+
+def count_pages(db_records: int, records: int) -> int:
+    """Returns the number of pages of `records` customers needed to fetch `db_records`"""
+    return math.ceil(db_records / records)
+
+
+def remaining_pages(
+    first_page: SearchResponse | CustomerColumns, records: int
+) -> range:
+    """Returns the numbers of the pages that follow the first page of a search"""
+    return range(2, count_pages(first_page.db_records, records) + 1)
+
+
+class PageQueue:
+    """Pages of a search being fetched, started in page order with at most `max_workers` in
+    flight. `fetch` starts fetching a page and returns its future or task."""
+
+    def __init__(
+        self, fetch: Callable[[int], Any], pages: Iterable[int], max_workers: int
+    ) -> None:
+        self._fetch = fetch
+        self._pages = iter(pages)
+        self.pending = deque(fetch(page) for page in islice(self._pages, max_workers))
+
+    def take(self, done: Iterable) -> list:
+        """Removes the finished pages from the queue, starting the fetch of a new page for
+        each, and returns them"""
+        done = list(done)
+        self.pending = deque(f for f in self.pending if f not in done)
+        for _ in done:
+            page = next(self._pages, None)
+            if page is not None:
+                self.pending.append(self._fetch(page))
+        return done
+
+
+# Largest page the search endpoint returns
+MAX_SEARCH_RECORDS = 500
+
+
+class BulkCustomers(NamedTuple):
+    """Represents the result of a batch customer lookup"""
+
+    customers: Dict[Any, Customer]
+    errors: Dict[Any, Exception]
+
+    def __len__(self) -> int:
+        return len(self.customers)
+
+    def __iter__(self) -> Iterator:
+        return self.customers.values().__iter__()
+
+
+def merge_lookups(keys: list, results: list) -> BulkCustomers:
+    """Builds a BulkCustomers from the result, or raised exception, of each lookup"""
+    customers, errors = {}, {}
+    for key, result in zip(keys, results):
+        if isinstance(result, Exception):
+            errors[key] = result
+        else:
+            customers[key] = result
+    return BulkCustomers(customers, errors)
+
+
+def merge_search_batches(batches: List[list], results: list) -> BulkCustomers:
+    """Builds a BulkCustomers from the search response, or raised exception, of each batch of
+    customer IDs. IDs missing from their search response are reported as errors."""
+    customers, errors = {}, {}
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            errors.update(dict.fromkeys(batch, result))
+            continue
+        found = {customer.id: customer for customer in result}
+        for customer_id in batch:
+            customer = found.get(str(customer_id))
+            if customer is None:
+                errors[customer_id] = ResellerClubAPIException(
+                    f"Customer not found: {customer_id}"
+                )
+            else:
+                customers[customer_id] = customer
+    return BulkCustomers(customers, errors)
+
+
+def build_search_params(
+    records: int,
+    page: int,
+    customers: List[str] | str = None,
+    resellers: List[str] | str = None,
+    username: str = None,
+    name: str = None,
+    company: str = None,
+    city: str = None,
+    state: str = None,
+    status: Literal["Active", "Suspended", "Deleted"] = None,
+    creation_date_start: datetime = None,
+    creation_date_end: datetime = None,
+    total_receipt_start: float = None,
+    total_receipt_end: float = None,
+) -> dict:
+    """Builds the query parameters of a customer search. See `CustomersClient.search`"""
+    if isinstance(customers, str):
+        customers = [customers]
+    if isinstance(resellers, str):
+        resellers = [resellers]
+    if creation_date_start:
+        creation_date_start = creation_date_start.timestamp()
+    if creation_date_end:
+        creation_date_end = creation_date_end.timestamp()
 
-    def sign_up(self, customer: NewCustomer) -> int:
+    return {
+        "no-of-records": records,
+        "page-no": page,
+        "customer-id": customers,
+        "reseller-id": resellers,
+        "username": username,
+        "name": name,
+        "company": company,
+        "city": city,
+        "state": state,
+        "status": status,
+        "creation-date-start": creation_date_start,
+        "creation-date-end": creation_date_end,
+        "total-receipt-start": total_receipt_start,
+        "total-receipt-end": total_receipt_end,
+    }
+
+
+def sign_up_params(customer: NewCustomer) -> dict:
+    """Returns the sign up request parameters of a new customer"""
+    return {
+        "username": customer.username,
+        "passwd": customer.password,
+        "name": customer.name,
+        "company": customer.company,
+        "address-line-1": customer.address.line1,
+        "city": customer.address.city,
+        "state": customer.address.state,
+        "other-state": customer.address.other_state,
+        "country": customer.address.country,
+        "zipcode": customer.address.zip_code,
+        "phone-cc": customer.phones.phone_country_code,
+        "phone": customer.phones.phone,
+        "lang-pref": customer.language_code,
+        "address-line-2": customer.address.line2,
+        "address-line-3": customer.address.line3,
+        "alt-phone-cc": customer.phones.alt_phone_country_code,
+        "alt-phone": customer.phones.alt_phone,
+        "mobile-cc": customer.phones.mobile_country_code,
+        "mobile": customer.phones.mobile,
+        "sms-consent": customer.sms_consent,
+        "vat-id": customer.vat_number,
+        "accept-policy": customer.accept_policy,
+        "marketing-email-consent": customer.marketing_consent,
+    }
+
+
+def modify_params(customer: Customer) -> dict:
+    """Returns the modify request parameters of a customer"""
+    return {
+        "customer-id": customer.id,
+        "username": customer.username,
+        "name": customer.name,
+        "company": customer.company,
+        "address-line-1": customer.address.line1,
+        "address-line-2": customer.address.line2,
+        "city": customer.address.city,
+        "state": customer.address.state,
+        "other-state": customer.address.other_state,
+        "country": customer.address.country,
+        "zipcode": customer.address.zip_code,
+        "phone-cc": customer.phones.phone_country_code,
+        "phone": customer.phones.phone,
+        "lang-pref": customer.language_preference,
+        "address-line-3": customer.address.line3,
+        "alt-phone-cc": customer.phones.alt_phone_country_code,
+        "alt-phone": customer.phones.alt_phone,
+        "fax-cc": customer.phones.fax_country_code,
+        "fax": customer.phones.fax,
+        "mobile-cc": customer.phones.mobile_country_code,
+        "mobile": customer.phones.mobile,
+    }
+
+
+def check_submission(
+    operation: Literal["sign_up", "modify"], customer, validate: bool = True
+) -> None:
+    """Raises ValueError if a customer cannot be signed up or modified, or ValidationError if
+    its details are invalid, without calling the API. The details are only checked if
+    `validate` is True."""
+    if operation == "sign_up":
+        if customer.id is not None:
+            raise ValueError("Customer ID should be None")
+    elif customer.id is None:
+        raise ValueError("Customer ID should not be None")
+    if validate:
+        validate_customer(customer)
+
+
+def plan_submissions(
+    operation: Literal["sign_up", "modify"],
+    customers: Iterable,
+    log: Checkpoint | None,
+    validate: bool,
+) -> Iterator[SubmitResult | SubmitJob]:
+    """Yields the result of the customers that need no request, and a job for the others,
+    which are already checked"""
+    seen = set()
+    for customer in customers:
+        key = customer.username if operation == "sign_up" else customer.id
+        completed = None if log is None else log.completed(key)
+        if completed is not None:
+            yield SubmitResult(customer, completed, resumed=True)
+            continue
+        if key in seen:
+            error = ValueError(f"Duplicate customer: {key}")
+            yield SubmitResult(customer, error=error)
+            continue
+        try:
+            check_submission(operation, customer, validate)
+        except ValueError as error:
+            yield SubmitResult(customer, error=error)
+            continue
+        seen.add(key)
+        recover = operation == "sign_up" and log is not None and log.interrupted(key)
+        yield SubmitJob(customer, key, recover)
+
+
+def check_recovery_error(error: ResellerClubAPIException) -> None:
+    """Re-raises an error of the lookup of an interrupted sign-up unless it means the
+    customer was not signed up. Only a deadline expiring leaves that unknown."""
+    if isinstance(error, DeadlineExceededException):
+        raise error
+
+
+def submitted_id(operation: Literal["sign_up", "modify"], customer, result: Any) -> Any:
+    """Returns the customer ID from the response of a sign-up or modify request"""
+    if operation == "sign_up":
+        return result
+    if not result:
+        raise ResellerClubAPIException(f"Customer not modified: {customer.id}")
+    return customer.id
+
+
+# Customers created this long before a snapshot are fetched again when refreshing it
+SNAPSHOT_REFRESH_OVERLAP = timedelta(hours=1)
+
+
+class SnapshotRefresh(NamedTuple):
+    """Customers of a snapshot being refreshed, and when the refresh started"""
+
+    path: str | os.PathLike
+    columns: CustomerColumns
+    taken_at: datetime
+    # Search criteria of the customers created since the snapshot
+    filters: dict
+
+    @classmethod
+    def start(cls, path: str | os.PathLike, filters: dict) -> "SnapshotRefresh":
+        """Reads the snapshot to refresh.
+
+        Raises:
+            ValueError: If `filters` has a creation date start, which the snapshot sets.
+        """
+        if "creation_date_start" in filters:
+            raise ValueError(
+                "creation_date_start cannot be given when refreshing a snapshot, customers "
+                "are fetched from the date the snapshot was taken"
+            )
+        with CustomerSnapshot(path) as snapshot:
+            taken_at = datetime.now()
+            since = snapshot.taken_at - SNAPSHOT_REFRESH_OVERLAP
+            columns = snapshot.to_columns()
+        return cls(path, columns, taken_at, {**filters, "creation_date_start": since})
+
+    def finish(self, new: CustomerColumns) -> int:
+        """Writes the snapshot with the new customers, returning their number"""
+        self.columns.extend(new)
+        CustomerSnapshot.write(self.path, self.columns, self.taken_at)
+        return len(new)
+
+
+class SearchStream:
+    """Customer search page parsed while it is being received.
+
+    Iterate it to get the Customers as they arrive. `page_records` and `db_records` are None
+    until the API sends them.
+    """
+
+    def __init__(self, items: Iterator) -> None:
+        self._items = items
+        self.page_records = None
+        self.db_records = None
+
+    def __iter__(self) -> Iterator[Customer]:
+        for key, value in self._items:
+            customer = self._read(key, value)
+            if customer is not None:
+                yield customer
+
+    def _read(self, key: str, value: Any) -> Customer | None:
+        """Reads an item of the page, returning it if it is a Customer"""
+        if key == "recsonpage":
+            self.page_records = int(value)
+        elif key == "recsindb":
+            self.db_records = int(value)
+        else:
+            return Customer.from_search(value)
+        return None
+
+
+class CustomersEndpoints(ClientCore):
+    """Customers API endpoints, shared by the sync and asyncio Customers API Clients"""
+
+    # Signs up or modifies many customers, yielding their results as they finish
+    _bulk_submit: Callable[..., Any]
+
+    def sign_up(self, customer: NewCustomer, validate: bool = True) -> int:
         """
         Registers a new customer.
 
@@ -32,38 +379,18 @@ class CustomersClient(BaseClient):
 
         Args:
             customer (NewCustomer): Customer object with all the required details
+            validate (bool, optional): Check the customer details before calling the API.
+                Defaults to True.
 
         Returns:
             int: The new customer ID.
+
+        Raises:
+            ValidationError: If the customer details are missing or invalid.
         """
-        if customer.id is not None:
-            raise ValueError("Customer ID should be None")
+        check_submission("sign_up", customer, validate)
         url = self._urls.customers.signup
-        params = {
-            "username": customer.username,
-            "passwd": customer.password,
-            "name": customer.name,
-            "company": customer.company,
-            "address-line-1": customer.address.line1,
-            "city": customer.address.city,
-            "state": customer.address.state,
-            "other-state": customer.address.other_state,
-            "country": customer.address.country,
-            "zipcode": customer.address.zip_code,
-            "phone-cc": customer.phones.phone_country_code,
-            "phone": customer.phones.phone,
-            "lang-pref": customer.language_code,
-            "address-line-2": customer.address.line2,
-            "address-line-3": customer.address.line3,
-            "alt-phone-cc": customer.phones.alt_phone_country_code,
-            "alt-phone": customer.phones.alt_phone,
-            "mobile-cc": customer.phones.mobile_country_code,
-            "mobile": customer.phones.mobile,
-            "sms-consent": customer.sms_consent,
-            "vat-id": customer.vat_number,
-            "accept-policy": customer.accept_policy,
-            "marketing-email-consent": customer.marketing_consent,
-        }
+        params = sign_up_params(customer)
         return self._post(url, params)
 
     def get_by_username(self, username: str) -> Customer:
@@ -79,8 +406,7 @@ class CustomersClient(BaseClient):
 
         url = self._urls.customers.details_by_username
         params = {"username": username}
-        data = self._get(url, params)
-        return Customer.from_details(data)
+        return self._get(url, params, Customer.from_details)
 
     def get_by_id(self, customer_id: int) -> Customer:
         """
@@ -94,8 +420,48 @@ class CustomersClient(BaseClient):
         """
         url = self._urls.customers.details_by_id
         params = {"customer-id": customer_id}
-        data = self._get(url, params)
-        return Customer.from_details(data)
+        return self._get(url, params, Customer.from_details)
+
+    @staticmethod
+    def _batch_ids(customer_ids: list, batch_size: int) -> List[list]:
+        if not 1 <= batch_size <= MAX_SEARCH_RECORDS:
+            raise ValueError(f"batch_size must be between 1 and {MAX_SEARCH_RECORDS}")
+        return [
+            customer_ids[i : i + batch_size]
+            for i in range(0, len(customer_ids), batch_size)
+        ]
+
+    def _search_by_ids(self, customer_ids: list) -> SearchResponse:
+        """Searches a batch of customers by ID, on a single page"""
+        records = max(10, len(customer_ids))
+        return self.search(records, 1, customers=[str(i) for i in customer_ids])
+
+    def _plan_get_many_by_id(
+        self, customer_ids: list, details: bool, batch_size: int
+    ) -> Tuple[Callable, list, Callable[[list], BulkCustomers]]:
+        """Returns the lookup to call on each item of `get_many_by_id`, the items, and the
+        function merging the results of the lookups"""
+        customer_ids = list(dict.fromkeys(customer_ids))
+        if details:
+            return self.get_by_id, customer_ids, partial(merge_lookups, customer_ids)
+        batches = self._batch_ids(customer_ids, batch_size)
+        return self._search_by_ids, batches, partial(merge_search_batches, batches)
+
+    def _plan_get_many_by_username(
+        self, usernames: list
+    ) -> Tuple[Callable, list, Callable[[list], BulkCustomers]]:
+        """Like `_plan_get_many_by_id`, for `get_many_by_username`"""
+        usernames = list(dict.fromkeys(usernames))
+        return self.get_by_username, usernames, partial(merge_lookups, usernames)
+
+    def _page_retry_policy(
+        self, retry_policy: RetryPolicy | None
+    ) -> RetryPolicy | None:
+        """Returns the policy retrying each page of an export, None if the client retries
+        them with its own"""
+        if self._retry_policy is not None:
+            return None
+        return retry_policy or RetryPolicy()
 
     def search(
         self,
@@ -143,80 +509,131 @@ class CustomersClient(BaseClient):
             SearchResponse[Customer]: Object containing Customer objects for each client matching
             search criteria
         """
-
-        if isinstance(customers, str):
-            customers = [customers]
-        if isinstance(resellers, str):
-            resellers = [resellers]
-        if creation_date_start:
-            creation_date_start = creation_date_start.timestamp()
-        if creation_date_end:
-            creation_date_end = creation_date_end.timestamp()
-
         url = self._urls.customers.search
-        params = {
-            "no-of-records": records,
-            "page-no": page,
-            "customer-id": customers,
-            "reseller-id": resellers,
-            "username": username,
-            "name": name,
-            "company": company,
-            "city": city,
-            "state": state,
-            "status": status,
-            "creation-date-start": creation_date_start,
-            "creation-date-end": creation_date_end,
-            "total-receipt-start": total_receipt_start,
-            "total-receipt-end": total_receipt_end,
-        }
-        data = self._get(url, params)
+        params = build_search_params(
+            records,
+            page,
+            customers=customers,
+            resellers=resellers,
+            username=username,
+            name=name,
+            company=company,
+            city=city,
+            state=state,
+            status=status,
+            creation_date_start=creation_date_start,
+            creation_date_end=creation_date_end,
+            total_receipt_start=total_receipt_start,
+            total_receipt_end=total_receipt_end,
+        )
+        return self._get(url, params, parse_search)
 
-        recsonpage = int(data.pop("recsonpage"))
-        recsindb = int(data.pop("recsindb"))
-        customers = []
-        for value in data.values():
-            customers.append(Customer.from_search(value))
+    def search_columns(self, records: int, page: int, **filters) -> CustomerColumns:
+        """Gets the Customers that match the search criteria as columns, without building a
+        Customer object per record. Takes the same arguments as `search`.
 
-        return SearchResponse(recsonpage, recsindb, customers)
+        Args:
+            records (int): Number of records to be fetched.
+            page (int): Page number for which details are to be fetched
+
+        Returns:
+            CustomerColumns: Fields of the Customers matching the search criteria, by column
+        """
+        url = self._urls.customers.search
+        params = build_search_params(records, page, **filters)
+        return self._get(url, params, CustomerColumns.from_search)
 
-    def modify(self, customer: Customer) -> bool:
+    def modify(self, customer: Customer, validate: bool = True) -> bool:
         """
         Modify customer details.
 
         Args:
             customer (Customer): The customer object with the modified details.
+            validate (bool, optional): Check the customer details before calling the API.
+                Defaults to True.
 
         Returns:
             bool: True if the customer details are modified successfully, False otherwise.
+
+        Raises:
+            ValidationError: If the customer details are missing or invalid.
         """
+        check_submission("modify", customer, validate)
         url = self._urls.customers.modify
-        if customer.id is None:
-            raise ValueError("Customer ID should not be None")
-        params = {
-            "customer-id": customer.id,
-            "username": customer.username,
-            "name": customer.name,
-            "company": customer.company,
-            "address-line-1": customer.address.line1,
-            "address-line-2": customer.address.line2,
-            "city": customer.address.city,
-            "state": customer.address.state,
-            "other-state": customer.address.other_state,
-            "country": customer.address.country,
-            "zipcode": customer.address.zip_code,
-            "phone-cc": customer.phones.phone_country_code,
-            "phone": customer.phones.phone,
-            "lang-pref": customer.language_preference,
-            "address-line-3": customer.address.line3,
-            "alt-phone-cc": customer.phones.alt_phone_country_code,
-            "alt-phone": customer.phones.alt_phone,
-            "fax-cc": customer.phones.fax_country_code,
-            "fax": customer.phones.fax,
-            "mobile-cc": customer.phones.mobile_country_code,
-            "mobile": customer.phones.mobile,
-        }
-        return bool(self._post(url, params))
+        params = modify_params(customer)
+        return self._post(url, params, bool)
+
+    def _submit_request(self, operation: Literal["sign_up", "modify"], customer) -> Any:
+        """Signs up or modifies an already checked customer"""
+        if operation == "sign_up":
+            return self.sign_up(customer, validate=False)
+        return self.modify(customer, validate=False)
+
+    def bulk_sign_up(
+        self,
+        customers: Iterable[NewCustomer],
+        max_workers: int = 8,
+        checkpoint: str | os.PathLike = None,
+        deadline: float = None,
+        validate: bool = True,
+    ) -> Iterator[SubmitResult]:
+        """Registers many new customers, with at most `max_workers` requests in flight.
+
+        Each customer is validated locally before its request is sent, and the customers are
+        read from `customers` as requests finish, so the input may be a lazy iterable of any
+        size. Results are yielded in the order the requests finish.
+
+        With a `checkpoint` file, an interrupted sign-up can be run again with the same input
+        and file: customers already signed up are yielded as resumed without a request, and
+        customers whose request was in flight are looked up by username before being signed
+        up again, so no customer is registered twice.
+
+        Args:
+            customers (Iterable[NewCustomer]): Customers to register.
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            checkpoint (str | PathLike, optional): File recording the progress, to resume
+                the sign-up. Defaults to None.
+            deadline (float, optional): Seconds the whole sign-up may take. Defaults to the
+                deadline in effect.
+            validate (bool, optional): Check the details of each customer before sending
+                its request. Defaults to True.
+
+        Yields:
+            SubmitResult: The new customer ID or the error of each customer
+        """
+        return self._bulk_submit(
+            "sign_up", customers, max_workers, checkpoint, deadline, validate
+        )
+
+    def bulk_modify(
+        self,
+        customers: Iterable[Customer],
+        max_workers: int = 8,
+        checkpoint: str | os.PathLike = None,
+        deadline: float = None,
+        validate: bool = True,
+    ) -> Iterator[SubmitResult]:
+        """Modifies many customers, with at most `max_workers` requests in flight.
+
+        Works like `bulk_sign_up`. Customers recorded as modified in the `checkpoint` file are
+        not modified again.
+
+        Args:
+            customers (Iterable[Customer]): Customers with the modified details.
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 8.
+            checkpoint (str | PathLike, optional): File recording the progress, to resume
+                the modification. Defaults to None.
+            deadline (float, optional): Seconds the whole modification may take. Defaults to
+                the deadline in effect.
+            validate (bool, optional): Check the details of each customer before sending
+                its request. Defaults to True.
+
+        Yields:
+            SubmitResult: The customer ID or the error of each customer
+        """
+        return self._bulk_submit(
+            "modify", customers, max_workers, checkpoint, deadline, validate
+        )
 
     def generate_token(self, username: str, password: str, ip_address: str) -> str:
         """
@@ -278,7 +695,7 @@ class CustomersClient(BaseClient):
         """
         url = self._urls.customers.authenticate_token
         params = {"token": token}
-        return Customer.from_auth(self._get(url, params))
+        return self._get(url, params, Customer.from_auth)
 
     def change_password(self, customer_id: int, new_password: str) -> bool:
         """Changes the password for the specified Customer.
@@ -299,7 +716,7 @@ class CustomersClient(BaseClient):
             "customer-id": customer_id,
             "new-passwd": new_password,
         }
-        return bool(self._post(url, params))
+        return self._post(url, params, bool)
 
     def forgot_password(self, username: str) -> bool:
         """Generates a forgot password email and sends it to the customer's email address.
@@ -314,7 +731,8 @@ class CustomersClient(BaseClient):
         """
         url = self._urls.customers.forgot_password
         params = {"username": username}
-        return bool(self._get(url, params))
+        # Not idempotent: every request sends an email
+        return self._get(url, params, bool, idempotent=False)
 
     def delete(self, customer_id: int) -> bool:
         """Deletes the specified customer.
@@ -329,4 +747,455 @@ class CustomersClient(BaseClient):
         """
         url = self._urls.customers.delete
         params = {"customer-id": customer_id}
-        return bool(self._post(url, params))
+        return self._post(url, params, bool)
+
+
+class CustomersClient(CustomersEndpoints, BaseClient):
+    """Customers API Client"""
+
+    def _run_concurrently(
+        self, func: Callable, items: list, max_workers: int, limit: Deadline | None
+    ) -> list:
+        """Calls `func` on every item concurrently.
+
+        Returns:
+            list: Result of each call, or the exception it raised, in item order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_within, limit, func, i) for i in items]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                results.append(error)
+        return results
+
+    def get_many_by_id(
+        self,
+        customer_ids: list,
+        details: bool = False,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        deadline: float = None,
+    ) -> BulkCustomers:
+        """Retrieves many customers by ID.
+
+        By default the customers are fetched with searches of up to `batch_size` IDs each, which
+        return the fields of `search`. With `details`, each customer is fetched from the details
+        endpoint instead, which returns every field. Requests are sent concurrently.
+
+        Args:
+            customer_ids (list): IDs of the customers. Duplicates are fetched once.
+            details (bool, optional): Fetch every field from the details endpoint.
+                Defaults to False.
+            batch_size (int, optional): Maximum number of IDs per search, up to 500.
+                Defaults to 100.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            deadline (float, optional): Seconds the whole lookup may take. Defaults to the
+                deadline in effect.
+
+        Returns:
+            BulkCustomers: Customers found and errors, by requested ID
+        """
+        lookup, items, merge = self._plan_get_many_by_id(
+            customer_ids, details, batch_size
+        )
+        limit = resolve_deadline(deadline)
+        return merge(self._run_concurrently(lookup, items, max_workers, limit))
+
+    def get_many_by_username(
+        self, usernames: list, max_workers: int = 8, deadline: float = None
+    ) -> BulkCustomers:
+        """Retrieves many customers by username.
+
+        The search endpoint filters by a single username, so each customer is fetched from the
+        details endpoint, concurrently.
+
+        Args:
+            usernames (list): Usernames of the customers. Duplicates are fetched once.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            deadline (float, optional): Seconds the whole lookup may take. Defaults to the
+                deadline in effect.
+
+        Returns:
+            BulkCustomers: Customers found and errors, by requested username
+        """
+        lookup, items, merge = self._plan_get_many_by_username(usernames)
+        limit = resolve_deadline(deadline)
+        return merge(self._run_concurrently(lookup, items, max_workers, limit))
+
+    def search_stream(self, records: int, page: int, **filters) -> SearchStream:
+        """Gets the Customers that match the search criteria, parsing them while the page is
+        being received, so large pages are never held in memory whole. Takes the same
+        arguments as `search`.
+
+        Args:
+            records (int): Number of records to be fetched.
+            page (int): Page number for which details are to be fetched
+
+        Returns:
+            SearchStream: Iterable of the Customer objects matching the search criteria. The
+            request is sent when the iteration starts
+        """
+        url = self._urls.customers.search
+        params = build_search_params(records, page, **filters)
+        return SearchStream(self._stream_items(url, params))
+
+    def iter_search(
+        self,
+        records: int = 100,
+        prefetch: bool = False,
+        deadline: float = None,
+        **filters,
+    ) -> Iterator[Customer]:
+        """Iterates over every Customer matching the search criteria, fetching the pages lazily.
+
+        Args:
+            records (int, optional): Number of records fetched per page. Defaults to 100.
+            prefetch (bool, optional): Fetch the next page in the background while the current
+                one is consumed. Defaults to False.
+            deadline (float, optional): Seconds the whole iteration may take, counted from the
+                call. Defaults to the deadline in effect.
+            **filters: Search criteria accepted by `search`.
+
+        Yields:
+            Customer: Customers matching the search criteria, page after page
+        """
+        limit = resolve_deadline(deadline)
+        return self._iter_search(limit, records, prefetch, filters)
+
+    def _iter_search(
+        self, limit: Deadline | None, records: int, prefetch: bool, filters: dict
+    ) -> Iterator[Customer]:
+        response = run_within(limit, self.search, records, 1, **filters)
+        pages = count_pages(response.db_records, records)
+        if not prefetch:
+            yield from response
+            for page in range(2, pages + 1):
+                yield from run_within(limit, self.search, records, page, **filters)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for page in range(2, pages + 2):
+                future = None
+                if page <= pages:
+                    future = executor.submit(
+                        run_within, limit, self.search, records, page, **filters
+                    )
+                yield from response
+                if future is None:
+                    return
+                response = future.result()
+
+    def export(
+        self,
+        records: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True,
+        deadline: float = None,
+        retry_policy: RetryPolicy = None,
+        **filters,
+    ) -> Iterator[Customer]:
+        """Iterates over every Customer matching the search criteria, fetching the pages
+        concurrently.
+
+        The first page is fetched alone to learn the number of pages, the remaining ones are
+        fetched with at most `max_workers` requests in flight. Failed pages are retried one by
+        one, by the retry policy of the client or, if it has none, by `retry_policy`.
+
+        Args:
+            records (int, optional): Number of records fetched per page. Defaults to 100.
+            max_workers (int, optional): Maximum number of pages fetched at the same time.
+                Defaults to 8.
+            ordered (bool, optional): Yield customers in page order. When False, pages are
+                yielded as soon as they arrive. Defaults to True.
+            deadline (float, optional): Seconds the whole export may take, counted from the
+                call. Defaults to the deadline in effect.
+            retry_policy (RetryPolicy, optional): Policy retrying failed pages when the client
+                has none. Defaults to a `RetryPolicy` with the default settings.
+            **filters: Search criteria accepted by `search`.
+
+        Yields:
+            Customer: Customers matching the search criteria
+        """
+        limit = resolve_deadline(deadline)
+        policy = self._page_retry_policy(retry_policy)
+        pages = self._export_pages(
+            self.search, records, max_workers, ordered, limit, policy, filters
+        )
+        return chain.from_iterable(pages)
+
+    def export_columns(
+        self,
+        records: int = 100,
+        max_workers: int = 8,
+        deadline: float = None,
+        retry_policy: RetryPolicy = None,
+        **filters,
+    ) -> CustomerColumns:
+        """Fetches every Customer matching the search criteria as columns, fetching the pages
+        concurrently like `export`.
+
+        Args:
+            records (int, optional): Number of records fetched per page. Defaults to 100.
+            max_workers (int, optional): Maximum number of pages fetched at the same time.
+                Defaults to 8.
+            deadline (float, optional): Seconds the whole export may take, counted from the
+                call. Defaults to the deadline in effect.
+            retry_policy (RetryPolicy, optional): Policy retrying failed pages when the client
+                has none. Defaults to a `RetryPolicy` with the default settings.
+            **filters: Search criteria accepted by `search`.
+
+        Returns:
+            CustomerColumns: Fields of the Customers matching the search criteria, in page
+            order
+        """
+        limit = resolve_deadline(deadline)
+        policy = self._page_retry_policy(retry_policy)
+        pages = self._export_pages(
+            self.search_columns, records, max_workers, True, limit, policy, filters
+        )
+        return CustomerColumns.concat(pages)
+
+    def write_snapshot(
+        self,
+        path: str | os.PathLike,
+        records: int = 500,
+        max_workers: int = 8,
+        deadline: float = None,
+        **filters,
+    ) -> int:
+        """Exports every Customer matching the search criteria to a snapshot file.
+
+        The file can be opened with `CustomerSnapshot` for lookups by customer ID without
+        calling the API, and brought up to date with `refresh_snapshot`.
+
+        Args:
+            path (str | PathLike): File to write. Replaced if it exists.
+            records (int, optional): Number of records fetched per page. Defaults to 500.
+            max_workers (int, optional): Maximum number of pages fetched at the same time.
+                Defaults to 8.
+            deadline (float, optional): Seconds the whole export may take. Defaults to the
+                deadline in effect.
+            **filters: Search criteria accepted by `search`.
+
+        Returns:
+            int: Number of customers saved
+        """
+        taken_at = datetime.now()
+        columns = self.export_columns(
+            records, max_workers, deadline=deadline, **filters
+        )
+        return CustomerSnapshot.write(path, columns, taken_at)
+
+    def refresh_snapshot(
+        self,
+        path: str | os.PathLike,
+        records: int = 500,
+        max_workers: int = 8,
+        deadline: float = None,
+        **filters,
+    ) -> int:
+        """Adds the Customers created since a snapshot was taken to the snapshot file.
+
+        Only customers created after the snapshot, less `SNAPSHOT_REFRESH_OVERLAP` to allow for
+        clock differences, are fetched. Changes to the customers already in the snapshot are
+        not fetched.
+
+        Args:
+            path (str | PathLike): File written by `write_snapshot`.
+            records (int, optional): Number of records fetched per page. Defaults to 500.
+            max_workers (int, optional): Maximum number of pages fetched at the same time.
+                Defaults to 8.
+            deadline (float, optional): Seconds the whole refresh may take. Defaults to the
+                deadline in effect.
+            **filters: The search criteria the snapshot was written with, except the
+                creation date start.
+
+        Returns:
+            int: Number of customers fetched
+
+        Raises:
+            ValueError: If `creation_date_start` is given.
+        """
+        refresh = SnapshotRefresh.start(path, filters)
+        new = self.export_columns(
+            records, max_workers, deadline=deadline, **refresh.filters
+        )
+        return refresh.finish(new)
+
+    def sync(
+        self,
+        state: SyncState,
+        records: int = 500,
+        max_workers: int = 8,
+        full: bool = False,
+        deadline: float = None,
+        **filters,
+    ) -> List[SyncChange]:
+        """Fetches the Customers created since the last synchronization and returns those
+        that are new or changed.
+
+        The customers created since the high-water mark of `state` are fetched with
+        `search_range`. If they fit in one page a single search is all it takes, so the
+        requests made grow with the number of new customers, not with the total. Customers
+        are compared with `state` by content hash, and `state` is updated only once every
+        window is fetched.
+
+        The API cannot filter customers by modification date, so changes to customers created
+        before the high-water mark are only found by a `full` synchronization. It fetches
+        every customer but still returns only the new and changed ones.
+
+        Args:
+            state (SyncState): State of the previous synchronizations. Updated in place; save
+                it with `SyncState.save`.
+            records (int, optional): Number of records fetched per page. Defaults to 500.
+            max_workers (int, optional): Maximum number of windows fetched at the same time.
+                Defaults to 8.
+            full (bool, optional): Fetch every customer, not only those created since the
+                high-water mark. Defaults to False.
+            deadline (float, optional): Seconds the whole synchronization may take. Defaults
+                to the deadline in effect.
+            **filters: Search criteria accepted by `search`, except the creation dates.
+
+        Returns:
+            List[SyncChange]: Customers inserted or changed, with the kind of change
+        """
+        started = datetime.now()
+        columns = self.search_range(
+            state.start(full), started, records, max_workers, deadline, **filters
+        )
+        return state.apply([columns], started)
+
+    def search_range(
+        self,
+        creation_date_start: datetime,
+        creation_date_end: datetime,
+        records: int = 500,
+        max_workers: int = 8,
+        deadline: float = None,
+        **filters,
+    ) -> CustomerColumns:
+        """Fetches every Customer created within a date range, splitting the range into
+        windows that are fetched concurrently.
+
+        The range is searched first. If its customers do not fit in one page, it is split in
+        two halves that are searched concurrently, and so on until every window fits in one
+        page, so dense ranges, such as a burst of sign-ups, are split finely while quiet ones
+        cost a single request. Windows holding a single second, which cannot be split, are
+        paged through instead.
+
+        Args:
+            creation_date_start (datetime): Customers created after this date are fetched.
+            creation_date_end (datetime): Customers created before this date are fetched.
+            records (int, optional): Number of records fetched per page. Defaults to 500.
+            max_workers (int, optional): Maximum number of windows searched at the same time.
+                Defaults to 8.
+            deadline (float, optional): Seconds the whole search may take. Defaults to the
+                deadline in effect.
+            **filters: Search criteria accepted by `search`, except the creation dates.
+
+        Returns:
+            CustomerColumns: Fields of the Customers created within the range, in creation
+            date order of their windows
+        """
+        limit = resolve_deadline(deadline)
+        search = RangeSearch(creation_date_start, creation_date_end, records, filters)
+        while search.windows:
+            results = self._run_concurrently(
+                self._probe_window, search.jobs(), max_workers, limit
+            )
+            search.add(results)
+        return search.result()
+
+    def _probe_window(
+        self, job: Tuple[Window, int, dict]
+    ) -> Tuple[Window, CustomerColumns | List[Window]]:
+        """Searches a window, returning its customers if they fit in one page or it cannot be
+        split, or its two halves otherwise"""
+        window, records, filters = job
+        first_page = self.search_columns(records, 1, **filters)
+        outcome = probe_outcome(window, first_page)
+        if outcome is None:
+            pages = [
+                self.search_columns(records, page, **filters)
+                for page in remaining_pages(first_page, records)
+            ]
+            outcome = CustomerColumns.concat([first_page, *pages])
+        return window, outcome
+
+    def _export_pages(
+        self,
+        search: Callable,
+        records: int,
+        max_workers: int,
+        ordered: bool,
+        limit: Deadline | None,
+        policy: RetryPolicy | None,
+        filters: dict,
+    ) -> Iterator[SearchResponse | CustomerColumns]:
+        """Fetches every search page with `search`, with at most `max_workers` in flight"""
+
+        def fetch_page(page: int) -> SearchResponse | CustomerColumns:
+            with retry_scope(policy):
+                return run_within(limit, search, records, page, **filters)
+
+        response = fetch_page(1)
+        yield response
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            queue = PageQueue(
+                partial(executor.submit, fetch_page),
+                remaining_pages(response, records),
+                max_workers,
+            )
+            while queue.pending:
+                if ordered:
+                    done = [queue.pending[0]]
+                else:
+                    done = wait(queue.pending, return_when=FIRST_COMPLETED).done
+                for future in queue.take(done):
+                    yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _bulk_submit(
+        self,
+        operation: Literal["sign_up", "modify"],
+        customers: Iterable,
+        max_workers: int,
+        checkpoint: str | os.PathLike | None,
+        deadline: float,
+        validate: bool,
+    ) -> Iterator[SubmitResult]:
+        limit = resolve_deadline(deadline)
+        submission = BulkSubmission(checkpoint, max_workers)
+        jobs = plan_submissions(operation, customers, submission.log, validate)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def start(job: SubmitJob) -> Future:
+            return executor.submit(run_within, limit, self._submit, operation, job)
+
+        try:
+            for result in submission.run(jobs, start):
+                if result is None:
+                    done = wait(submission.in_flight, return_when=FIRST_COMPLETED).done
+                    yield from submission.finish(done)
+                else:
+                    yield result
+        finally:
+            executor.shutdown(cancel_futures=True)
+            submission.close()
+
+    def _submit(self, operation: Literal["sign_up", "modify"], job: SubmitJob) -> Any:
+        """Signs up or modifies a customer, returning its ID"""
+        if job.recover:
+            try:
+                # Same type as the ID returned by sign_up
+                return int(self.get_by_username(job.customer.username).id)
+            except ResellerClubAPIException as error:
+                check_recovery_error(error)
+        result = self._submit_request(operation, job.customer)
+        return submitted_id(operation, job.customer, result)
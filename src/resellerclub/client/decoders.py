@@ -0,0 +1,31 @@
+"""JSON decoders
+
+The default decoder uses orjson when it is installed, and the standard library otherwise.
+Install orjson with: pip install resellerclub-python[speedups]
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Decoder = Callable[[bytes], Any]
+
+
+def stdlib_decoder(content: bytes) -> Any:
+    """Decodes JSON bytes with the standard library. `json.loads` detects the encoding and
+    decodes the bytes to text before parsing them."""
+    return json.loads(content)
+
+
+def orjson_decoder(content: bytes) -> Any:
+    """Decodes JSON bytes with orjson"""
+    return orjson.loads(content)
+
+
+def get_default_decoder() -> Decoder:
+    """Returns the fastest decoder available"""
+    return stdlib_decoder if orjson is None else orjson_decoder
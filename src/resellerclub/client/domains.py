@@ -1,13 +1,92 @@
 """Domains API Client"""
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, NamedTuple, Tuple
 
 from ..models.domains import Availability, PremiumDomain, Suggestion
-from .base import BaseClient
+from .base import BaseClient, ClientCore
+from .timeouts import resolve_deadline, run_within
 
 
-class DomainsClient(BaseClient):
-    """Domains API Client. Methods to Search, Register or Renew domain names, etc."""
+class ChunkError(NamedTuple):
+    """Error raised while checking one chunk of a bulk availability check"""
+
+    domain_names: List[str]
+    tlds: List[str]
+    error: Exception
+
+
+class BulkAvailability(NamedTuple):
+    """Represents the merged result of a bulk availability check"""
+
+    availability: List[Availability]
+    errors: List[ChunkError]
+
+    def __len__(self) -> int:
+        return len(self.availability)
+
+    def __iter__(self) -> Iterator:
+        return self.availability.__iter__()
+
+
+def chunk_availability_grid(
+    domain_names: list, tlds: list, max_combinations: int
+) -> Iterator[Tuple[List[str], List[str]]]:
+    """Splits a domain name x TLD grid into chunks of at most `max_combinations` names.
+
+    Args:
+        domain_names (list): Domain names to check
+        tlds (list): TLDs to check each domain name against
+        max_combinations (int): Maximum number of domain name x TLD pairs per chunk
+
+    Yields:
+        Tuple[List[str], List[str]]: Domain names and TLDs of each chunk. Nothing if there
+        are no domain names or no TLDs.
+
+    Raises:
+        ValueError: If `max_combinations` is less than 1.
+    """
+    if max_combinations < 1:
+        raise ValueError("max_combinations must be at least 1")
+    domain_names, tlds = list(domain_names), list(tlds)
+    if not domain_names or not tlds:
+        return
+    if len(tlds) >= max_combinations:
+        # A single name exceeds the limit, so its TLDs are split
+        for domain_name in domain_names:
+            for i in range(0, len(tlds), max_combinations):
+                yield [domain_name], tlds[i : i + max_combinations]
+        return
+
+    names_per_chunk = max_combinations // len(tlds)
+    for i in range(0, len(domain_names), names_per_chunk):
+        yield domain_names[i : i + names_per_chunk], tlds
+
+
+def parse_availability(data: dict) -> List[Availability]:
+    """Builds Availability objects from an availability check response"""
+    return [Availability(dn, **a) for dn, a in data.items() if not dn == "errors"]
+
+
+def parse_premium_domains(data: dict) -> List[PremiumDomain]:
+    """Builds PremiumDomain objects from a premium availability check response"""
+    return [PremiumDomain(domain, float(price)) for domain, price in data.items()]
+
+
+def parse_suggestions(data: dict) -> List[Suggestion]:
+    """Builds Suggestion objects from a name suggestion response"""
+    result = []
+    for domain, sug in data.items():
+        in_ga = bool(sug["in_ga"].lower() == "true")
+        score = float(sug["score"])
+        suggestion_params = [domain, sug["status"], in_ga, score, sug["spin"]]
+        result.append(Suggestion(*suggestion_params))
+
+    return result
+
+
+class DomainsEndpoints(ClientCore):
+    """Domains API endpoints, shared by the sync and asyncio Domains API Clients"""
 
     def check_availability(self, domain_names: list, tlds: list) -> List[Availability]:
         """Checks the availability of the specified domain name(s).
@@ -22,10 +101,8 @@ class DomainsClient(BaseClient):
             requested TLDs
         """
         params = {"domain-name": domain_names, "tlds": tlds}
-        url = self._urls.domains.get_availability_check_url()
-        data = self._get(url, params)
-
-        return [Availability(dn, **a) for dn, a in data.items() if not dn == "errors"]
+        url = self._urls.domains.availability_check
+        return self._get(url, params, parse_availability)
 
     def check_idn_availability(
         self, domain_names: list, tld: str, idn_language_code: str
@@ -49,10 +126,8 @@ class DomainsClient(BaseClient):
             "tld": tld,
             "idnLanguageCode": idn_language_code,
         }
-        url = self._urls.domains.get_availability_check_url("idn")
-        data = self._get(url, params)
-
-        return [Availability(dn, **availability) for dn, availability in data.items()]
+        url = self._urls.domains.idn_availability_check
+        return self._get(url, params, parse_availability)
 
     def check_premium_domain_availability(
         self,
@@ -88,10 +163,8 @@ class DomainsClient(BaseClient):
             "price-low": lowest_price,
             "no-of-results": max_results,
         }
-        url = self._urls.domains.get_availability_check_url("premium")
-        data = self._get(url, params)
-
-        return [PremiumDomain(domain, float(price)) for domain, price in data.items()]
+        url = self._urls.domains.premium_availability_check
+        return self._get(url, params, parse_premium_domains)
 
     def check_third_level_name_availability(
         self, domain_names: list
@@ -107,10 +180,8 @@ class DomainsClient(BaseClient):
             domain names
         """
         params = {"domain-name": domain_names, "tlds": "*.name"}
-        url = self._urls.domains.get_availability_check_url("3rd_level_dotname")
-        data = self._get(url, params)
-
-        return [Availability(dn, **availability) for dn, availability in data.items()]
+        url = self._urls.domains.third_level_name_availability_check
+        return self._get(url, params, parse_availability)
 
     def suggest_names(
         self,
@@ -139,14 +210,52 @@ class DomainsClient(BaseClient):
             "exact-match": exact_match,
             "adult": adult,
         }
-        url = self._urls.domains.get_name_suggestion_url()
-        data = self._get(url, params)
+        url = self._urls.domains.name_suggestion
+        return self._get(url, params, parse_suggestions)
+
+
+class DomainsClient(DomainsEndpoints, BaseClient):
+    """Domains API Client. Methods to Search, Register or Renew domain names, etc."""
+
+    def check_availability_bulk(
+        self,
+        domain_names: list,
+        tlds: list,
+        max_combinations: int = 100,
+        max_workers: int = 8,
+        deadline: float = None,
+    ) -> BulkAvailability:
+        """Checks the availability of a large domain name x TLD grid.
+
+        The grid is split into chunks that are checked concurrently and merged back in chunk
+        order. A failing chunk is reported in `errors` without discarding the other chunks.
+
+        Args:
+            domain_names (list): Domain name(s) that you need to check the availability for
+            tlds (list): TLDs for which the domain name availability needs to be checked
+            max_combinations (int, optional): Maximum number of domain name x TLD pairs sent in
+                a single request. Defaults to 100.
+            max_workers (int, optional): Maximum number of concurrent requests. Defaults to 8.
+            deadline (float, optional): Seconds the whole check may take. Chunks that cannot
+                finish in time are reported as errors. Defaults to the deadline in effect.
+
+        Returns:
+            BulkAvailability: Merged availability of every chunk and the errors of the chunks
+            that failed
+        """
+        limit = resolve_deadline(deadline)
+        chunks = list(chunk_availability_grid(domain_names, tlds, max_combinations))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_within, limit, self.check_availability, *chunk)
+                for chunk in chunks
+            ]
 
-        result = []
-        for domain, sug in data.items():
-            in_ga = bool(sug["in_ga"].lower() == "true")
-            score = float(sug["score"])
-            suggestion_params = [domain, sug["status"], in_ga, score, sug["spin"]]
-            result.append(Suggestion(*suggestion_params))
+        availability, errors = [], []
+        for chunk, future in zip(chunks, futures):
+            try:
+                availability.extend(future.result())
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                errors.append(ChunkError(*chunk, error))
 
-        return result
+        return BulkAvailability(availability, errors)
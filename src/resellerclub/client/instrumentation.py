@@ -0,0 +1,184 @@
+"""Request instrumentation hooks and metrics"""
+
+import bisect
+import threading
+import time
+from collections import Counter
+from typing import Dict, Tuple
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# Upper bounds of the payload size histogram buckets, in bytes
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class RequestEvent:
+    """Describes one API call as it goes through the request path.
+
+    Hooks receive the same event in every callback, filled in as the call progresses.
+    """
+
+    def __init__(self, endpoint: str, method: str, url: str) -> None:
+        self.endpoint = endpoint
+        self.method = method
+        self.url = url
+        self.start = time.perf_counter()
+        self.latency = None
+        self.status_code = None
+        self.response_size = None
+        self.decode_time = None
+        self.parse_time = None
+        self.cached = False
+        self.error = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.method.upper()} {self.endpoint}>"
+
+
+class RequestHook:
+    """Base class for request hooks. Override the callbacks you need."""
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before the request is sent, or looked up in the cache"""
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called after the response has been decoded and parsed"""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when the call raises an exception, available in `event.error`"""
+
+
+class Histogram:
+    """Histogram with fixed bucket upper bounds"""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records a value"""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percent: float) -> float:
+        """Returns the upper bound of the bucket holding the given percentile.
+
+        Args:
+            percent (float): Percentile, between 0 and 100.
+
+        Returns:
+            float: Estimated value, 0.0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """Returns the histogram as a dict"""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(self.buckets + (float("inf"),), self.counts)),
+        }
+
+
+class EndpointMetrics:
+    """Metrics recorded for one endpoint"""
+
+    def __init__(self) -> None:
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_size = Histogram(SIZE_BUCKETS)
+        self.decode_time = Histogram(LATENCY_BUCKETS)
+        self.parse_time = Histogram(LATENCY_BUCKETS)
+        self.cache_hits = 0
+        self.errors = Counter()
+
+    def snapshot(self) -> dict:
+        """Returns the endpoint metrics as a dict"""
+        return {
+            "latency": self.latency.snapshot(),
+            "response_size": self.response_size.snapshot(),
+            "decode_time": self.decode_time.snapshot(),
+            "parse_time": self.parse_time.snapshot(),
+            "cache_hits": self.cache_hits,
+            "errors": dict(self.errors),
+        }
+
+
+class MetricsCollector(RequestHook):
+    """In-process metrics collector keyed by endpoint name, e.g. "customers.search".
+
+    Thread-safe, so one collector can be shared by every client.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get_endpoint(self, name: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints.setdefault(name, EndpointMetrics())
+        return metrics
+
+    def after_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._get_endpoint(event.endpoint)
+            metrics.latency.observe(event.latency)
+            if event.cached:
+                metrics.cache_hits += 1
+            if event.response_size is not None:
+                metrics.response_size.observe(event.response_size)
+            if event.decode_time is not None:
+                metrics.decode_time.observe(event.decode_time)
+            if event.parse_time is not None:
+                metrics.parse_time.observe(event.parse_time)
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self._get_endpoint(event.endpoint)
+            metrics.latency.observe(event.latency)
+            metrics.errors[type(event.error).__name__] += 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Returns the metrics of every endpoint, by endpoint name"""
+        with self._lock:
+            return {name: m.snapshot() for name, m in self._endpoints.items()}
+
+    def reset(self) -> None:
+        """Discards all the recorded metrics"""
+        with self._lock:
+            self._endpoints.clear()
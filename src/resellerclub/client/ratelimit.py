@@ -0,0 +1,111 @@
+"""Client-side rate limiting"""
+
+import math
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket rate limiter.
+
+    Allows `rate` requests per second on average, with bursts of up to `burst` requests. The
+    limiter is thread-safe, so a single instance can be shared by every client and thread that
+    talks to the same reseller account.
+    """
+
+    def __init__(self, rate: float, burst: int = None) -> None:
+        """Token bucket rate limiter constructor.
+
+        Args:
+            rate (float): Requests allowed per second.
+            burst (int, optional): Maximum number of requests sent back to back.
+                Defaults to `rate` rounded up, at least 1.
+        """
+        self._rate = float(rate)
+        self.burst = burst if burst is not None else max(1, math.ceil(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Requests allowed per second"""
+        return self._rate
+
+    def reserve(self) -> float:
+        """Takes a token from the bucket.
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+
+    def acquire(self) -> None:
+        """Blocks until a request can be sent"""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def record(self, success: bool, latency: float) -> None:
+        """Records the outcome of a request. The token bucket ignores it.
+
+        Args:
+            success (bool): False if the API throttled the request or it did not reach the
+                API.
+            latency (float): Seconds the request took.
+        """
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Token bucket rate limiter that adapts its rate to the API health.
+
+    The rate is cut by `decrease_factor` whenever a request fails or takes longer than
+    `target_latency`, and grows by `increase_step` requests per second after each healthy
+    request, between `min_rate` and `max_rate`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = None,
+        min_rate: float = 1.0,
+        max_rate: float = None,
+        target_latency: float = 2.0,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+    ) -> None:
+        """Adaptive rate limiter constructor.
+
+        Args:
+            rate (float): Initial requests allowed per second.
+            burst (int, optional): Maximum number of requests sent back to back.
+                Defaults to `rate` rounded up, at least 1.
+            min_rate (float, optional): Lowest rate the limiter backs off to. Defaults to 1.0.
+            max_rate (float, optional): Highest rate the limiter ramps up to.
+                Defaults to `rate`.
+            target_latency (float, optional): Seconds above which a request is considered slow.
+                Defaults to 2.0.
+            decrease_factor (float, optional): Factor applied to the rate on a failed or slow
+                request. Defaults to 0.5.
+            increase_step (float, optional): Requests per second added after a healthy request.
+                Defaults to 0.1.
+        """
+        super().__init__(rate, burst)
+        self.min_rate = min(min_rate, rate)
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+
+    def record(self, success: bool, latency: float) -> None:
+        with self._lock:
+            if success and latency <= self.target_latency:
+                self._rate = min(self.max_rate, self._rate + self.increase_step)
+            else:
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
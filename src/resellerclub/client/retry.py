@@ -0,0 +1,155 @@
+"""Retry policies"""
+
+import contextvars
+import random
+import threading
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+
+from .transport import TRANSIENT_EXCEPTIONS, TRANSIENT_STATUS_CODES, is_api_error
+
+
+class RetryStats(NamedTuple):
+    """Retry policy counters"""
+
+    requests: int
+    retries: int
+    backoff_time: float
+    budget_exhausted: int
+
+
+class RetryPolicy:
+    """Retries idempotent requests that failed with a transient error.
+
+    Waits `backoff_factor * 2 ** retry` seconds between attempts, capped at `max_backoff` and
+    randomized with full jitter. Retries are also capped by a budget: at most `budget_min`
+    retries plus `budget_ratio` retries per request sent, so a struggling API is not flooded
+    with retries. The policy is thread-safe and meant to be shared.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        budget_ratio: float = 0.2,
+        budget_min: int = 10,
+        status_codes: frozenset = TRANSIENT_STATUS_CODES,
+        exceptions: tuple = TRANSIENT_EXCEPTIONS,
+    ) -> None:
+        """Retry policy constructor.
+
+        Args:
+            max_retries (int, optional): Maximum number of retries per request. Defaults to 3.
+            backoff_factor (float, optional): Seconds to wait before the first retry, doubled
+                for each one after. Defaults to 0.5.
+            max_backoff (float, optional): Maximum seconds to wait between attempts.
+                Defaults to 30.0.
+            jitter (bool, optional): Wait a random time between 0 and the backoff.
+                Defaults to True.
+            budget_ratio (float, optional): Retries allowed per request sent. Defaults to 0.2.
+            budget_min (int, optional): Retries allowed regardless of the number of requests.
+                Defaults to 10.
+            status_codes (frozenset, optional): Response status codes that are retried.
+                Defaults to TRANSIENT_STATUS_CODES.
+            exceptions (tuple, optional): Transport exceptions that are retried.
+                Defaults to TRANSIENT_EXCEPTIONS.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self.status_codes = status_codes
+        self.exceptions = exceptions
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._retries = 0
+        self._backoff_time = 0.0
+        self._budget_exhausted = 0
+
+    def backoff(self, retry: int) -> float:
+        """Returns the seconds to wait before a retry.
+
+        Args:
+            retry (int): Number of the retry, starting at 0.
+
+        Returns:
+            float: Seconds to wait
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * 2**retry)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def is_transient(self, response=None, error: Exception = None) -> bool:
+        """Returns True if the attempt failed with an error worth retrying. Errors reported by
+        the API, such as "No Entity", are final even though they come with a 500 status.
+        """
+        if error is not None:
+            return isinstance(error, self.exceptions)
+        return response.status_code in self.status_codes and not is_api_error(response)
+
+    def record_request(self) -> None:
+        """Counts a request towards the retry budget"""
+        with self._lock:
+            self._requests += 1
+
+    def get_delay(
+        self, retry: int, response=None, error: Exception = None
+    ) -> float | None:
+        """Decides whether an attempt of an idempotent request is retried.
+
+        Args:
+            retry (int): Number of retries already made for the request.
+            response (optional): Response of the attempt, if there is one.
+            error (Exception, optional): Error raised by the attempt, if any.
+
+        Returns:
+            float | None: Seconds to wait before retrying, None if the attempt is final
+        """
+        if retry >= self.max_retries or not self.is_transient(response, error):
+            return None
+
+        with self._lock:
+            if self._retries >= self.budget_min + self.budget_ratio * self._requests:
+                self._budget_exhausted += 1
+                return None
+            delay = self.backoff(retry)
+            self._retries += 1
+            self._backoff_time += delay
+            return delay
+
+    def stats(self) -> RetryStats:
+        """Returns the retry counters"""
+        with self._lock:
+            return RetryStats(
+                self._requests,
+                self._retries,
+                self._backoff_time,
+                self._budget_exhausted,
+            )
+
+
+_current_retry_policy = contextvars.ContextVar(
+    "resellerclub_retry_policy", default=None
+)
+
+
+def get_retry_policy() -> RetryPolicy | None:
+    """Returns the retry policy in effect, None if there is none"""
+    return _current_retry_policy.get()
+
+
+@contextmanager
+def retry_scope(policy: RetryPolicy | None) -> Iterator[RetryPolicy | None]:
+    """Retries the idempotent requests made inside the block with `policy`, if there is one.
+    Clients with a retry policy of their own keep using theirs."""
+    if policy is None:
+        yield None
+        return
+    token = _current_retry_policy.set(policy)
+    try:
+        yield policy
+    finally:
+        _current_retry_policy.reset(token)
@@ -0,0 +1,217 @@
+"""Memory-mapped snapshot files of customer search results"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, Iterator, List
+
+from ..models.customer import Customer
+from .columnar import CustomerColumns
+
+MAGIC = b"RCSNAP\x00\x01"
+# Magic bytes followed by the position and length of the JSON metadata, written last
+_HEADER = struct.Struct("<8sQQ")
+# Sections start at multiples of the widest array item
+_ALIGNMENT = 8
+
+
+def _align(size: int) -> int:
+    return -size % _ALIGNMENT
+
+
+class CustomerSnapshot:
+    """Customer search results saved to a file that is memory-mapped when opened.
+
+    The file holds the columns of a `CustomerColumns`, sorted by customer ID: numeric columns
+    as raw arrays, text columns as an array of offsets into a UTF-8 blob. Opening it only
+    reads its small JSON metadata, and looking a customer up is a binary search on the mapped
+    IDs, so a snapshot of any size opens instantly and only the pages used are read from disk.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Opens a snapshot file.
+
+        Args:
+            path (str | PathLike): File written by `CustomerSnapshot.write`.
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, position, size = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a customer snapshot: {path}")
+        self.metadata = json.loads(self._mmap[position : position + size])
+        if self.metadata["byteorder"] != sys.byteorder:
+            self._mmap.close()
+            raise ValueError(
+                f"Snapshot written on a {self.metadata['byteorder']} machine"
+            )
+        self._view = memoryview(self._mmap)
+        self._arrays: Dict[str, memoryview] = {}
+        for name, section in self.metadata["sections"].items():
+            offset, typecode, length = section
+            size = length * struct.calcsize(typecode)
+            self._arrays[name] = self._view[offset : offset + size].cast(typecode)
+        self._ids = self._arrays["id"]
+
+    def __enter__(self) -> "CustomerSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps the file"""
+        for view in self._arrays.values():
+            view.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} customers>"
+
+    @property
+    def taken_at(self) -> datetime:
+        """When the search results saved in the snapshot started being fetched"""
+        return datetime.fromtimestamp(self.metadata["taken_at"])
+
+    def index(self, customer_id: int | str) -> int:
+        """Returns the row of a customer, or -1 if it is not in the snapshot"""
+        customer_id = int(customer_id)
+        index = bisect_left(self._ids, customer_id)
+        if index < len(self._ids) and self._ids[index] == customer_id:
+            return index
+        return -1
+
+    def __contains__(self, customer_id: int | str) -> bool:
+        return self.index(customer_id) >= 0
+
+    def _value(self, name: str, index: int) -> Any:
+        if name == "id":
+            return str(self._ids[index])
+        values = self._arrays.get(name)
+        if values is not None:
+            return values[index]
+        nulls = self._arrays.get(f"{name}.nulls")
+        if nulls is not None and nulls[index]:
+            return None
+        offsets = self._arrays[f"{name}.offsets"]
+        data = self.metadata["blobs"][name]
+        return self._mmap[data + offsets[index] : data + offsets[index + 1]].decode()
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Returns the values of one row, by column name"""
+        return {name: self._value(name, index) for name in CustomerColumns.fields}
+
+    def get(self, customer_id: int | str, default: Customer = None) -> Customer | None:
+        """Returns a customer by ID, or `default` if it is not in the snapshot"""
+        index = self.index(customer_id)
+        if index < 0:
+            return default
+        return CustomerColumns.build_customer(self.row(index))
+
+    def __getitem__(self, customer_id: int | str) -> Customer:
+        customer = self.get(customer_id)
+        if customer is None:
+            raise KeyError(customer_id)
+        return customer
+
+    def ids(self) -> List[str]:
+        """Returns the customer IDs in the snapshot, sorted"""
+        return [str(customer_id) for customer_id in self._ids]
+
+    def __iter__(self) -> Iterator[Customer]:
+        return (
+            CustomerColumns.build_customer(self.row(index))
+            for index in range(len(self))
+        )
+
+    def to_columns(self) -> CustomerColumns:
+        """Loads every row of the snapshot into memory"""
+        columns = {}
+        for name, (_, typecode) in CustomerColumns.fields.items():
+            if name == "id":
+                columns[name] = self.ids()
+            elif typecode is not None:
+                columns[name] = self._arrays[name]
+            else:
+                columns[name] = [self._value(name, i) for i in range(len(self))]
+        return CustomerColumns(columns, len(self), len(self))
+
+    @staticmethod
+    def write(
+        path: str | os.PathLike, columns: CustomerColumns, taken_at: datetime
+    ) -> int:
+        """Saves customer columns to a snapshot file, replacing it atomically.
+
+        Args:
+            path (str | PathLike): File to write.
+            columns (CustomerColumns): Customers to save. When a customer appears more than
+                once, its last row is kept.
+            taken_at (datetime): When the customers started being fetched, to refresh the
+                snapshot later with the customers created since then.
+
+        Returns:
+            int: Number of customers saved
+        """
+        last_rows = {
+            int(customer_id): i for i, customer_id in enumerate(columns.columns["id"])
+        }
+        ids = sorted(last_rows)
+        rows = [last_rows[customer_id] for customer_id in ids]
+
+        arrays: Dict[str, array] = {"id": array("Q", ids)}
+        blobs: Dict[str, bytes] = {}
+        for name, (_, typecode) in CustomerColumns.fields.items():
+            if name == "id":
+                continue
+            column = columns.columns[name]
+            if typecode is not None:
+                arrays[name] = array(typecode, (column[i] for i in rows))
+                continue
+            values = [column[i] for i in rows]
+            chunks = [b"" if value is None else str(value).encode() for value in values]
+            offsets = array("Q", [0])
+            size = 0
+            for chunk in chunks:
+                size += len(chunk)
+                offsets.append(size)
+            arrays[f"{name}.offsets"] = offsets
+            if None in values:
+                arrays[f"{name}.nulls"] = array("B", (v is None for v in values))
+            blobs[name] = b"".join(chunks)
+
+        temp_path = f"{os.fspath(path)}.tmp"
+        sections, positions = {}, {}
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, 0, 0))
+            for name, data in list(arrays.items()) + list(blobs.items()):
+                f.write(b"\0" * _align(f.tell()))
+                if isinstance(data, array):
+                    sections[name] = (f.tell(), data.typecode, len(data))
+                    f.write(data.tobytes())
+                else:
+                    positions[name] = f.tell()
+                    f.write(data)
+            metadata = {
+                "taken_at": taken_at.timestamp(),
+                "byteorder": sys.byteorder,
+                "sections": sections,
+                "blobs": positions,
+            }
+            encoded = json.dumps(metadata).encode()
+            position = f.tell()
+            f.write(encoded)
+            f.seek(0)
+            f.write(_HEADER.pack(MAGIC, position, len(encoded)))
+        os.replace(temp_path, path)
+        return len(ids)
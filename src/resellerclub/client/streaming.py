@@ -0,0 +1,135 @@
+"""Incremental JSON parsing of streamed responses"""
+
+import codecs
+import json
+from json.decoder import scanstring
+from typing import Any, List, Tuple
+
+_WHITESPACE = " \t\n\r"
+# Characters a JSON number can start with, and the ones that can follow it in an object
+_NUMBER_START = "-0123456789"
+_NUMBER_END = ",}" + _WHITESPACE
+
+
+class ObjectItemParser:
+    """Push parser yielding the members of a top-level JSON object as soon as they are
+    complete.
+
+    Only the member being received is buffered, so memory stays flat no matter how large the
+    object is. Feed it the response body chunk by chunk and call `close` at the end.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+
+    def _skip_whitespace(self, index: int) -> int:
+        while index < len(self._buffer) and self._buffer[index] in _WHITESPACE:
+            index += 1
+        return index
+
+    def _parse_member(self, index: int, final: bool) -> Tuple[Any, int] | None:
+        """Parses the member starting at `index`.
+
+        Returns:
+            Tuple[Any, int] | None: The (key, value) pair and the index after it, None if
+            the member is not complete yet
+        """
+        buffer = self._buffer
+        try:
+            key, index = scanstring(buffer, index + 1)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+
+        index = self._skip_whitespace(index)
+        if index >= len(buffer):
+            return None
+        if buffer[index] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", buffer, index)
+
+        start = self._skip_whitespace(index + 1)
+        try:
+            value, index = self._json.raw_decode(buffer, start)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+
+        if not final:
+            # Wait for what follows the value: a number is decoded up to the end of the
+            # buffer or the first character it cannot hold, such as the "." of "1." or the
+            # "e" of "1e", but may continue in the next chunk
+            end = self._skip_whitespace(index)
+            if end >= len(buffer):
+                return None
+            if buffer[start] in _NUMBER_START and buffer[index] not in _NUMBER_END:
+                return None
+        return (key, value), index
+
+    def _parse(self, final: bool) -> List[Tuple[str, Any]]:
+        items = []
+        index = self._skip_whitespace(0)
+        if not self._started:
+            if index >= len(self._buffer):
+                return items
+            if self._buffer[index] != "{":
+                raise json.JSONDecodeError("Expecting '{'", self._buffer, index)
+            self._started = True
+            index = self._skip_whitespace(index + 1)
+
+        while index < len(self._buffer) and not self._finished:
+            char = self._buffer[index]
+            if char == "}":
+                self._finished = True
+                index += 1
+                break
+            if char == ",":
+                index = self._skip_whitespace(index + 1)
+                continue
+            if char != '"':
+                raise json.JSONDecodeError(
+                    "Expecting property name", self._buffer, index
+                )
+            member = self._parse_member(index, final)
+            if member is None:
+                break
+            item, index = member
+            items.append(item)
+            index = self._skip_whitespace(index)
+
+        self._buffer = self._buffer[index:]
+        return items
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, Any]]:
+        """Adds a chunk of the body.
+
+        Args:
+            chunk (bytes): Next chunk of the response body.
+
+        Returns:
+            List[Tuple[str, Any]]: Members completed by the chunk, as (key, value) pairs
+        """
+        self._buffer += self._decoder.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[Tuple[str, Any]]:
+        """Marks the end of the body.
+
+        Returns:
+            List[Tuple[str, Any]]: Members that were still pending
+
+        Raises:
+            json.JSONDecodeError: If the body is not a complete JSON object.
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        items = self._parse(final=True)
+        if not self._finished:
+            raise json.JSONDecodeError("Unterminated object", self._buffer, 0)
+        if self._buffer.strip():
+            raise json.JSONDecodeError("Extra data", self._buffer, 0)
+        return items
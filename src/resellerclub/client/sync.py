@@ -0,0 +1,235 @@
+"""Incremental synchronization of customer search results"""
+
+import hashlib
+import json
+import math
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Literal, NamedTuple, Tuple
+
+from ..models.customer import Customer
+from .columnar import CustomerColumns
+
+# Creation date the first synchronization starts from
+SYNC_EPOCH = datetime(2000, 1, 1)
+# Customers created this long before the high-water mark are fetched again, to allow for
+# clock differences with the API
+SYNC_OVERLAP = timedelta(hours=1)
+
+# (creation date start, creation date end) of a search
+Window = Tuple[datetime, datetime]
+
+
+class SyncChange(NamedTuple):
+    """Represents a customer inserted or changed since the last synchronization"""
+
+    kind: Literal["inserted", "changed"]
+    customer: Customer
+
+
+class SyncState:
+    """Local state of the customer synchronization: the high-water mark, when the last
+    synchronization started, and the content hash of every customer seen, by customer ID
+    """
+
+    def __init__(
+        self, high_water_mark: datetime = None, hashes: Dict[str, str] = None
+    ) -> None:
+        """Synchronization state constructor.
+
+        Args:
+            high_water_mark (datetime, optional): When the last synchronization started.
+                Defaults to None, for a state that was never synchronized.
+            hashes (Dict[str, str], optional): Content hash of each customer, by ID.
+                Defaults to no customers.
+        """
+        self.high_water_mark = high_water_mark
+        self.hashes = {} if hashes is None else hashes
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "SyncState":
+        """Reads a state saved with `save`, or returns a new state if the file does not
+        exist"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        mark = data["high_water_mark"]
+        return cls(
+            None if mark is None else datetime.fromtimestamp(mark), data["hashes"]
+        )
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Writes the state to a file, replacing it atomically"""
+        mark = self.high_water_mark
+        data = {
+            "high_water_mark": None if mark is None else mark.timestamp(),
+            "hashes": self.hashes,
+        }
+        temp_path = f"{os.fspath(path)}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+
+    def start(self, full: bool = False) -> datetime:
+        """Returns the creation date a synchronization starts from"""
+        if full or self.high_water_mark is None:
+            return SYNC_EPOCH
+        return self.high_water_mark - SYNC_OVERLAP
+
+    def diff(self, columns: CustomerColumns) -> Iterator[SyncChange]:
+        """Yields the customers that are new or whose content changed, recording their hash"""
+        names = list(CustomerColumns.fields)
+        for index in range(len(columns)):
+            row = columns.row(index)
+            digest = content_hash(row[name] for name in names)
+            previous = self.hashes.get(row["id"])
+            if previous == digest:
+                continue
+            self.hashes[row["id"]] = digest
+            kind = "inserted" if previous is None else "changed"
+            yield SyncChange(kind, CustomerColumns.build_customer(row))
+
+    def apply(
+        self, parts: Iterable[CustomerColumns], started: datetime
+    ) -> List[SyncChange]:
+        """Records the customers of a finished synchronization and moves the high-water mark
+        to when it started.
+
+        Returns:
+            List[SyncChange]: Customers inserted or changed
+        """
+        changes = [change for part in parts for change in self.diff(part)]
+        self.high_water_mark = started
+        return changes
+
+
+def content_hash(values: Iterable) -> str:
+    """Returns a short digest of the values of a customer"""
+    content = "\x1f".join(map(str, values)).encode()
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+def window_bounds(start: datetime, end: datetime) -> Window:
+    """Returns the window from `start` to `end`, widened to whole seconds"""
+    return (
+        datetime.fromtimestamp(math.floor(start.timestamp())),
+        datetime.fromtimestamp(math.ceil(end.timestamp())),
+    )
+
+
+def bisect_window(window: Window) -> List[Window] | None:
+    """Splits a window of whole seconds in two, or returns None if it holds at most one
+    second.
+
+    The API filters are exclusive, so the window (a, c) holds the customers created from a
+    second after a up to a second before c: (a, a + 2) holds a single second. The halves
+    (a, m) and (m - 1, c) hold every second of the window once.
+    """
+    start, end = (int(bound.timestamp()) for bound in window)
+    seconds = end - start - 1
+    if seconds <= 1:
+        return None
+    middle = (start + end + 1) // 2
+    return [
+        (window[0], datetime.fromtimestamp(middle)),
+        (datetime.fromtimestamp(middle - 1), window[1]),
+    ]
+
+
+def split_probes(
+    results: Iterable[Tuple[Window, CustomerColumns | List[Window]] | Exception],
+) -> Tuple[List[Tuple[Window, CustomerColumns]], List[Window]]:
+    """Sorts the results of probing windows into the customers of the windows that were
+    fetched and the windows to probe next. Raises the first failed probe."""
+    fetched, windows = [], []
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+        window, outcome = result
+        if isinstance(outcome, CustomerColumns):
+            fetched.append((window, outcome))
+        else:
+            windows.extend(outcome)
+    return fetched, windows
+
+
+def merge_windows(fetched: List[Tuple[Window, CustomerColumns]]) -> CustomerColumns:
+    """Joins the customers of every window in creation date order, each customer once"""
+    fetched.sort(key=lambda item: item[0][0])
+    columns = CustomerColumns.concat(part for _, part in fetched)
+    seen = set()
+    unique = []
+    for customer_id in columns.columns["id"]:
+        unique.append(customer_id not in seen)
+        seen.add(customer_id)
+    if all(unique):
+        return columns
+    return columns.filter(unique)
+
+
+def window_filters(window: Window, filters: dict) -> dict:
+    """Returns the search criteria of a window: `filters` and its creation dates"""
+    start, end = window
+    return {**filters, "creation_date_start": start, "creation_date_end": end}
+
+
+def probe_outcome(
+    window: Window, first_page: CustomerColumns
+) -> CustomerColumns | List[Window] | None:
+    """Decides what follows the search of the first page of a window.
+
+    Returns:
+        CustomerColumns | List[Window] | None: The customers of the window if the page holds
+        them all, else the halves of the window if it can be split, else None, as its
+        remaining pages must be fetched
+    """
+    if first_page.db_records <= len(first_page):
+        return first_page
+    return bisect_window(window)
+
+
+class RangeSearch:
+    """Windows of a date range left to search, and the customers of the windows fetched.
+
+    The clients search the windows of `jobs` concurrently and pass the results to `add`,
+    until no window is left.
+    """
+
+    def __init__(
+        self, start: datetime, end: datetime, records: int, filters: dict
+    ) -> None:
+        """Range search constructor.
+
+        Args:
+            start (datetime): Customers created after this date are fetched.
+            end (datetime): Customers created before this date are fetched.
+            records (int): Number of records fetched per page.
+            filters (dict): Search criteria, except the creation dates.
+        """
+        self.records = records
+        self.filters = filters
+        self.windows = [window_bounds(start, end)]
+        self.fetched: List[Tuple[Window, CustomerColumns]] = []
+
+    def jobs(self) -> List[Tuple[Window, int, dict]]:
+        """Returns the window, records per page and search criteria of each window left"""
+        return [
+            (window, self.records, window_filters(window, self.filters))
+            for window in self.windows
+        ]
+
+    def add(
+        self,
+        results: Iterable[Tuple[Window, CustomerColumns | List[Window]] | Exception],
+    ) -> None:
+        """Records the results of probing the windows left. Raises the first failed probe."""
+        fetched, self.windows = split_probes(results)
+        self.fetched.extend(fetched)
+
+    def result(self) -> CustomerColumns:
+        """Returns the customers of every window, each customer once"""
+        return merge_windows(self.fetched)
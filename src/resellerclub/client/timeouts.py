@@ -0,0 +1,143 @@
+"""Request timeouts and deadlines"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, NamedTuple
+
+from ..exceptions import DeadlineExceededException
+
+
+class Timeout(NamedTuple):
+    """Seconds to wait for a connection and for each read of the response"""
+
+    connect: float
+    read: float
+
+
+class Timeouts:
+    """Request timeouts per endpoint.
+
+    Endpoints are matched by the end of their URL, so "domains/available.json" matches the
+    live and test availability check URLs. Unlisted endpoints use the `default` timeout.
+    """
+
+    default_timeouts = {
+        "domains/available.json": Timeout(3.05, 10),
+        "domains/idn-available.json": Timeout(3.05, 10),
+        "domains/thirdlevelname/available.json": Timeout(3.05, 10),
+        "domains/premium/available.json": Timeout(3.05, 20),
+        "domains/v5/suggest-names.json": Timeout(3.05, 10),
+    }
+
+    def __init__(
+        self,
+        default: Timeout = Timeout(10, 120),
+        endpoints: Dict[str, Timeout] = None,
+    ) -> None:
+        """Request timeouts constructor.
+
+        Args:
+            default (Timeout, optional): Timeout of the endpoints not listed in `endpoints`.
+                Defaults to 10 seconds to connect and 120 seconds to read.
+            endpoints (Dict[str, Timeout], optional): Timeout of each endpoint, by endpoint
+                path. Defaults to `default_timeouts`.
+        """
+        self.default = Timeout(*default)
+        self.endpoints = dict(self.default_timeouts if endpoints is None else endpoints)
+        # Longest paths first so "domains/premium/available.json" wins over shorter matches
+        self._paths = sorted(self.endpoints, key=len, reverse=True)
+
+    def get(self, url: str) -> Timeout:
+        """Returns the timeout for an endpoint URL"""
+        for path in self._paths:
+            if url.endswith(f"/{path}"):
+                return self.endpoints[path]
+        return self.default
+
+
+_current_deadline = contextvars.ContextVar("resellerclub_deadline", default=None)
+
+
+class Deadline:
+    """Point in time by which an operation, with all its requests, must finish.
+
+    A deadline never extends the one already in effect: nesting a longer deadline inside a
+    shorter one keeps the shorter one.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        """Deadline constructor.
+
+        Args:
+            seconds (float): Seconds from now until the deadline.
+        """
+        expires_at = time.monotonic() + seconds
+        current = get_deadline()
+        if current is not None:
+            expires_at = min(expires_at, current.expires_at)
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        return f"<Deadline: {self.remaining():.3f}s remaining>"
+
+    def remaining(self) -> float:
+        """Returns the seconds left until the deadline"""
+        return self.expires_at - time.monotonic()
+
+    def check(self) -> float:
+        """Returns the seconds left until the deadline, raising an exception if there are none.
+
+        Raises:
+            DeadlineExceededException: If the deadline has passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededException("Deadline exceeded")
+        return remaining
+
+    @contextmanager
+    def scope(self) -> Iterator["Deadline"]:
+        """Applies the deadline to every request made inside the block"""
+        token = _current_deadline.set(self)
+        try:
+            yield self
+        finally:
+            _current_deadline.reset(token)
+
+    def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Calls `func` with the deadline applied. Useful to carry it to another thread."""
+        with self.scope():
+            return func(*args, **kwargs)
+
+
+def get_deadline() -> Deadline | None:
+    """Returns the deadline in effect, None if there is none"""
+    return _current_deadline.get()
+
+
+def resolve_deadline(seconds: float = None) -> Deadline | None:
+    """Returns a new deadline `seconds` from now, or the one in effect if `seconds` is None"""
+    return get_deadline() if seconds is None else Deadline(seconds)
+
+
+def run_within(limit: Deadline | None, func: Callable, *args, **kwargs) -> Any:
+    """Calls `func` with the deadline applied, if there is one"""
+    if limit is None:
+        return func(*args, **kwargs)
+    return limit.run(func, *args, **kwargs)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """Bounds every request made inside the block, including retries, to finish within
+    `seconds`.
+
+    Args:
+        seconds (float): Seconds from now until the deadline.
+
+    Yields:
+        Deadline: The deadline in effect inside the block
+    """
+    with Deadline(seconds).scope() as current:
+        yield current
@@ -0,0 +1,247 @@
+"""HTTP transport classes"""
+
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Status codes returned when the API is throttling or temporarily failing
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Transport errors that may not happen again if the request is sent again
+TRANSIENT_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    TRANSIENT_EXCEPTIONS += (httpx.TransportError,)
+
+
+def is_api_error(response) -> bool:
+    """Returns True if the response is an error reported by the API itself.
+
+    The API rejects requests such as a lookup of an unknown customer with a 500 status and a
+    {"status": "ERROR"} body. Sending them again gets the same answer, unlike a 500 returned by
+    a failing server. The body of a streamed response must have been read.
+    """
+    if response.status_code != 500:
+        return False
+    try:
+        data = json.loads(response.content)
+    except ValueError:
+        return False
+    return isinstance(data, dict) and str(data.get("status", "")).upper() == "ERROR"
+
+
+class Transport:
+    """Pooled HTTP transport.
+
+    Wraps a ``requests.Session`` so every client sharing a transport reuses the same keep-alive
+    connections instead of doing a new TCP+TLS handshake on each call.
+
+    ``requests.Session`` is not documented as thread-safe. In thread-safe mode, the default,
+    each thread gets its own session, and all of them send through one shared connection pool.
+    Size `pool_maxsize` to the number of threads so they do not open throwaway connections.
+    The concurrent helpers of the clients, such as `export` and `bulk_sign_up`, send requests
+    from worker threads, so only turn it off for a transport used by a single thread.
+    """
+
+    # Keyword used to send the parameters for each request method
+    payload_keywords = {
+        "get": "params",
+        "delete": "params",
+        "post": "data",
+        "put": "data",
+    }
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        thread_safe: bool = True,
+    ) -> None:
+        """Pooled HTTP transport constructor.
+
+        Args:
+            pool_connections (int, optional): Number of per-host connection pools to keep.
+                Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept open per host.
+                Defaults to 10.
+            pool_block (bool, optional): Block until a connection is free when the per-host
+                limit is reached instead of opening a throwaway connection. Defaults to False.
+            keep_alive (bool, optional): Keep connections open between requests.
+                Defaults to True.
+            thread_safe (bool, optional): Use one session per thread, sharing the connection
+                pool, so the transport can be used from several threads. Defaults to True.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.thread_safe = thread_safe
+        self._adapter = self._build_adapter()
+        self._session = self._build_session()
+        self._local = threading.local()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _build_adapter(self) -> HTTPAdapter:
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """Returns the session of the calling thread in thread-safe mode, the shared one
+        otherwise"""
+        if not self.thread_safe:
+            return self._session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._build_session()
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        timeout: float | tuple,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request through the connection pool.
+
+        Args:
+            method (str): Request method. Valid values are get, post, put, delete.
+            url (str): URL to request.
+            params (dict): Parameters to send in the query string or request body.
+            timeout (float | tuple): Seconds to wait for the server before giving up, or a
+                (connect, read) tuple.
+            stream (bool, optional): Return as soon as the headers are received, leaving the
+                body to be read with `iter_content`. Defaults to False.
+
+        Returns:
+            requests.Response: Response returned by the server
+        """
+        func = getattr(self._get_session(), method)
+        payload = {self.payload_keywords[method]: params}
+        return func(url, timeout=timeout, stream=stream, **payload)
+
+    def close(self) -> None:
+        """Close all the pooled connections"""
+        # Every session sends through the same adapter, so this closes the whole pool
+        self._session.close()
+
+
+class AsyncTransport:
+    """Pooled asyncio HTTP transport.
+
+    Wraps an ``httpx.AsyncClient``. Requires the optional ``async`` dependencies:
+    ``pip install resellerclub-python[async]``.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 5.0,
+    ) -> None:
+        """Pooled asyncio HTTP transport constructor.
+
+        Args:
+            max_connections (int, optional): Maximum number of open connections.
+                Defaults to 10.
+            max_keepalive_connections (int, optional): Maximum number of idle connections kept
+                open. Defaults to 10.
+            keepalive_expiry (float, optional): Seconds an idle connection is kept open.
+                Defaults to 5.0.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncTransport requires httpx. "
+                "Install it with: pip install resellerclub-python[async]"
+            )
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client = httpx.AsyncClient(limits=limits)
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @staticmethod
+    def _encode(params: dict) -> dict:
+        """Encode parameters the same way requests does: None values are dropped and booleans
+        are sent as "True"/"False".
+        """
+        return {
+            k: str(v) if isinstance(v, bool) else v
+            for k, v in params.items()
+            if v is not None
+        }
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict,
+        timeout: float | tuple,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """Send a request through the connection pool.
+
+        Args:
+            method (str): Request method. Valid values are get, post, put, delete.
+            url (str): URL to request.
+            params (dict): Parameters to send in the query string or request body.
+            timeout (float | tuple): Seconds to wait for the server before giving up, or a
+                (connect, read) tuple.
+            stream (bool, optional): Return as soon as the headers are received, leaving the
+                body to be read with `aiter_bytes`. Defaults to False.
+
+        Returns:
+            httpx.Response: Response returned by the server
+        """
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        keyword = Transport.payload_keywords[method]
+        payload = {keyword: self._encode(params)}
+        if not stream:
+            return await self._client.request(
+                method.upper(), url, timeout=timeout, **payload
+            )
+        request = self._client.build_request(
+            method.upper(), url, timeout=timeout, **payload
+        )
+        return await self._client.send(request, stream=True)
+
+    async def aclose(self) -> None:
+        """Close all the pooled connections"""
+        await self._client.aclose()
@@ -1,10 +1,49 @@
 """Base URL Classes"""
 
+from types import MappingProxyType
+from typing import Mapping
+
+
+class Endpoint:
+    """Declares an endpoint of a URL group by its path under the group base URL"""
+
+    def __init__(self, path: str, doc: str = None, name: str = None) -> None:
+        """Endpoint declaration
+
+        Args:
+            path (str): Path of the endpoint under the group base URL.
+            doc (str, optional): Description of the endpoint. Defaults to None.
+            name (str, optional): Name reported for the endpoint. Defaults to the attribute
+                name.
+        """
+        self.path = path
+        self.name = name
+        # Set when the endpoint is assigned to a group attribute
+        self.attribute: str = None
+        self.__doc__ = doc
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = name
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, instance, owner: type = None):
+        if instance is None:
+            return self
+        # Groups store their URLs in the instance dict, which takes precedence over this
+        return f"{instance.base_url}{self.path}"
+
 
 class BaseURLs:
-    """URLs base class"""
+    """URLs base class
+
+    Endpoints are declared as `Endpoint` class attributes. Their URLs are built once, when the
+    group is created, and stored as plain attributes. Groups are read-only afterwards.
+    """
 
     base_url = ""
+    # Replaced by the URLs of the instance endpoints in __init__
+    _endpoints: Mapping[str, str] = MappingProxyType({})
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self}>"
@@ -17,6 +56,36 @@ class BaseURLs:
 
         Args:
             base_url (str, optional): Base url for all the endpoints. Defaults to "".
-            response_format (str, optional): Valid values are json or xml. Defaults to "json".
         """
-        self.base_url = f"{base_url}{self.base_url}"
+        base_url = f"{base_url}{self.base_url}"
+        declared = {}
+        for cls in reversed(type(self).__mro__):
+            for value in vars(cls).values():
+                if isinstance(value, Endpoint):
+                    declared[value.attribute] = value
+
+        attributes = {"base_url": base_url}
+        attributes.update(
+            (attribute, f"{base_url}{endpoint.path}")
+            for attribute, endpoint in declared.items()
+        )
+        endpoints = {
+            endpoint.name: attributes[attribute]
+            for attribute, endpoint in declared.items()
+        }
+        attributes["_endpoints"] = MappingProxyType(endpoints)
+        self.__dict__.update(attributes)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def endpoints(self) -> Mapping[str, str]:
+        """Returns the URL of every endpoint, by endpoint name
+
+        Returns:
+            Mapping[str, str]: Endpoint URLs
+        """
+        return self._endpoints
@@ -1,64 +1,35 @@
 """Customers URL endpoints"""
 
-from .base import BaseURLs
+from .base import BaseURLs, Endpoint
 
 
 class CustomersURLs(BaseURLs):
     """Sets up the URLs for the customers endpoints"""
 
-    base_url = "customers"
-
-    @property
-    def signup(self) -> str:
-        """Sign up endpoint"""
-        return f"{self.base_url}/signup.json"
-
-    @property
-    def search(self) -> str:
-        """Search endpoint"""
-        return f"{self.base_url}/search.json"
-
-    @property
-    def details_by_username(self) -> str:
-        """Endpoint to get customer details by username"""
-        return f"{self.base_url}/details.json"
-
-    @property
-    def details_by_id(self) -> str:
-        """Endpoint to get customer details by ID"""
-        return f"{self.base_url}/details-by-id.json"
-
-    @property
-    def modify(self) -> str:
-        """Endpoint to modify customer details"""
-        return f"{self.base_url}/modify.json"
-
-    @property
-    def generate_token(self) -> str:
-        """Endpoint to generate a token for a customer"""
-        return f"{self.base_url}/generate-token.json"
-
-    @property
-    def generate_login_token(self) -> str:
-        """Endpoint to generate a login token for a customer"""
-        return f"{self.base_url}/generate-login-token.json"
-
-    @property
-    def authenticate_token(self) -> str:
-        """Endpoint to authenticate a token for a customer"""
-        return f"{self.base_url}/authenticate-token.json"
-
-    @property
-    def change_password(self) -> str:
-        """Endpoint to change a customer's password"""
-        return f"{self.base_url}/change-password.json"
-
-    @property
-    def forgot_password(self) -> str:
-        """Endpoint to change a customer's password"""
-        return f"{self.base_url}/forgot-password.json"
-
-    @property
-    def delete(self) -> str:
-        """Endpoint to delete a customer"""
-        return f"{self.base_url}/delete.json"
+    base_url = "customers/"
+
+    signup = Endpoint("signup.json", "Sign up endpoint")
+    search = Endpoint("search.json", "Search endpoint")
+    details_by_username = Endpoint(
+        "details.json", "Endpoint to get customer details by username"
+    )
+    details_by_id = Endpoint(
+        "details-by-id.json", "Endpoint to get customer details by ID"
+    )
+    modify = Endpoint("modify.json", "Endpoint to modify customer details")
+    generate_token = Endpoint(
+        "generate-token.json", "Endpoint to generate a token for a customer"
+    )
+    generate_login_token = Endpoint(
+        "generate-login-token.json", "Endpoint to generate a login token for a customer"
+    )
+    authenticate_token = Endpoint(
+        "authenticate-token.json", "Endpoint to authenticate a token for a customer"
+    )
+    change_password = Endpoint(
+        "change-password.json", "Endpoint to change a customer's password"
+    )
+    forgot_password = Endpoint(
+        "forgot-password.json", "Endpoint to change a customer's password"
+    )
+    delete = Endpoint("delete.json", "Endpoint to delete a customer")
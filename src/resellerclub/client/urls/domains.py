@@ -1,7 +1,7 @@
 """Domains URL endpoints"""
 from typing import Literal
 
-from .base import BaseURLs
+from .base import BaseURLs, Endpoint
 
 
 class DomainsURLs(BaseURLs):
@@ -9,6 +9,32 @@ class DomainsURLs(BaseURLs):
 
     base_url = "domains/"
 
+    availability_check = Endpoint("available.json", "Domain availability check")
+    idn_availability_check = Endpoint(
+        "idn-available.json",
+        "Internationalized Domain Name availability check",
+        name="availability_check.idn",
+    )
+    premium_availability_check = Endpoint(
+        "premium/available.json",
+        "Premium Domain Availability check",
+        name="availability_check.premium",
+    )
+    third_level_name_availability_check = Endpoint(
+        "thirdlevelname/available.json",
+        "3rd level .NAME availability check",
+        name="availability_check.3rd_level_dotname",
+    )
+    name_suggestion = Endpoint("v5/suggest-names.json", "Domain name suggestion")
+
+    # Availability check endpoint attribute by domain type
+    availability_check_types = {
+        None: "availability_check",
+        "idn": "idn_availability_check",
+        "premium": "premium_availability_check",
+        "3rd_level_dotname": "third_level_name_availability_check",
+    }
+
     def get_availability_check_url(
         self, domain_type: Literal["idn", "premium", "3rd_level_dotname"] = None
     ) -> str:
@@ -25,14 +51,8 @@ class DomainsURLs(BaseURLs):
         Returns:
             str: API endpoint URL
         """
-
-        url_map = {
-            "idn": f"{self.base_url}idn-available.json",
-            "premium": f"{self.base_url}premium/available.json",
-            "3rd_level_dotname": f"{self.base_url}thirdlevelname/available.json",
-        }
-
-        return url_map.get(domain_type, f"{self.base_url}available.json")
+        attribute = self.availability_check_types.get(domain_type, "availability_check")
+        return self.__dict__[attribute]
 
     def get_name_suggestion_url(self) -> str:
         """Returns URL for domain name suggestion
@@ -40,4 +60,4 @@ class DomainsURLs(BaseURLs):
         Returns:
             str: API endpoint URL
         """
-        return f"{self.base_url}v5/suggest-names.json"
+        return self.name_suggestion
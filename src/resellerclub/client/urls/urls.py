@@ -1,5 +1,8 @@
 """ResellerClub API URLs"""
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
 
 from .base import BaseURLs
 from .domains import DomainsURLs
@@ -7,21 +10,69 @@ from .customers import CustomersURLs
 
 
 class URLs(BaseURLs):
-    """Stores all API URLs"""
+    """Stores all API URLs
+
+    Endpoint groups are declared in `groups`, by attribute name. To add a group, subclass URLs
+    and extend `groups`.
+    """
 
     prod_url = "https://httpapi.com/api/"
     test_url = "https://test.httpapi.com/api/"
 
+    groups: Dict[str, Type[BaseURLs]] = {
+        "domains": DomainsURLs,
+        "customers": CustomersURLs,
+    }
+
+    domains: DomainsURLs
+    customers: CustomersURLs
+    # Replaced by the endpoint name of each URL in __init__
+    _endpoint_names: Mapping[str, str] = MappingProxyType({})
+
     def __init__(self, test_mode: bool = True) -> None:
         """Stores all API URLs
 
         Args:
-            debug (bool, optional): Use the test or live API URLs. Defaults to True.
-            response_format (str, optional): Valid values are json or xml. Defaults to "json".
+            test_mode (bool, optional): Use the test or live API URLs. Defaults to True.
         """
         base_url = self.test_url if test_mode else self.prod_url
         super().__init__(base_url)
 
-        # Domains urls
-        self.domains = DomainsURLs(self.base_url)
-        self.customers = CustomersURLs(self.base_url)
+        groups = {name: group(self.base_url) for name, group in self.groups.items()}
+        endpoint_names = {
+            url: f"{group_name}.{name}"
+            for group_name, group in groups.items()
+            for name, url in group.endpoints().items()
+        }
+        self.__dict__.update(groups, _endpoint_names=MappingProxyType(endpoint_names))
+
+    @classmethod
+    def shared(cls, test_mode: bool = True) -> "URLs":
+        """Returns the URLs of the test or live API, built once and shared by every client
+
+        Args:
+            test_mode (bool, optional): Use the test or live API URLs. Defaults to True.
+
+        Returns:
+            URLs: Shared, read-only URLs
+        """
+        return _shared_urls(cls, bool(test_mode))
+
+    def get_endpoint_name(self, url: str) -> str:
+        """Returns the name of an endpoint from its URL, e.g. "customers.search"
+
+        Args:
+            url (str): Endpoint URL
+
+        Returns:
+            str: Endpoint name, or the URL path if the endpoint is unknown
+        """
+        name = self._endpoint_names.get(url)
+        if name is None:
+            name = url.removeprefix(self.base_url)
+        return name
+
+
+@lru_cache(maxsize=None)
+def _shared_urls(cls: Type[URLs], test_mode: bool) -> URLs:
+    return cls(test_mode)
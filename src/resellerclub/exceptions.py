@@ -3,3 +3,21 @@
 
 class ResellerClubAPIException(Exception):
     """Reseller Club API Exception"""
+
+
+class DeadlineExceededException(ResellerClubAPIException):
+    """Raised when a request cannot be completed before the deadline in effect"""
+
+
+class ValidationError(ValueError):
+    """Raised when request data is rejected locally, before calling the API"""
+
+    def __init__(self, errors: dict) -> None:
+        """Validation error constructor.
+
+        Args:
+            errors (dict): Problem found in each invalid field, by field name.
+        """
+        self.errors = errors
+        problems = "; ".join(f"{name} {problem}" for name, problem in errors.items())
+        super().__init__(f"Invalid fields: {problems}")
@@ -1,9 +1,13 @@
 """Customer models"""
 
+import re
 import typing as t
 from dataclasses import dataclass
 from datetime import datetime
 
+from ..exceptions import ValidationError
+from .countries import CALLING_CODES, COUNTRY_CODES
+
 
 class Address(t.NamedTuple):
     """
@@ -32,12 +36,13 @@ class Address(t.NamedTuple):
     line3: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseCustomer:
     """
     Base class for Customer objects.
 
-    Contains the common fields for customer objects.
+    Contains the common fields for customer objects. Customer classes use `__slots__` so that
+    large numbers of them can be held in memory.
     """
 
     username: str
@@ -80,6 +85,16 @@ class CustomerPhones(t.NamedTuple):
 class NewCustomer(BaseCustomer):
     """NewCustomer class"""
 
+    __slots__ = (
+        "password",
+        "phones",
+        "language_code",
+        "sms_consent",
+        "vat_number",
+        "accept_policy",
+        "marketing_consent",
+    )
+
     def __init__(
         self,
         username: str,
@@ -162,10 +177,31 @@ class Customer(BaseCustomer):
         creation_date (datetime): The creation date of the customer.
         sales_contact_id (str): The ID of the sales contact associated with the customer.
 
+    The address, phones, two-factor authentication status and creation date are built on first
+    access. They can be given as plain tuples of their fields, and the creation date as a
+    timestamp, to skip building them for records that never use them.
+
     Returns:
         Customer: A Customer object.
     """
 
+    __slots__ = (
+        "reseller_id",
+        "status",
+        "total_receipts",
+        "website_count",
+        "language_preference",
+        "pin",
+        "is_password_expired",
+        "user_email",
+        "sales_contact_id",
+        "sales_representative",
+        "_address",
+        "_phones",
+        "_two_factor_auth",
+        "_creation_date",
+    )
+
     def __init__(
         self,
         _id: str,
@@ -204,6 +240,56 @@ class Customer(BaseCustomer):
         self.sales_contact_id = sales_contact_id
         self.sales_representative = sales_representative
 
+    @property
+    def address(self) -> Address:
+        """Address of the Customer"""
+        address = self._address
+        if type(address) is tuple:  # pylint: disable=unidiomatic-typecheck
+            address = self._address = Address(*address)
+        return address
+
+    @address.setter
+    def address(self, value: Address) -> None:
+        self._address = value
+
+    @property
+    def phones(self) -> CustomerPhones:
+        """Phones of the Customer"""
+        phones = self._phones
+        if type(phones) is tuple:  # pylint: disable=unidiomatic-typecheck
+            phones = self._phones = CustomerPhones(*phones)
+        return phones
+
+    @phones.setter
+    def phones(self, value: CustomerPhones) -> None:
+        self._phones = value
+
+    @property
+    def two_factor_auth(self) -> TwoFactorAuth | None:
+        """Two-factor authentication status of the Customer"""
+        two_factor_auth = self._two_factor_auth
+        if type(two_factor_auth) is tuple:  # pylint: disable=unidiomatic-typecheck
+            two_factor_auth = TwoFactorAuth(*map(bool, two_factor_auth))
+            self._two_factor_auth = two_factor_auth
+        return two_factor_auth
+
+    @two_factor_auth.setter
+    def two_factor_auth(self, value: TwoFactorAuth) -> None:
+        self._two_factor_auth = value
+
+    @property
+    def creation_date(self) -> datetime | None:
+        """Creation date of the Customer"""
+        creation_date = self._creation_date
+        if isinstance(creation_date, (int, str)):
+            creation_date = datetime.fromtimestamp(int(creation_date))
+            self._creation_date = creation_date
+        return creation_date
+
+    @creation_date.setter
+    def creation_date(self, value: datetime) -> None:
+        self._creation_date = value
+
     @classmethod
     def from_search(cls, data: dict):
         """
@@ -215,29 +301,19 @@ class Customer(BaseCustomer):
         Returns:
             Customer: A Customer object.
         """
-        customer_data = {k.split(".")[1]: v for k, v in data.items()}
-        address = Address(
-            line1=None,
-            city=customer_data["city"],
-            state=None,
-            country=customer_data["country"],
-            zip_code=None,
-            other_state=None,
-        )
-        phones = CustomerPhones(
-            phone_country_code=customer_data["telnocc"], phone=customer_data["telno"]
-        )
+        # line1, city, state, country, zip_code
+        address = (None, data["customer.city"], None, data["customer.country"], None)
         return cls(
-            _id=customer_data["customerid"],
-            username=customer_data["username"],
-            reseller_id=customer_data["resellerid"],
-            name=customer_data["name"],
-            company=customer_data["company"],
+            _id=data["customer.customerid"],
+            username=data["customer.username"],
+            reseller_id=data["customer.resellerid"],
+            name=data["customer.name"],
+            company=data["customer.company"],
             address=address,
-            status=customer_data["customerstatus"],
-            total_receipts=float(customer_data["totalreceipts"]),
-            phones=phones,
-            website_count=int(customer_data["websitecount"]),
+            status=data["customer.customerstatus"],
+            total_receipts=float(data["customer.totalreceipts"]),
+            phones=(data["customer.telnocc"], data["customer.telno"]),
+            website_count=int(data["customer.websitecount"]),
         )
 
     @classmethod
@@ -251,38 +327,27 @@ class Customer(BaseCustomer):
         Returns:
             Customer: A Customer object.
         """
-        address = Address(
-            line1=data["address1"],
-            city=data["city"],
-            state=data["state"],
-            country=data["country"],
-            zip_code=data["zip"],
-            other_state=data["other_state"],
-            line2=data.get("address2"),
-            line3=data.get("address3"),
-        )
-        two_factor_auth = TwoFactorAuth(
-            is_sms_enabled=bool(data["twofactorsmsauth_enabled"]),
-            is_google_enabled=bool(data["twofactorgoogleauth_enabled"]),
-            is_2fa_enabled=bool(data["twofactorauth_enabled"]),
+        two_factor_auth = (
+            data["twofactorsmsauth_enabled"],
+            data["twofactorgoogleauth_enabled"],
+            data["twofactorauth_enabled"],
         )
-        phones = CustomerPhones(phone_country_code=data["telnocc"], phone=data["telno"])
         return cls(
             _id=data["customerid"],
             username=data["username"],
             reseller_id=data["resellerid"],
             name=data["name"],
             company=data["company"],
-            address=address,
+            address=_account_address(data),
             total_receipts=float(data["totalreceipts"]),
-            phones=phones,
+            phones=(data["telnocc"], data["telno"]),
             status=data["customerstatus"],
             language_preference=data["langpref"],
             two_factor_auth=two_factor_auth,
             pin=data["pin"],
             is_password_expired=bool(data["ispasswdexpired"]),
             user_email=data["useremail"],
-            creation_date=datetime.fromtimestamp(int(data["creationdt"])),
+            creation_date=data["creationdt"],
             sales_contact_id=data["salescontactid"],
         )
 
@@ -297,32 +362,176 @@ class Customer(BaseCustomer):
         Returns:
             Customer: A Customer object
         """
-        address = Address(
-            line1=data["address1"],
-            city=data["city"],
-            state=data["state"],
-            country=data["country"],
-            zip_code=data["zip"],
-            other_state=data["other_state"],
-            line2=data.get("address2"),
-            line3=data.get("address3"),
-        )
-        phones = CustomerPhones(phone_country_code=data["telnocc"], phone=data["telno"])
         return cls(
             _id=data["customerid"],
             username=data["username"],
             reseller_id=data["resellerid"],
             name=data["name"],
             company=data["company"],
-            address=address,
+            address=_account_address(data),
             total_receipts=float(data["totalreceipts"]),
-            phones=phones,
+            phones=(data["telnocc"], data["telno"]),
             status=data["customerstatus"],
             language_preference=data["langpref"],
             pin=data["pin"],
             is_password_expired=bool(data["ispasswdexpired"]),
             user_email=data["useremail"],
-            creation_date=datetime.fromtimestamp(int(data["creationdt"])),
+            creation_date=data["creationdt"],
             sales_contact_id=data["salescontactid"],
             sales_representative=data["salesrepresentative"],
         )
+
+
+def _account_address(data: dict) -> tuple:
+    """Returns the raw address of a customer details or authentication response"""
+    return (
+        data["address1"],
+        data["city"],
+        data["state"],
+        data["country"],
+        data["zip"],
+        data["other_state"],
+        data.get("address2"),
+        data.get("address3"),
+    )
+
+
+class Rule(t.NamedTuple):
+    """
+    Validation rule of a model field.
+
+    Args:
+        field (str): Name of the field
+        test (Callable[[str], Any], optional): Called with the field value as a string, returns
+            a false value if it is invalid. Defaults to None, which only checks it is given.
+        problem (str, optional): Description of an invalid value. Defaults to None.
+        required (bool, optional): The field must have a value. Defaults to True.
+    """
+
+    field: str
+    test: t.Callable[[str], t.Any] = None
+    problem: str = None
+    required: bool = True
+
+
+# State to give when the address has none, together with `other_state`
+STATE_NOT_APPLICABLE = "Not Applicable"
+
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s.]+")
+PHONE_PATTERN = re.compile(r"\d{4,15}")
+LANGUAGE_PATTERN = re.compile(r"[a-z]{2}")
+
+_is_country = COUNTRY_CODES.__contains__
+
+
+def _is_calling_code(code: str) -> bool:
+    """The API returns codes with the leading zeros of an international prefix, such as
+    "001", and "0" for customers without one"""
+    code = code.lstrip("0")
+    return not code or code in CALLING_CODES
+
+
+ADDRESS_RULES = (
+    Rule("line1"),
+    Rule("city"),
+    Rule("state"),
+    Rule("country", _is_country, "is not an ISO 3166-1 alpha-2 country code"),
+    Rule("zip_code"),
+)
+
+_CODE_PROBLEM = "is not a phone country code"
+_PHONE_PROBLEM = "is not a phone number"
+
+PHONE_RULES = (
+    Rule("phone_country_code", _is_calling_code, _CODE_PROBLEM),
+    Rule("phone", PHONE_PATTERN.fullmatch, _PHONE_PROBLEM),
+    Rule("alt_phone_country_code", _is_calling_code, _CODE_PROBLEM, required=False),
+    Rule("alt_phone", PHONE_PATTERN.fullmatch, _PHONE_PROBLEM, required=False),
+    Rule("mobile_country_code", _is_calling_code, _CODE_PROBLEM, required=False),
+    Rule("mobile", PHONE_PATTERN.fullmatch, _PHONE_PROBLEM, required=False),
+    Rule("fax_country_code", _is_calling_code, _CODE_PROBLEM, required=False),
+    Rule("fax", PHONE_PATTERN.fullmatch, _PHONE_PROBLEM, required=False),
+)
+
+# Optional numbers and their country codes, given both or neither
+PHONE_PAIRS = (
+    ("alt_phone_country_code", "alt_phone"),
+    ("mobile_country_code", "mobile"),
+    ("fax_country_code", "fax"),
+)
+
+CUSTOMER_RULES = {
+    NewCustomer: (
+        Rule("username", EMAIL_PATTERN.fullmatch, "is not an email address"),
+        Rule("password"),
+        Rule("name"),
+        Rule("company"),
+        Rule("language_code", LANGUAGE_PATTERN.fullmatch, "is not a language code"),
+    ),
+    Customer: (
+        Rule("id"),
+        Rule("username", EMAIL_PATTERN.fullmatch, "is not an email address"),
+        Rule("name"),
+        Rule("company"),
+        Rule(
+            "language_preference",
+            LANGUAGE_PATTERN.fullmatch,
+            "is not a language code",
+        ),
+    ),
+}
+
+
+def check_rules(
+    obj: t.Any, rules: t.Iterable[Rule], prefix: str = ""
+) -> t.Dict[str, str]:
+    """Returns the problem of each field of `obj` breaking its rule, by field name"""
+    errors = {}
+    for rule in rules:
+        value = getattr(obj, rule.field)
+        if value is None or value == "":
+            if rule.required:
+                errors[prefix + rule.field] = "is required"
+        elif rule.test is not None and not rule.test(str(value)):
+            errors[prefix + rule.field] = f"{value!r} {rule.problem}"
+    return errors
+
+
+def address_errors(address: Address, prefix: str = "address.") -> t.Dict[str, str]:
+    """Returns the problems of an address, by field name"""
+    errors = check_rules(address, ADDRESS_RULES, prefix)
+    if address.state == STATE_NOT_APPLICABLE and not address.other_state:
+        errors[f"{prefix}other_state"] = f"is required when state is {address.state}"
+    return errors
+
+
+def phones_errors(phones: CustomerPhones, prefix: str = "phones.") -> t.Dict[str, str]:
+    """Returns the problems of the phones of a customer, by field name"""
+    errors = check_rules(phones, PHONE_RULES, prefix)
+    for code_field, number_field in PHONE_PAIRS:
+        code, number = getattr(phones, code_field), getattr(phones, number_field)
+        if bool(code) != bool(number):
+            missing, given = (
+                (code_field, number_field) if number else (number_field, code_field)
+            )
+            errors.setdefault(prefix + missing, f"is required with {given}")
+    return errors
+
+
+def validate(customer: NewCustomer | Customer) -> None:
+    """Checks a customer can be signed up or modified, without calling the API.
+
+    Args:
+        customer (NewCustomer | Customer): Customer to check.
+
+    Raises:
+        ValidationError: If any field is missing or invalid, with the problem of each one
+    """
+    rules = next(
+        CUSTOMER_RULES[c] for c in type(customer).__mro__ if c in CUSTOMER_RULES
+    )
+    errors = check_rules(customer, rules)
+    errors.update(address_errors(customer.address))
+    errors.update(phones_errors(customer.phones))
+    if errors:
+        raise ValidationError(errors)
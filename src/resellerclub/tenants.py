@@ -0,0 +1,178 @@
+"""Multi-tenant ResellerClub API Client factories"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+from .client.cache import ResponseCache
+from .client.decoders import Decoder, get_default_decoder
+from .client.instrumentation import RequestHook
+from .client.ratelimit import RateLimiter
+from .client.retry import RetryPolicy
+from .client.timeouts import Timeouts
+from .client.transport import AsyncTransport, Transport
+from .wrapper import AsyncResellerClub, ResellerClub
+
+
+class BaseFactory:
+    """Base class for the multi-tenant client factories.
+
+    Builds one client per reseller account, all of them sharing the factory transport, URLs,
+    cache, retry policy, timeouts, hooks and decoder. Only the credentials and, optionally, the
+    rate limiter belong to each account. Clients are kept in a bounded LRU, so building a
+    client for a known account costs a dict lookup. The factory is thread-safe.
+    """
+
+    client_class = None
+    transport_class = None
+
+    def __init__(
+        self,
+        test_mode: bool = True,
+        transport: Transport | AsyncTransport = None,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+        tenant_rate_limiter: Callable[[str], RateLimiter] = None,
+        retry_policy: RetryPolicy = None,
+        timeouts: Timeouts = None,
+        hooks: List[RequestHook] = None,
+        decoder: Decoder = None,
+        max_clients: int = 1024,
+    ) -> None:
+        """Client factory constructor.
+
+        Args:
+            test_mode (bool, optional): Use the test or live API URLs. Defaults to True.
+            transport (Transport | AsyncTransport, optional): Pooled HTTP transport shared by
+                every account. Defaults to a new transport with the default pool limits.
+            cache (ResponseCache, optional): Cache for domain availability and suggestion
+                responses, shared by every account. Cache keys include the reseller ID.
+                Defaults to None, which disables caching.
+            rate_limiter (RateLimiter, optional): Rate limiter shared by every account.
+                Defaults to None.
+            tenant_rate_limiter (Callable[[str], RateLimiter], optional): Builds the rate
+                limiter of an account from its reseller ID. Limiters are kept in an LRU of
+                the `max_clients` most recently used accounts, so an account keeps its limiter
+                as long as it has a client in the factory. Defaults to None.
+            retry_policy (RetryPolicy, optional): Retry policy shared by every account.
+                Defaults to None, which disables retries.
+            timeouts (Timeouts, optional): Request timeouts per endpoint.
+                Defaults to Timeouts with the default endpoint timeouts.
+            hooks (List[RequestHook], optional): Hooks called around every request.
+                Defaults to None.
+            decoder (Decoder, optional): Callable decoding the JSON response bytes.
+                Defaults to orjson if installed, the standard library otherwise.
+            max_clients (int, optional): Maximum number of clients kept. The least recently
+                used client is dropped beyond it, and rebuilt if needed. Defaults to 1024.
+        """
+        if rate_limiter is not None and tenant_rate_limiter is not None:
+            raise ValueError(
+                "Pass either rate_limiter or tenant_rate_limiter, not both"
+            )
+        self.test_mode = test_mode
+        self.transport = transport or self.transport_class()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.tenant_rate_limiter = tenant_rate_limiter
+        self.retry_policy = retry_policy
+        self.timeouts = timeouts or Timeouts()
+        self.hooks = list(hooks or ())
+        self.decoder = decoder or get_default_decoder()
+        self.max_clients = max_clients
+        self._clients: OrderedDict[Tuple[str, str], ResellerClub] = OrderedDict()
+        self._rate_limiters: OrderedDict[str, RateLimiter] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _get_rate_limiter(self, auth_userid: str) -> RateLimiter | None:
+        if self.tenant_rate_limiter is None:
+            return self.rate_limiter
+        limiter = self._rate_limiters.get(auth_userid)
+        if limiter is not None:
+            self._rate_limiters.move_to_end(auth_userid)
+            return limiter
+        limiter = self._rate_limiters[auth_userid] = self.tenant_rate_limiter(
+            auth_userid
+        )
+        if len(self._rate_limiters) > self.max_clients:
+            self._rate_limiters.popitem(last=False)
+        return limiter
+
+    def _build(
+        self, auth_userid: str, api_key: str
+    ) -> ResellerClub | AsyncResellerClub:
+        return self.client_class(
+            auth_userid,
+            api_key,
+            self.test_mode,
+            transport=self.transport,
+            cache=self.cache,
+            rate_limiter=self._get_rate_limiter(auth_userid),
+            retry_policy=self.retry_policy,
+            timeouts=self.timeouts,
+            hooks=self.hooks,
+            decoder=self.decoder,
+        )
+
+    def get(self, auth_userid: str, api_key: str) -> ResellerClub | AsyncResellerClub:
+        """Returns the client of a reseller account.
+
+        Args:
+            auth_userid (str): Reseller ID
+            api_key (str): API key
+
+        Returns:
+            ResellerClub | AsyncResellerClub: Client using the account credentials and the
+            shared resources
+        """
+        key = (auth_userid, api_key)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                # Used as recently as its clients, so never dropped before them
+                if auth_userid in self._rate_limiters:
+                    self._rate_limiters.move_to_end(auth_userid)
+                return client
+            client = self._clients[key] = self._build(auth_userid, api_key)
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+
+class ResellerClubFactory(BaseFactory):
+    """Builds ResellerClub clients for many reseller accounts sharing one connection pool"""
+
+    client_class = ResellerClub
+    # Thread-safe by default, as the clients are shared by every thread using the factory
+    transport_class = Transport
+
+    def __enter__(self) -> "ResellerClubFactory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections shared by every account"""
+        self.transport.close()
+
+
+class AsyncResellerClubFactory(BaseFactory):
+    """Builds AsyncResellerClub clients for many reseller accounts sharing one connection
+    pool"""
+
+    client_class = AsyncResellerClub
+    transport_class = AsyncTransport
+
+    async def __aenter__(self) -> "AsyncResellerClubFactory":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections shared by every account"""
+        await self.transport.aclose()
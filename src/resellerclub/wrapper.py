@@ -1,18 +1,180 @@
 """ResellerClub API Client"""
 
+from typing import List
+
+from .client.aio import AsyncCustomersClient, AsyncDomainsClient
+from .client.cache import ResponseCache
 from .client.customers import CustomersClient
+from .client.decoders import Decoder
 from .client.domains import DomainsClient
+from .client.instrumentation import RequestHook
+from .client.ratelimit import RateLimiter
+from .client.retry import RetryPolicy
+from .client.timeouts import Timeouts
+from .client.transport import AsyncTransport, Transport
 
 
 class ResellerClub:
-    """ResellerClub API Client"""
+    """ResellerClub API Client
+
+    With the default thread-safe Transport, one instance can be shared by any number of
+    threads. The connection pool, response cache, rate limiters, retry policies and
+    metrics collectors synchronize their own state, and the clients, URLs and timeouts are not
+    modified after construction.
+    """
+
+    def __init__(
+        self,
+        auth_userid: str,
+        api_key: str,
+        test_mode: bool = True,
+        transport: Transport = None,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        timeouts: Timeouts = None,
+        hooks: List[RequestHook] = None,
+        decoder: Decoder = None,
+        thread_safe: bool = True,
+    ) -> None:
+        """ResellerClub API Client constructor.
+
+        Args:
+            auth_userid (str): Reseller ID
+            api_key (str): API key
+            test_mode (bool, optional): Use the test or live API URLs. Defaults to True.
+            transport (Transport, optional): Pooled HTTP transport shared by all the clients.
+                Defaults to a new Transport with the default pool limits.
+            cache (ResponseCache, optional): Cache for domain availability and suggestion
+                responses. Defaults to None, which disables caching.
+            rate_limiter (RateLimiter, optional): Rate limiter shared by all the clients.
+                Defaults to None, which disables rate limiting.
+            retry_policy (RetryPolicy, optional): Retry policy for idempotent requests, shared
+                by all the clients. Defaults to None, which disables retries.
+            timeouts (Timeouts, optional): Request timeouts per endpoint.
+                Defaults to Timeouts with the default endpoint timeouts.
+            hooks (List[RequestHook], optional): Hooks called around every request, e.g. a
+                MetricsCollector. Defaults to None.
+            decoder (Decoder, optional): Callable decoding the JSON response bytes.
+                Defaults to orjson if installed, the standard library otherwise.
+            thread_safe (bool, optional): Build the default transport in thread-safe mode, to
+                share the client between threads and use its concurrent helpers. Ignored if
+                `transport` is given. Defaults to True.
+        """
+        self.transport = transport or Transport(thread_safe=thread_safe)
+        self._owns_transport = transport is None
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.domains = DomainsClient(
+            auth_userid,
+            api_key,
+            test_mode,
+            transport=self.transport,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeouts=timeouts,
+            hooks=hooks,
+            decoder=decoder,
+        )
+        self.customers = CustomersClient(
+            auth_userid,
+            api_key,
+            test_mode,
+            transport=self.transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeouts=timeouts,
+            hooks=hooks,
+            decoder=decoder,
+        )
+
+    def __enter__(self) -> "ResellerClub":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections. A transport passed to the constructor, such as the
+        one of a ResellerClubFactory, is left open for its owner to close."""
+        if self._owns_transport:
+            self.transport.close()
+
+
+class AsyncResellerClub:
+    """Asyncio ResellerClub API Client"""
 
     def __init__(
         self,
         auth_userid: str,
         api_key: str,
         test_mode: bool = True,
+        transport: AsyncTransport = None,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        timeouts: Timeouts = None,
+        hooks: List[RequestHook] = None,
+        decoder: Decoder = None,
     ) -> None:
+        """Asyncio ResellerClub API Client constructor.
+
+        Args:
+            auth_userid (str): Reseller ID
+            api_key (str): API key
+            test_mode (bool, optional): Use the test or live API URLs. Defaults to True.
+            transport (AsyncTransport, optional): Pooled asyncio HTTP transport shared by all the
+                clients. Defaults to a new AsyncTransport with the default pool limits.
+            cache (ResponseCache, optional): Cache for domain availability and suggestion
+                responses. Defaults to None, which disables caching.
+            rate_limiter (RateLimiter, optional): Rate limiter shared by all the clients.
+                Defaults to None, which disables rate limiting.
+            retry_policy (RetryPolicy, optional): Retry policy for idempotent requests, shared
+                by all the clients. Defaults to None, which disables retries.
+            timeouts (Timeouts, optional): Request timeouts per endpoint.
+                Defaults to Timeouts with the default endpoint timeouts.
+            hooks (List[RequestHook], optional): Hooks called around every request, e.g. a
+                MetricsCollector. Defaults to None.
+            decoder (Decoder, optional): Callable decoding the JSON response bytes.
+                Defaults to orjson if installed, the standard library otherwise.
+        """
+        self.transport = transport or AsyncTransport()
+        self._owns_transport = transport is None
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.domains = AsyncDomainsClient(
+            auth_userid,
+            api_key,
+            test_mode,
+            transport=self.transport,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeouts=timeouts,
+            hooks=hooks,
+            decoder=decoder,
+        )
+        self.customers = AsyncCustomersClient(
+            auth_userid,
+            api_key,
+            test_mode,
+            transport=self.transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeouts=timeouts,
+            hooks=hooks,
+            decoder=decoder,
+        )
+
+    async def __aenter__(self) -> "AsyncResellerClub":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
-        self.domains = DomainsClient(auth_userid, api_key, test_mode)
-        self.customers = CustomersClient(auth_userid, api_key, test_mode)
+    async def aclose(self) -> None:
+        """Close the pooled connections. A transport passed to the constructor, such as the
+        one of an AsyncResellerClubFactory, is left open for its owner to close."""
+        if self._owns_transport:
+            await self.transport.aclose()
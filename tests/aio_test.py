@@ -0,0 +1,331 @@
+"""Asyncio Clients Unit Tests"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.resellerclub import AsyncResellerClub
+from src.resellerclub.client.aio import AsyncCustomersClient, AsyncDomainsClient
+from src.resellerclub.client.customers import CustomersClient
+from src.resellerclub.client.domains import DomainsClient
+from src.resellerclub.client.retry import RetryPolicy
+from src.resellerclub.client.snapshot import CustomerSnapshot
+from src.resellerclub.client.sync import SyncState
+from src.resellerclub.exceptions import DeadlineExceededException
+from src.resellerclub.models import customer as customer_models
+from src.resellerclub.models import domains as domain_models
+
+from .mocks import MockDatedSearchRequests, MockSearchRequests, new_customer
+
+httpx = pytest.importorskip("httpx")
+
+
+def mock_response(monkeypatch, path: str) -> list:
+    """Patch httpx to answer every request with the given response file.
+
+    Returns:
+        list: Requests sent, as (method, url, kwargs) tuples
+    """
+    with open(path, "rb") as f:
+        content = f.read()
+    sent = []
+
+    async def request(self, method, url, **kwargs):  # pylint: disable=unused-argument
+        sent.append((method, url, kwargs))
+        return httpx.Response(200, content=content)
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", request)
+    return sent
+
+
+class TestAsyncResellerClub:
+    """Asyncio ResellerClub Test Cases"""
+
+    def test_check_availability(self, monkeypatch):
+        """Test awaiting a domain availability check"""
+        sent = mock_response(
+            monkeypatch,
+            "tests/responses/domains/availability/single_domain_multiple_tlds.txt",
+        )
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return await api.domains.check_availability(["github"], ["com", "net"])
+
+        result = asyncio.run(run())
+
+        assert all(isinstance(a, domain_models.Availability) for a in result)
+        assert sorted(a.domain for a in result) == ["github.com", "github.net"]
+        method, _, kwargs = sent[0]
+        assert method == "GET"
+        assert kwargs["params"]["tlds"] == ["com", "net"]
+
+    def test_search_customers(self, monkeypatch):
+        """Test awaiting a customer search"""
+        mock_response(monkeypatch, "tests/responses/customers/customers.txt")
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return await api.customers.search(10, 1)
+
+        result = asyncio.run(run())
+
+        assert result.db_records == 1
+        assert all(isinstance(c, customer_models.Customer) for c in result)
+
+    @pytest.mark.parametrize(
+        "async_client, client",
+        [(AsyncDomainsClient, DomainsClient), (AsyncCustomersClient, CustomersClient)],
+    )
+    def test_sync_methods_not_inherited(self, async_client, client):
+        """Test the async clients inherit no method of the sync clients"""
+        assert not issubclass(async_client, client)
+        for name, method in vars(client).items():
+            if callable(method):
+                assert getattr(async_client, name, None) is not method, name
+
+    def test_delete_customer(self, monkeypatch):
+        """Test awaiting a POST request sends the parameters in the body"""
+        sent = mock_response(
+            monkeypatch, "tests/responses/customers/delete_customer.txt"
+        )
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return await api.customers.delete(customer_id=31068890)
+
+        assert asyncio.run(run()) is True
+        method, _, kwargs = sent[0]
+        assert method == "POST"
+        assert kwargs["data"]["customer-id"] == 31068890
+
+    def test_iter_search(self, monkeypatch):
+        """Test iterating every page of a customer search with prefetching"""
+        mock = MockSearchRequests(total=25)
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return [c async for c in api.customers.iter_search(10, prefetch=True)]
+
+        customers = asyncio.run(run())
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 26)]
+
+    def test_iter_search_deadline_counted_from_call(self, monkeypatch):
+        """Test the deadline of an iteration starts at the call, not at the first item"""
+        mock = MockSearchRequests(total=25)
+        sent = []
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            sent.append(url)
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                customers = api.customers.iter_search(10, deadline=0.01)
+                await asyncio.sleep(0.02)
+                return [c async for c in customers]
+
+        with pytest.raises(DeadlineExceededException):
+            asyncio.run(run())
+        assert not sent
+
+    def test_search_stream(self, monkeypatch):
+        """Test streaming a customer search page"""
+        mock = MockSearchRequests(total=25)
+
+        async def send(self, request, **kwargs):  # pylint: disable=unused-argument
+            assert kwargs["stream"]
+            return httpx.Response(200, json=mock.page(dict(request.url.params)))
+
+        monkeypatch.setattr(httpx.AsyncClient, "send", send)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                stream = api.customers.search_stream(10, 3)
+                return [c async for c in stream], stream.db_records
+
+        customers, db_records = asyncio.run(run())
+
+        assert [c.id for c in customers] == [str(i) for i in range(21, 26)]
+        assert db_records == 25
+
+    def test_export(self, monkeypatch):
+        """Test exporting every page of a customer search concurrently"""
+        mock = MockSearchRequests(total=95)
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return [c async for c in api.customers.export(10, max_workers=4)]
+
+        customers = asyncio.run(run())
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 96)]
+
+    def test_export_retries_failed_pages(self, monkeypatch):
+        """Test a page failing once is retried when the client has no retry policy"""
+        mock = MockSearchRequests(total=95)
+        failed = []
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            if kwargs["params"]["page-no"] == 3 and not failed:
+                failed.append(3)
+                raise httpx.ConnectError("Connection reset")
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+        policy = RetryPolicy(backoff_factor=0)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                pages = api.customers.export(10, max_workers=4, retry_policy=policy)
+                return [c async for c in pages]
+
+        customers = asyncio.run(run())
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 96)]
+        assert failed and policy.stats().retries == 1
+
+    def test_export_columns(self, monkeypatch):
+        """Test exporting every page of a customer search as columns"""
+        mock = MockSearchRequests(total=95)
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return await api.customers.export_columns(10, max_workers=4)
+
+        columns = asyncio.run(run())
+
+        assert columns.columns["id"] == [str(i) for i in range(1, 96)]
+
+    def test_get_many_by_id(self, monkeypatch):
+        """Test searching customers in concurrent batches of IDs"""
+        mock = MockSearchRequests(total=30)
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                return await api.customers.get_many_by_id(range(1, 36), batch_size=10)
+
+        result = asyncio.run(run())
+
+        assert [c.id for c in result] == [str(i) for i in range(1, 31)]
+        assert list(result.errors) == list(range(31, 36))
+
+    def test_bulk_sign_up(self, monkeypatch, tmp_path):
+        """Test signing up customers concurrently with a checkpoint"""
+        signed_up = []
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            signed_up.append(kwargs["data"]["username"])
+            return httpx.Response(200, json=1000 + len(signed_up))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+        checkpoint = tmp_path / "signup.log"
+        customers = [new_customer(f"user{i}@email.com") for i in range(10)]
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                first = [
+                    r
+                    async for r in api.customers.bulk_sign_up(
+                        customers[:6], max_workers=3, checkpoint=checkpoint
+                    )
+                ]
+                second = [
+                    r
+                    async for r in api.customers.bulk_sign_up(
+                        customers, max_workers=3, checkpoint=checkpoint
+                    )
+                ]
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert all(r.ok for r in first + second)
+        assert sorted(signed_up) == sorted(c.username for c in customers)
+        assert sum(r.resumed for r in second) == 6
+
+    def test_snapshot(self, monkeypatch, tmp_path):
+        """Test writing and refreshing a snapshot"""
+        mock = MockSearchRequests(total=45)
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+        path = tmp_path / "customers.snap"
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                written = await api.customers.write_snapshot(path, records=10)
+                mock.total, mock.new = 50, 5
+                return written, await api.customers.refresh_snapshot(path, records=10)
+
+        assert asyncio.run(run()) == (45, 5)
+        with CustomerSnapshot(path) as snapshot:
+            assert snapshot.ids() == [str(i) for i in range(1, 51)]
+
+    def test_sync(self, monkeypatch):
+        """Test synchronizing customers in concurrent creation date windows"""
+        mock = MockDatedSearchRequests(
+            {i: datetime(2024, 1, 1).timestamp() + i * 3600 for i in range(1, 121)}
+        )
+
+        async def request(
+            self, method, url, **kwargs
+        ):  # pylint: disable=unused-argument
+            return httpx.Response(200, json=mock.page(kwargs["params"]))
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+        state = SyncState()
+
+        async def run():
+            async with AsyncResellerClub("reseller", "key") as api:
+                first = await api.customers.sync(state, records=50, max_workers=4)
+                mock.names[3] = "Renamed"
+                second = await api.customers.sync(state, records=50, full=True)
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert sorted(int(c.customer.id) for c in first) == list(range(1, 121))
+        assert [(c.kind, c.customer.id) for c in second] == [("changed", "3")]
@@ -0,0 +1,74 @@
+"""Response Cache Unit Tests"""
+
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client import cache as cache_module
+from src.resellerclub.client.cache import ResponseCache
+
+from .mocks import MockAvailabilityRequests
+
+AVAILABILITY_URL = "https://test.httpapi.com/api/domains/available.json"
+
+
+class TestResponseCache:
+    """Response Cache Test Cases"""
+
+    def test_key_ignores_list_order(self):
+        """Test TLD lists in any order hit the same entry"""
+        cache = ResponseCache()
+        cache.set(AVAILABILITY_URL, {"domain-name": ["a"], "tlds": ["com", "net"]}, 1)
+
+        assert (
+            cache.get(AVAILABILITY_URL, {"tlds": ["net", "com"], "domain-name": ["a"]})
+            == 1
+        )
+        assert cache.stats().hits == 1
+
+    def test_ttl_per_endpoint(self):
+        """Test endpoints are matched by their longest path"""
+        cache = ResponseCache()
+
+        assert cache.get_ttl(AVAILABILITY_URL) == 30
+        assert (
+            cache.get_ttl(AVAILABILITY_URL.replace("available", "premium/available"))
+            == 600
+        )
+        assert (
+            cache.get_ttl("https://test.httpapi.com/api/customers/search.json") is None
+        )
+
+    def test_expired_entries_miss(self, monkeypatch):
+        """Test entries are not returned after their TTL"""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = ResponseCache()
+        cache.set(AVAILABILITY_URL, {"tlds": ["com"]}, 1)
+
+        now[0] += 31
+        assert cache.get(AVAILABILITY_URL, {"tlds": ["com"]}) is None
+        assert cache.stats() == (0, 1, 0, 0)
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when the cache is full"""
+        cache = ResponseCache(max_size=2)
+        cache.set(AVAILABILITY_URL, {"tlds": ["com"]}, 1)
+        cache.set(AVAILABILITY_URL, {"tlds": ["net"]}, 2)
+        cache.get(AVAILABILITY_URL, {"tlds": ["com"]})
+        cache.set(AVAILABILITY_URL, {"tlds": ["org"]}, 3)
+
+        assert cache.get(AVAILABILITY_URL, {"tlds": ["net"]}) is None
+        assert cache.get(AVAILABILITY_URL, {"tlds": ["com"]}) == 1
+        assert cache.stats().evictions == 1
+
+    def test_domains_client_uses_cache(self, monkeypatch):
+        """Test repeated availability checks are answered from the cache"""
+        mock = MockAvailabilityRequests()
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        api = ResellerClub("reseller", "key", cache=ResponseCache())
+
+        first = api.domains.check_availability(["github"], ["com", "net"])
+        second = api.domains.check_availability(["github"], ["net", "com"])
+
+        assert len(mock.calls) == 1
+        assert sorted(first) == sorted(second)
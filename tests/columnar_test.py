@@ -0,0 +1,107 @@
+"""Columnar Results Unit Tests"""
+
+import json
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.columnar import CustomerColumns
+from src.resellerclub.client.customers import parse_search
+
+from .mocks import MockSearchRequests
+
+
+def search_page(total: int = 6) -> dict:
+    """Build a search page with alternating customer statuses"""
+    data = MockSearchRequests(total).page({"no-of-records": total, "page-no": 1})
+    for i, key in enumerate(k for k in data if k not in ("recsonpage", "recsindb")):
+        data[key]["customer.customerstatus"] = "Active" if i % 2 else "Suspended"
+        data[key]["customer.totalreceipts"] = f"{i * 10}.000"
+    return data
+
+
+class TestCustomerColumns:
+    """Customer Columns Test Cases"""
+
+    def test_from_search(self):
+        """Test the columns are filled from the search payload"""
+        columns = CustomerColumns.from_search(search_page())
+
+        assert len(columns) == 6
+        assert (columns.page_records, columns.db_records) == (6, 6)
+        assert columns.columns["id"] == ["1", "2", "3", "4", "5", "6"]
+        assert list(columns.columns["total_receipts"]) == [0, 10, 20, 30, 40, 50]
+
+    def test_rows_match_search(self):
+        """Test indexed rows build the same customers as a regular search"""
+        data = search_page()
+        columns = CustomerColumns.from_search(data)
+        customers = parse_search(data).customers
+
+        assert list(columns) == customers
+        assert columns[2].phones == customers[2].phones
+        assert columns[2].total_receipts == customers[2].total_receipts
+
+    def test_filter_and_group_sum(self):
+        """Test filtering rows and summing a column by group"""
+        columns = CustomerColumns.from_search(search_page())
+
+        active = columns.filter(columns.mask("status", lambda s: s == "Active"))
+
+        assert active.columns["id"] == ["2", "4", "6"]
+        assert columns.group_sum("status", "total_receipts") == {
+            "Suspended": 60.0,
+            "Active": 90.0,
+        }
+        with pytest.raises(ValueError):
+            columns.filter([True])
+
+    def test_slice_and_concat(self):
+        """Test slicing and joining column sets"""
+        columns = CustomerColumns.from_search(search_page())
+
+        joined = CustomerColumns.concat([columns[:2], columns[4:]])
+
+        assert joined.columns["id"] == ["1", "2", "5", "6"]
+        assert joined.db_records == 6
+
+    def test_to_pandas(self):
+        """Test exporting the columns to a DataFrame"""
+        pytest.importorskip("pandas")
+        frame = CustomerColumns.from_search(search_page()).to_pandas()
+
+        assert frame.groupby("status")["total_receipts"].sum().to_dict() == {
+            "Active": 90.0,
+            "Suspended": 60.0,
+        }
+
+
+@pytest.mark.usefixtures("api_class")
+class TestColumnarSearch:
+    """Columnar customer search Test Cases"""
+
+    api: ResellerClub
+
+    def test_search_columns(self, monkeypatch):
+        """Test a search page returned as columns"""
+        with open("tests/responses/customers/customers.txt", "rb") as f:
+            data = json.load(f)
+        mock = MockSearchRequests(total=1)
+        monkeypatch.setattr(mock, "page", lambda params: data)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        columns = self.api.customers.search_columns(10, 1)
+
+        assert columns.columns["id"] == ["24148486"]
+        assert columns[0].name == "Alfredo Altamirano"
+
+    def test_export_columns(self, monkeypatch):
+        """Test every page of a search is joined in page order"""
+        mock = MockSearchRequests(total=95)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        columns = self.api.customers.export_columns(10, max_workers=4)
+
+        assert columns.columns["id"] == [str(i) for i in range(1, 96)]
+        assert columns.db_records == 95
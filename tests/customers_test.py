@@ -1,14 +1,132 @@
 """Customers Unit Tests"""
 
+import json
+import pickle
 import uuid
+from datetime import datetime
 
 import pytest
 import requests
 
 from src.resellerclub import ResellerClub
+from src.resellerclub.client.retry import RetryPolicy
+from src.resellerclub.exceptions import ValidationError
 from src.resellerclub.models import customer as customer_models
 
-from .mocks import MockRequests
+from .mocks import (
+    MockFlakySearchRequests,
+    MockRequests,
+    MockSearchRequests,
+    MockSignUpRequests,
+    new_customer,
+)
+
+
+class TestCustomerModel:
+    """Test the Customer model"""
+
+    @staticmethod
+    def load_details() -> dict:
+        """Load the recorded customer details response"""
+        with open("tests/responses/customers/customer_details.txt", "rb") as f:
+            return json.load(f)
+
+    def test_customers_have_no_instance_dict(self):
+        """Test customers are slotted"""
+        customer = customer_models.Customer.from_details(self.load_details())
+
+        assert not hasattr(customer, "__dict__")
+        with pytest.raises(AttributeError):
+            customer.unknown = 1
+
+    def test_lazy_fields(self):
+        """Test nested objects and the creation date are built on access"""
+        data = self.load_details()
+        customer = customer_models.Customer.from_details(data)
+
+        assert customer.address == customer_models.Address(
+            data["address1"],
+            data["city"],
+            data["state"],
+            data["country"],
+            data["zip"],
+            data["other_state"],
+        )
+        assert customer.phones == customer_models.CustomerPhones(
+            data["telnocc"], data["telno"]
+        )
+        assert isinstance(customer.two_factor_auth, customer_models.TwoFactorAuth)
+        assert customer.creation_date == datetime.fromtimestamp(int(data["creationdt"]))
+        assert customer.address is customer.address
+
+    def test_pickle(self):
+        """Test slotted customers survive a pickle round trip"""
+        customer = customer_models.Customer.from_details(self.load_details())
+        restored = pickle.loads(pickle.dumps(customer))
+
+        assert restored == customer
+        assert restored.creation_date == customer.creation_date
+        assert restored.sales_contact_id == customer.sales_contact_id
+
+
+class TestValidation:
+    """Test the local validation of customers"""
+
+    def test_valid_customers(self):
+        """Test complete customers pass"""
+        with open("tests/responses/customers/customer_details.txt", "rb") as f:
+            details = json.load(f)
+
+        customer_models.validate(new_customer("email@email.com"))
+        customer_models.validate(customer_models.Customer.from_details(details))
+
+    @pytest.mark.parametrize(
+        "changes, field",
+        [
+            ({"username": "email.email.com"}, "username"),
+            ({"password": ""}, "password"),
+            ({"language_code": "english"}, "language_code"),
+            ({"address": {"country": "XX"}}, "address.country"),
+            ({"address": {"country": "mx"}}, "address.country"),
+            ({"address": {"state": "Not Applicable"}}, "address.other_state"),
+            ({"address": {"city": None}}, "address.city"),
+            ({"phones": {"phone_country_code": "+52"}}, "phones.phone_country_code"),
+            ({"phones": {"phone_country_code": "999"}}, "phones.phone_country_code"),
+            ({"phones": {"phone": "55-1234"}}, "phones.phone"),
+            ({"phones": {"mobile": "5512345678"}}, "phones.mobile_country_code"),
+            ({"phones": {"fax_country_code": "52"}}, "phones.fax"),
+        ],
+    )
+    def test_invalid_fields(self, changes, field):
+        """Test each invalid field is reported"""
+        customer = new_customer("email@email.com")
+        for name, value in changes.items():
+            if isinstance(value, dict):
+                value = getattr(customer, name)._replace(**value)
+            setattr(customer, name, value)
+
+        with pytest.raises(ValidationError) as error:
+            customer_models.validate(customer)
+
+        assert list(error.value.errors) == [field]
+        assert field in str(error.value)
+
+    @pytest.mark.parametrize("code", ["1", "001", "0"])
+    def test_calling_codes_returned_by_the_api(self, code):
+        """Test calling codes with leading zeros, or 0 for none, pass as the API returns them"""
+        customer = new_customer("email@email.com")
+        customer.phones = customer.phones._replace(phone_country_code=code)
+
+        customer_models.validate(customer)
+
+    def test_other_state(self):
+        """Test addresses without a state pass with other_state"""
+        customer = new_customer("email@email.com")
+        customer.address = customer.address._replace(
+            state="Not Applicable", other_state="Region"
+        )
+
+        customer_models.validate(customer)
 
 
 @pytest.mark.usefixtures("api_class")
@@ -22,7 +140,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/sign_up.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "post", mock.post)
+        monkeypatch.setattr(requests.Session, "post", mock.post)
 
         new_customer = customer_models.NewCustomer(
             username="email@email.com",
@@ -47,12 +165,23 @@ class TestSearchCustomers:
 
         assert isinstance(customer_id, int)
 
+    def test_invalid_customer_is_not_sent(self, monkeypatch):
+        """Test sign up rejects invalid customers without calling the API"""
+        mock = MockSignUpRequests()
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+        customer = new_customer("email@email.com")
+        customer.address = customer.address._replace(country="XX")
+
+        with pytest.raises(ValidationError):
+            self.api.customers.sign_up(customer)
+        assert not mock.sign_ups
+
     def test_search_first_ten_customers(self, monkeypatch):
         """Test search first ten customers"""
         with open("tests/responses/customers/customers.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         customers = self.api.customers.search(10, 1)
         assert all(isinstance(c, customer_models.Customer) for c in customers)
@@ -66,7 +195,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/customer_details.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         customer = self.api.customers.get_by_username("email@email.com")
         assert isinstance(customer, customer_models.Customer)
@@ -78,7 +207,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/customer_details.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         customer = self.api.customers.get_by_id(30930235)
         assert isinstance(customer, customer_models.Customer)
@@ -89,25 +218,61 @@ class TestSearchCustomers:
         with open("tests/responses/customers/customer_details.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
         customer = self.api.customers.get_by_id(30930235)
 
         with open("tests/responses/customers/modify_customer.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "post", mock.post)
+        monkeypatch.setattr(requests.Session, "post", mock.post)
 
         customer.name = "Updated Name"
         result = self.api.customers.modify(customer)
 
         assert result is True
 
+    @pytest.mark.parametrize(
+        "fixture, get",
+        [
+            ("customer_details.txt", lambda api: api.customers.get_by_id(30930235)),
+            (
+                "authenticate_token.txt",
+                lambda api: api.customers.authenticate_token("t"),
+            ),
+        ],
+    )
+    def test_modify_fetched_customer(self, monkeypatch, fixture, get):
+        """Test customers returned by the API pass validation unchanged"""
+        with open(f"tests/responses/customers/{fixture}", "rb") as f:
+            mock = MockRequests(response_content=f.read())
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        customer = get(self.api)
+        with open("tests/responses/customers/modify_customer.txt", "rb") as f:
+            mock = MockRequests(response_content=f.read())
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+
+        assert self.api.customers.modify(customer) is True
+
+    def test_modify_without_validation(self, monkeypatch):
+        """Test search results, which have no address, are only sent without validation"""
+        with open("tests/responses/customers/customers.txt", "rb") as f:
+            mock = MockRequests(response_content=f.read())
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        customer = next(iter(self.api.customers.search(10, 1)))
+        mock = MockSignUpRequests()
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+
+        with pytest.raises(ValidationError):
+            self.api.customers.modify(customer)
+        assert self.api.customers.modify(customer, validate=False) is True
+        assert mock.modifies == [customer.id]
+
     def test_generate_token(self, monkeypatch):
         """Test generate token"""
         with open("tests/responses/customers/generate_token.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         token = self.api.customers.generate_token(
             username="email@email.com", password="password9", ip_address="127.0.0.1"
@@ -121,7 +286,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/generate_login_token.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         token = self.api.customers.generate_login_token(
             customer_id=30930235, ip_address="127.0.0.1"
@@ -135,7 +300,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/authenticate_token.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         result = self.api.customers.authenticate_token(
             token="89c4109f-ab08-4065-bf7f-8c41c2b1f34a"
@@ -149,7 +314,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/change_password.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "post", mock.post)
+        monkeypatch.setattr(requests.Session, "post", mock.post)
 
         result = self.api.customers.change_password(
             customer_id=30930235, new_password="password9"
@@ -162,7 +327,7 @@ class TestSearchCustomers:
         with open("tests/responses/customers/forgot_password.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         result = self.api.customers.forgot_password(username="email@email.com")
 
@@ -173,8 +338,300 @@ class TestSearchCustomers:
         with open("tests/responses/customers/delete_customer.txt", "rb") as f:
             response_content = f.read()
         mock = MockRequests(response_content=response_content)
-        monkeypatch.setattr(requests, "post", mock.post)
+        monkeypatch.setattr(requests.Session, "post", mock.post)
 
         result = self.api.customers.delete(customer_id=31068890)
 
         assert result is True
+
+
+@pytest.mark.usefixtures("api_class")
+class TestIterSearch:
+    """Test iter_search"""
+
+    api: ResellerClub
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iterates_every_page(self, monkeypatch, prefetch):
+        """Test every customer is yielded in page order"""
+        mock = MockSearchRequests(total=25)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        customers = list(self.api.customers.iter_search(10, prefetch, status="Active"))
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 26)]
+        assert [c["page-no"] for c in mock.calls] == [1, 2, 3]
+        assert all(c["status"] == "Active" for c in mock.calls)
+
+    def test_fetches_pages_lazily(self, monkeypatch):
+        """Test pages are only fetched when the iteration reaches them"""
+        mock = MockSearchRequests(total=25)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        customers = self.api.customers.iter_search(10)
+        for _ in range(10):
+            next(customers)
+
+        assert len(mock.calls) == 1
+
+
+@pytest.mark.usefixtures("api_class")
+class TestSearchStream:
+    """Test search_stream"""
+
+    api: ResellerClub
+
+    def test_streams_customers(self, monkeypatch):
+        """Test the customers of the page are parsed from the streamed body"""
+        mock = MockSearchRequests(total=25)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        stream = self.api.customers.search_stream(10, 2, status="Active")
+        assert not mock.calls
+
+        customers = list(stream)
+
+        assert [c.id for c in customers] == [str(i) for i in range(11, 21)]
+        assert all(isinstance(c, customer_models.Customer) for c in customers)
+        assert (stream.page_records, stream.db_records) == (10, 25)
+        assert mock.calls[0]["status"] == "Active"
+
+    def test_matches_search(self, monkeypatch):
+        """Test the streamed page matches the page returned by search"""
+        mock = MockSearchRequests(total=25)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        expected = self.api.customers.search(10, 3)
+
+        assert list(self.api.customers.search_stream(10, 3)) == expected.customers
+
+
+@pytest.mark.usefixtures("api_class")
+class TestExport:
+    """Test export"""
+
+    api: ResellerClub
+
+    def test_ordered_export(self, monkeypatch):
+        """Test customers are yielded in page order"""
+        mock = MockSearchRequests(total=95)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        customers = list(self.api.customers.export(10, max_workers=4))
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 96)]
+        assert len(mock.calls) == 10
+
+    def test_unordered_export(self, monkeypatch):
+        """Test every customer is yielded once when order is not required"""
+        mock = MockSearchRequests(total=95)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        customers = list(self.api.customers.export(10, max_workers=4, ordered=False))
+
+        assert sorted(int(c.id) for c in customers) == list(range(1, 96))
+
+    def test_failed_pages_are_retried(self, monkeypatch):
+        """Test the retry policy fetches a failed page again without refetching the others"""
+        mock = MockFlakySearchRequests(total=95, failing_pages=(3, 7))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        api = ResellerClub("reseller", "key", retry_policy=RetryPolicy())
+
+        customers = list(api.customers.export(10, max_workers=4))
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 96)]
+        assert len(mock.calls) == 12
+        assert api.retry_policy.stats().retries == 2
+
+    def test_failed_pages_retried_without_client_policy(self, monkeypatch):
+        """Test a page failing once is retried when the client has no retry policy"""
+        mock = MockFlakySearchRequests(total=95, failing_pages=(3,))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        policy = RetryPolicy()
+
+        customers = list(self.api.customers.export(10, retry_policy=policy))
+
+        assert [c.id for c in customers] == [str(i) for i in range(1, 96)]
+        assert len(mock.calls) == 11
+        assert policy.stats().retries == 1
+
+    def test_failed_pages_raise_when_page_retries_exhausted(self, monkeypatch):
+        """Test a failed page raises the error once the export retry policy gives up"""
+        mock = MockFlakySearchRequests(total=95, failing_pages=(3,))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        with pytest.raises(requests.ConnectionError):
+            list(self.api.customers.export(10, retry_policy=RetryPolicy(max_retries=0)))
+
+
+@pytest.mark.usefixtures("api_class")
+class TestGetMany:
+    """Test batch customer lookups"""
+
+    api: ResellerClub
+
+    def test_get_many_by_id(self, monkeypatch):
+        """Test customers are searched in batches of IDs"""
+        mock = MockSearchRequests(total=250)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        ids = list(range(1, 251)) + [5, 10]
+        result = self.api.customers.get_many_by_id(ids, batch_size=100)
+
+        assert len(result) == 250 and not result.errors
+        assert [c.id for c in result] == [str(i) for i in range(1, 251)]
+        assert sorted(len(params["customer-id"]) for params in mock.calls) == [
+            50,
+            100,
+            100,
+        ]
+
+    def test_missing_ids_are_errors(self, monkeypatch):
+        """Test IDs missing from the search response are reported as errors"""
+        mock = MockSearchRequests(total=5)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = self.api.customers.get_many_by_id([1, 2, 99])
+
+        assert list(result.customers) == [1, 2]
+        assert list(result.errors) == [99]
+        assert "99" in str(result.errors[99])
+
+    def test_failed_batch(self, monkeypatch):
+        """Test every ID of a failed batch gets the batch error"""
+        mock = MockFlakySearchRequests(total=10, failing_pages=(1,))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = self.api.customers.get_many_by_id([1, 2, 3, 4], batch_size=2)
+
+        assert len(result) == 2 and len(result.errors) == 2
+        assert all(
+            isinstance(e, requests.ConnectionError) for e in result.errors.values()
+        )
+
+    def test_invalid_batch_size(self):
+        """Test batch sizes beyond the search page size are rejected"""
+        with pytest.raises(ValueError):
+            self.api.customers.get_many_by_id([1], batch_size=501)
+
+    @pytest.mark.parametrize("method", ["get_many_by_id", "get_many_by_username"])
+    def test_details(self, monkeypatch, method):
+        """Test customers are fetched one by one from the details endpoints"""
+        with open("tests/responses/customers/customer_details.txt", "rb") as f:
+            response_content = f.read()
+        mock = MockRequests(response_content=response_content)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        kwargs = {"details": True} if method == "get_many_by_id" else {}
+        keys = ["a", "b", "c", "a"]
+        result = getattr(self.api.customers, method)(keys, **kwargs)
+
+        assert list(result.customers) == ["a", "b", "c"] and not result.errors
+        assert all(isinstance(c, customer_models.Customer) for c in result)
+
+
+@pytest.mark.usefixtures("api_class")
+class TestBulkSubmit:
+    """Test bulk sign ups and modifications"""
+
+    api: ResellerClub
+
+    def test_bulk_sign_up(self, monkeypatch):
+        """Test customers are signed up concurrently and invalid ones are not sent"""
+        mock = MockSignUpRequests()
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+        customers = [new_customer(f"user{i}@email.com") for i in range(20)]
+        customers += [new_customer("user0@email.com"), new_customer("x@email.com", "")]
+
+        results = list(self.api.customers.bulk_sign_up(customers, max_workers=4))
+
+        ok = [r for r in results if r.ok]
+        errors = [r for r in results if not r.ok]
+        assert len(results) == 22
+        assert len({r.customer_id for r in ok}) == 20
+        assert sorted(mock.sign_ups) == sorted(c.username for c in customers[:20])
+        assert all(isinstance(r.error, ValueError) for r in errors)
+        assert "city" in str(errors[-1].error)
+
+    def test_resume_from_checkpoint(self, monkeypatch, tmp_path):
+        """Test an interrupted sign up resumes without signing anyone up twice"""
+        mock = MockSignUpRequests()
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        checkpoint = tmp_path / "signup.log"
+        customers = [new_customer(f"user{i}@email.com") for i in range(20)]
+
+        results = self.api.customers.bulk_sign_up(
+            customers, max_workers=4, checkpoint=checkpoint
+        )
+        first = [r for _, r in zip(range(5), results)]
+        results.close()
+        resumed = list(
+            self.api.customers.bulk_sign_up(
+                customers, max_workers=4, checkpoint=checkpoint
+            )
+        )
+
+        assert all(r.ok for r in first + resumed)
+        assert sorted(mock.sign_ups) == sorted(c.username for c in customers)
+        assert {r.customer.username for r in resumed if r.resumed} >= {
+            r.customer.username for r in first
+        }
+        ids = {r.customer.username: r.customer_id for r in resumed}
+        assert ids == mock.customers
+
+    def test_interrupted_sign_up_is_looked_up(self, monkeypatch, tmp_path):
+        """Test a sign up sent without a recorded result is not sent again"""
+        mock = MockSignUpRequests(registered=("user0@email.com",))
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        checkpoint = tmp_path / "signup.log"
+        checkpoint.write_text(
+            '{"key": "user0@email.com", "submitted": true}\n'
+            '{"key": "user1@email.com", "submitted": true}\n{"key": "user2'
+        )
+        customers = [new_customer(f"user{i}@email.com") for i in range(3)]
+
+        results = list(
+            self.api.customers.bulk_sign_up(customers, checkpoint=checkpoint)
+        )
+
+        assert all(r.ok for r in results)
+        assert sorted(mock.sign_ups) == ["user1@email.com", "user2@email.com"]
+        assert {r.customer.username: r.customer_id for r in results} == {
+            "user0@email.com": 1000,
+            "user1@email.com": 1001,
+            "user2@email.com": 1002,
+        }
+
+    def test_bulk_modify(self, monkeypatch):
+        """Test customers are modified concurrently"""
+        with open("tests/responses/customers/customer_details.txt", "rb") as f:
+            data = json.load(f)
+        mock = MockSignUpRequests()
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+        customers = [
+            customer_models.Customer.from_details({**data, "customerid": str(i)})
+            for i in range(10)
+        ]
+        customers.append(new_customer("new@email.com"))
+
+        results = list(self.api.customers.bulk_modify(customers, max_workers=4))
+
+        ok_ids = sorted((r.customer_id for r in results if r.ok), key=int)
+        assert ok_ids == [str(i) for i in range(10)]
+        assert sorted(mock.modifies, key=int) == [str(i) for i in range(10)]
+        assert isinstance(results[-1].error, ValueError)
+
+    def test_bulk_sign_up_without_validation(self, monkeypatch):
+        """Test customers are sent unchecked with validate=False"""
+        mock = MockSignUpRequests()
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+        customers = [new_customer("a@email.com"), new_customer("b@email.com", "")]
+
+        results = list(self.api.customers.bulk_sign_up(customers, validate=False))
+
+        assert all(r.ok for r in results)
+        assert sorted(mock.sign_ups) == ["a@email.com", "b@email.com"]
@@ -0,0 +1,61 @@
+"""JSON Decoders Unit Tests"""
+
+import glob
+import json
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client import decoders
+
+from .mocks import MockRequests
+
+RESPONSES = sorted(glob.glob("tests/responses/**/*.txt", recursive=True))
+
+
+class TestDecoders:
+    """JSON Decoders Test Cases"""
+
+    @pytest.mark.parametrize("path", RESPONSES)
+    def test_decoders_agree(self, path):
+        """Test every decoder reads the recorded responses like the standard library"""
+        with open(path, "rb") as f:
+            content = f.read()
+        expected = json.loads(content.decode("utf-8"))
+
+        assert decoders.stdlib_decoder(content) == expected
+        if decoders.orjson is not None:
+            assert decoders.orjson_decoder(content) == expected
+
+    def test_default_decoder_falls_back_to_stdlib(self, monkeypatch):
+        """Test the standard library is used when orjson is not installed"""
+        monkeypatch.setattr(decoders, "orjson", None)
+
+        assert decoders.get_default_decoder() is decoders.stdlib_decoder
+
+    def test_invalid_json_raises_http_error(self, monkeypatch):
+        """Test a non JSON error response raises the HTTP error with any decoder"""
+        mock = MockRequests(response_content=b"<html>Bad Gateway</html>")
+        mock.response.status_code = 502
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        api = ResellerClub("reseller", "key")
+
+        with pytest.raises(requests.HTTPError):
+            api.customers.search(10, 1)
+
+    def test_custom_decoder(self, monkeypatch):
+        """Test the client decodes the raw response bytes with the given decoder"""
+        with open("tests/responses/customers/customers.txt", "rb") as f:
+            mock = MockRequests(response_content=f.read())
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        contents = []
+
+        def decoder(content: bytes):
+            contents.append(content)
+            return json.loads(content)
+
+        api = ResellerClub("reseller", "key", decoder=decoder)
+        api.customers.search(10, 1)
+
+        assert contents == [mock.response.content]
@@ -6,9 +6,11 @@ import requests
 from thefuzz import fuzz
 
 from src.resellerclub import ResellerClub
+from src.resellerclub.client.domains import chunk_availability_grid
+from src.resellerclub.exceptions import ResellerClubAPIException
 from src.resellerclub.models import domains as domain_models
 
-from .mocks import MockRequests
+from .mocks import MockAvailabilityRequests, MockRequests
 
 
 @pytest.mark.usefixtures("api_class")
@@ -27,7 +29,7 @@ class TestDomainAvailability:
         ) as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         domain = self.domains[0]
         tld = self.tlds[0]
@@ -42,7 +44,7 @@ class TestDomainAvailability:
         ) as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         domain = self.domains[0]
         tlds = self.tlds
@@ -61,7 +63,7 @@ class TestDomainAvailability:
         ) as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         domains = self.domains
         tld = self.tlds[0]
@@ -81,7 +83,7 @@ class TestDomainAvailability:
         ) as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         domains = self.domains
         tlds = self.tlds
@@ -110,7 +112,7 @@ class TestIDNAvailability:
         with open(f"{self.responses_dir}/single_domain.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         domain = self.domains[0]
         tld = self.tld
@@ -129,7 +131,7 @@ class TestIDNAvailability:
         with open(f"{self.responses_dir}/multiple_domains.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         domains = self.domains
         tld = self.tld
@@ -163,7 +165,7 @@ class TestPremiumDomainsAvailability:
         with open(f"{self.responses_dir}/single_tld.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         keyword = self.keyword
         tld = self.tlds[0]
@@ -184,7 +186,7 @@ class TestPremiumDomainsAvailability:
         with open(f"{self.responses_dir}/multiple_tlds.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         keyword = self.keyword
         tlds = self.tlds
@@ -205,7 +207,7 @@ class TestPremiumDomainsAvailability:
         with open(f"{self.responses_dir}/highest_price.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         highest_price = self.highest_price
         params = [self.keyword, self.tlds[0], highest_price]
@@ -219,7 +221,7 @@ class TestPremiumDomainsAvailability:
         with open(f"{self.responses_dir}/highest_price.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         lowest_price = self.lowest_price
         params = [self.keyword, self.tlds[0], None, lowest_price]
@@ -233,7 +235,7 @@ class TestPremiumDomainsAvailability:
         with open(f"{self.responses_dir}/highest_and_lowest_price.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         lowest_price = self.lowest_price
         highest_price = self.highest_price
@@ -249,7 +251,7 @@ class TestPremiumDomainsAvailability:
         with open(f"{self.responses_dir}/max_results.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         max_results = self.max_results
         params = {
@@ -276,7 +278,7 @@ class TestThirdLvlNameAvailability:
         with open(f"{self.responses_dir}/single_domain.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         result = self.api.domains.check_third_level_name_availability(self.domains[0])
 
@@ -291,7 +293,7 @@ class TestThirdLvlNameAvailability:
         with open(f"{self.responses_dir}/multiple_domains.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         result = self.api.domains.check_third_level_name_availability(self.domains)
 
@@ -316,7 +318,7 @@ class TestSuggestNames:
         with open(f"{self.responses_dir}/keyword_only.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         suggestions = self.api.domains.suggest_names(self.keyword)
 
@@ -331,7 +333,7 @@ class TestSuggestNames:
         with open(f"{self.responses_dir}/tld.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         tld = "com"
         suggestions = self.api.domains.suggest_names(self.keyword, tld)
@@ -346,9 +348,91 @@ class TestSuggestNames:
         with open(f"{self.responses_dir}/exact_match.txt", "rb") as f:
             content = f.read()
         mock = MockRequests(response_content=content)
-        monkeypatch.setattr(requests, "get", mock.get)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
 
         suggestions = self.api.domains.suggest_names(self.keyword, exact_match=True)
         assertion = all(s.domain.split(".")[0] == self.keyword for s in suggestions)
 
         assert assertion is True, "Results are not exact match"
+
+
+@pytest.mark.usefixtures("api_class")
+class TestBulkAvailability:
+    """Bulk availability check test case"""
+
+    api: ResellerClub
+
+    domains = [f"keyword{i}" for i in range(50)]
+    tlds = [f"tld{i}" for i in range(40)]
+
+    def test_grid_is_chunked(self, monkeypatch):
+        """Test the grid is split in requests of at most max_combinations pairs"""
+        mock = MockAvailabilityRequests()
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = self.api.domains.check_availability_bulk(
+            self.domains, self.tlds, max_combinations=100, max_workers=4
+        )
+
+        assert len(result) == len(self.domains) * len(self.tlds)
+        assert not result.errors
+        assert len(mock.calls) == 25
+        assert all(len(c["domain-name"]) * len(c["tlds"]) <= 100 for c in mock.calls)
+        expected = [f"{d}.{t}" for d in self.domains for t in self.tlds]
+        assert [a.domain for a in result] == expected
+
+    def test_tlds_larger_than_chunk(self, monkeypatch):
+        """Test TLD lists longer than a chunk are split too"""
+        mock = MockAvailabilityRequests()
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = self.api.domains.check_availability_bulk(
+            self.domains[:2], self.tlds, max_combinations=15
+        )
+
+        assert len(result) == 2 * len(self.tlds)
+        assert all(len(c["tlds"]) <= 15 for c in mock.calls)
+
+    def test_tlds_are_split_per_name(self):
+        """Test each name gets its own chunks when its TLDs exceed max_combinations"""
+        chunks = list(chunk_availability_grid(["a", "b"], ["x", "y", "z"], 2))
+
+        assert chunks == [
+            (["a"], ["x", "y"]),
+            (["a"], ["z"]),
+            (["b"], ["x", "y"]),
+            (["b"], ["z"]),
+        ]
+
+    @pytest.mark.parametrize(
+        "domain_names, tlds", [([], ["com"]), (["a"], []), ([], [])]
+    )
+    def test_empty_grid(self, monkeypatch, domain_names, tlds):
+        """Test an empty grid sends no request"""
+        mock = MockAvailabilityRequests()
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = self.api.domains.check_availability_bulk(domain_names, tlds)
+
+        assert not list(chunk_availability_grid(domain_names, tlds, 100))
+        assert not result.availability and not result.errors
+        assert not mock.calls
+
+    def test_invalid_max_combinations(self):
+        """Test chunks must hold at least one pair"""
+        with pytest.raises(ValueError):
+            list(chunk_availability_grid(["a"], ["com"], 0))
+
+    def test_failed_chunks_are_reported(self, monkeypatch):
+        """Test a failing chunk does not discard the successful ones"""
+        mock = MockAvailabilityRequests(failing_names=("keyword0",))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = self.api.domains.check_availability_bulk(
+            self.domains, self.tlds, max_combinations=80
+        )
+
+        assert len(result.errors) == 1
+        assert result.errors[0].domain_names == ["keyword0", "keyword1"]
+        assert isinstance(result.errors[0].error, ResellerClubAPIException)
+        assert len(result) == (len(self.domains) - 2) * len(self.tlds)
@@ -0,0 +1,113 @@
+"""Instrumentation Unit Tests"""
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.cache import ResponseCache
+from src.resellerclub.client.instrumentation import (
+    Histogram,
+    MetricsCollector,
+    RequestHook,
+)
+from src.resellerclub.exceptions import ResellerClubAPIException
+
+from .mocks import MockAvailabilityRequests, MockSearchRequests
+
+
+class RecordingHook(RequestHook):
+    """Hook recording the callbacks it receives"""
+
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(("before_request", event.endpoint))
+
+    def after_response(self, event):
+        self.calls.append(("after_response", event.endpoint))
+
+    def on_error(self, event):
+        self.calls.append(("on_error", type(event.error).__name__))
+
+
+class TestInstrumentation:
+    """Instrumentation Test Cases"""
+
+    def test_hooks_are_called(self, monkeypatch):
+        """Test hooks are called around a successful and a failed request"""
+        hook = RecordingHook()
+        api = ResellerClub("reseller", "key", hooks=[hook])
+        monkeypatch.setattr(requests.Session, "get", MockSearchRequests(1).get)
+        api.customers.search(10, 1)
+        mock = MockAvailabilityRequests(failing_names=("github",))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.domains.check_availability(["github"], ["com"])
+
+        assert hook.calls == [
+            ("before_request", "customers.search"),
+            ("after_response", "customers.search"),
+            ("before_request", "domains.availability_check"),
+            ("on_error", "ResellerClubAPIException"),
+        ]
+
+    def test_hooks_called_when_stream_stops_early(self, monkeypatch):
+        """Test the call of a streamed search is finished when the caller stops early"""
+        hook = RecordingHook()
+        api = ResellerClub("reseller", "key", hooks=[hook])
+        monkeypatch.setattr(requests.Session, "get", MockSearchRequests(25).get)
+
+        for _ in api.customers.search_stream(10, 1):
+            break
+
+        assert hook.calls == [
+            ("before_request", "customers.search"),
+            ("after_response", "customers.search"),
+        ]
+
+    def test_metrics_per_endpoint(self, monkeypatch):
+        """Test the collector records latency, size, decode and parse time per endpoint"""
+        collector = MetricsCollector()
+        api = ResellerClub("reseller", "key", hooks=[collector])
+        monkeypatch.setattr(requests.Session, "get", MockSearchRequests(25).get)
+
+        api.customers.search(10, 1)
+        api.customers.search(10, 2)
+
+        metrics = collector.snapshot()["customers.search"]
+        assert metrics["latency"]["count"] == 2
+        assert metrics["response_size"]["sum"] > 0
+        assert metrics["decode_time"]["count"] == 2
+        assert metrics["parse_time"]["count"] == 2
+        assert not metrics["errors"]
+
+    def test_metrics_count_errors_and_cache_hits(self, monkeypatch):
+        """Test the collector counts errors and cache hits"""
+        collector = MetricsCollector()
+        api = ResellerClub("reseller", "key", cache=ResponseCache(), hooks=[collector])
+        monkeypatch.setattr(
+            requests.Session, "get", MockAvailabilityRequests(("bad",)).get
+        )
+
+        api.domains.check_availability(["good"], ["com"])
+        api.domains.check_availability(["good"], ["com"])
+        with pytest.raises(ResellerClubAPIException):
+            api.domains.check_availability(["bad"], ["com"])
+
+        metrics = collector.snapshot()["domains.availability_check"]
+        assert metrics["cache_hits"] == 1
+        assert metrics["errors"] == {"ResellerClubAPIException": 1}
+        assert metrics["latency"]["count"] == 3
+
+    def test_histogram_percentiles(self):
+        """Test percentiles are estimated from the bucket bounds"""
+        histogram = Histogram((1, 2, 5, 10))
+        for value in (0.5, 0.5, 1.5, 4, 4, 4, 4, 4, 8, 20):
+            histogram.observe(value)
+
+        assert histogram.percentile(20) == 1
+        assert histogram.percentile(50) == 5
+        assert histogram.percentile(90) == 10
+        assert histogram.percentile(100) == 20
@@ -1,7 +1,13 @@
 """Mock requests for testing purposes"""
 
+import io
+import json
+import threading
+
 import requests
 
+from src.resellerclub.models import customer as customer_models
+
 
 class MockRequests:
     """Mock Requests class"""
@@ -20,3 +26,226 @@ class MockRequests:
     def post(self, *args, **kwargs):  # pylint: disable=unused-argument
         """Post mock response from API"""
         return self.response
+
+
+class MockAvailabilityRequests:
+    """Mock availability check answering every requested domain name x TLD pair"""
+
+    def __init__(self, failing_names: tuple = ()):
+        self.failing_names = failing_names
+        self.calls = []
+
+    def get(self, url, params=None, **kwargs):  # pylint: disable=unused-argument
+        """Get mock availability from API"""
+        self.calls.append(params)
+        r = requests.Response()
+        r.encoding = "UTF-8"
+        names = params["domain-name"]
+        if any(name in self.failing_names for name in names):
+            r.status_code = 500
+            r._content = json.dumps({"status": "ERROR", "message": "error"}).encode()
+            return r
+
+        availability = {
+            f"{name}.{tld}": {"classkey": f"dot{tld}", "status": "available"}
+            for name in names
+            for tld in params["tlds"]
+        }
+        r.status_code = 200
+        r._content = json.dumps(availability).encode()
+        return r
+
+
+class MockSearchRequests:
+    """Mock customer search paging through `total` generated customers, the last `new` of
+    them matching a creation date filter"""
+
+    def __init__(self, total: int, new: int = 0):
+        self.total = total
+        self.new = new
+        self.calls = []
+
+    def page(self, params: dict) -> dict:
+        """Build the search response data for the requested page"""
+        records, page = int(params["no-of-records"]), int(params["page-no"])
+        first = 1
+        if params.get("creation-date-start") is not None:
+            first = self.total - self.new + 1
+        ids = range(
+            first + (page - 1) * records,
+            min(first - 1 + page * records, self.total) + 1,
+        )
+        if params.get("customer-id") is not None:
+            requested = params["customer-id"]
+            requested = [requested] if isinstance(requested, str) else requested
+            ids = [int(i) for i in requested if 0 < int(i) <= self.total][:records]
+        matches = self.total - first + 1
+        data = {"recsonpage": str(len(ids)), "recsindb": str(matches)}
+        for i, customer_id in enumerate(ids, start=1):
+            data[str(i)] = self.record(customer_id)
+        return data
+
+    @staticmethod
+    def record(customer_id: int) -> dict:
+        """Build the search record of a customer"""
+        return {
+            "customer.customerid": str(customer_id),
+            "customer.username": f"customer{customer_id}@email.com",
+            "customer.name": f"Customer {customer_id}",
+            "customer.company": "Company",
+            "customer.resellerid": "1139807",
+            "customer.city": "City",
+            "customer.country": "MX",
+            "customer.telnocc": "52",
+            "customer.telno": "5512345678",
+            "customer.totalreceipts": "0.000",
+            "customer.websitecount": "0",
+            "customer.customerstatus": "Active",
+        }
+
+    def get(self, url, params=None, stream=False, **kwargs):
+        """Get mock search page from API"""
+        self.calls.append(params)
+        r = requests.Response()
+        r.encoding = "UTF-8"
+        r.status_code = 200
+        content = json.dumps(self.page(params)).encode()
+        if stream:
+            r.raw = io.BytesIO(content)
+        else:
+            r._content = content
+        return r
+
+
+class MockDatedSearchRequests(MockSearchRequests):
+    """Mock customer search filtering customers by their creation timestamp"""
+
+    def __init__(self, created: dict):
+        super().__init__(len(created))
+        self.created = created
+        self.names = {}
+
+    def page(self, params: dict) -> dict:
+        """Build the search response data for the requested page of the matching customers"""
+        records, page = int(params["no-of-records"]), int(params["page-no"])
+        start = params.get("creation-date-start")
+        end = params.get("creation-date-end")
+        ids = [
+            customer_id
+            for customer_id, created in sorted(self.created.items())
+            if (start is None or created > float(start))
+            and (end is None or created < float(end))
+        ]
+        page_ids = ids[(page - 1) * records : page * records]
+        data = {"recsonpage": str(len(page_ids)), "recsindb": str(len(ids))}
+        for i, customer_id in enumerate(page_ids, start=1):
+            data[str(i)] = self.record(customer_id)
+            if customer_id in self.names:
+                data[str(i)]["customer.name"] = self.names[customer_id]
+        return data
+
+
+class MockFlakySearchRequests(MockSearchRequests):
+    """Mock customer search failing the first request of the given pages"""
+
+    def __init__(self, total: int, failing_pages: tuple = ()):
+        super().__init__(total)
+        self.failing_pages = set(failing_pages)
+
+    def get(self, url, params=None, **kwargs):
+        """Get mock search page from API, failing once for each failing page"""
+        page = int(params["page-no"])
+        if page in self.failing_pages:
+            self.failing_pages.discard(page)
+            self.calls.append(params)
+            raise requests.ConnectionError("Connection reset")
+        return super().get(url, params, **kwargs)
+
+
+class MockSequenceRequests:
+    """Mock requests answering with a sequence of responses or errors, one per call"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def _next(self):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status_code, data = outcome
+        r = requests.Response()
+        r.encoding = "UTF-8"
+        r.status_code = status_code
+        r._content = json.dumps(data).encode()
+        return r
+
+    def get(self, *args, **kwargs):  # pylint: disable=unused-argument
+        """Get the next mock response"""
+        return self._next()
+
+    def post(self, *args, **kwargs):  # pylint: disable=unused-argument
+        """Post the next mock response"""
+        return self._next()
+
+
+class MockSignUpRequests:
+    """Mock customer sign ups, modifications and lookups by username"""
+
+    def __init__(self, registered: tuple = ()):
+        self.customers = {username: 1000 + i for i, username in enumerate(registered)}
+        self.sign_ups = []
+        self.modifies = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _response(status_code: int, data) -> requests.Response:
+        r = requests.Response()
+        r.encoding = "UTF-8"
+        r.status_code = status_code
+        r._content = json.dumps(data).encode()
+        return r
+
+    def get(self, url, params=None, **kwargs):  # pylint: disable=unused-argument
+        """Get mock customer details by username"""
+        customer_id = self.customers.get(params["username"])
+        if customer_id is None:
+            return self._response(500, {"status": "ERROR", "message": "No Entity"})
+        with open("tests/responses/customers/customer_details.txt", "rb") as f:
+            data = json.load(f)
+        data.update(customerid=str(customer_id), username=params["username"])
+        return self._response(200, data)
+
+    def post(self, url, data=None, **kwargs):  # pylint: disable=unused-argument
+        """Post mock sign up or modification"""
+        with self._lock:
+            if url.endswith("signup.json"):
+                self.sign_ups.append(data["username"])
+                customer_id = self.customers[data["username"]] = 1000 + len(
+                    self.customers
+                )
+                return self._response(200, customer_id)
+            self.modifies.append(data["customer-id"])
+            return self._response(200, True)
+
+
+def new_customer(username: str, city: str = "City") -> customer_models.NewCustomer:
+    """Build a new customer with every required detail"""
+    return customer_models.NewCustomer(
+        username=username,
+        password="password9",
+        name="Customer Name",
+        company="Customer Company",
+        address=customer_models.Address(
+            line1="Customer Address",
+            city=city,
+            state="State",
+            country="US",
+            zip_code="12345",
+        ),
+        phones=customer_models.CustomerPhones(
+            phone_country_code="1", phone="1234567890"
+        ),
+        language_code="en",
+    )
@@ -0,0 +1,109 @@
+"""Rate Limiter Unit Tests"""
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client import ratelimit
+from src.resellerclub.client.ratelimit import AdaptiveRateLimiter, RateLimiter
+from src.resellerclub.exceptions import ResellerClubAPIException
+
+from .mocks import MockAvailabilityRequests, MockSearchRequests, MockSequenceRequests
+
+
+class FakeClock:
+    """Controllable monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        """Current time"""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock instead of sleeping"""
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Rate Limiter Test Cases"""
+
+    def test_burst_then_wait(self, monkeypatch):
+        """Test requests beyond the burst wait for new tokens"""
+        clock = FakeClock()
+        monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+        limiter = RateLimiter(rate=2, burst=2)
+
+        assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+
+    def test_tokens_refill(self, monkeypatch):
+        """Test tokens refill over time up to the burst size"""
+        clock = FakeClock()
+        monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+        limiter = RateLimiter(rate=2, burst=2)
+        limiter.reserve()
+        limiter.reserve()
+
+        clock.sleep(10)
+
+        assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+    def test_adaptive_backoff_and_recovery(self):
+        """Test the adaptive limiter backs off on errors and ramps up on recovery"""
+        limiter = AdaptiveRateLimiter(rate=10, min_rate=2, increase_step=1)
+
+        limiter.record(False, 0.1)
+        assert limiter.rate == 5
+        limiter.record(True, 5.0)
+        assert limiter.rate == 2.5
+        limiter.record(False, 0.1)
+        assert limiter.rate == 2
+
+        for _ in range(20):
+            limiter.record(True, 0.1)
+        assert limiter.rate == 10
+
+    def test_shared_by_clients(self, monkeypatch):
+        """Test the domains and customers clients draw from the same bucket"""
+        clock = FakeClock()
+        monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+        monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+        api = ResellerClub("reseller", "key", rate_limiter=RateLimiter(rate=1))
+
+        monkeypatch.setattr(requests.Session, "get", MockAvailabilityRequests().get)
+        api.domains.check_availability(["github"], ["com"])
+        monkeypatch.setattr(requests.Session, "get", MockSearchRequests(1).get)
+        api.customers.search(10, 1)
+
+        assert clock.now == 1001.0
+
+    def test_api_errors_do_not_back_off(self, monkeypatch):
+        """Test errors reported by the API do not lower the adaptive rate"""
+        mock = MockSequenceRequests(
+            (500, {"status": "ERROR", "message": "No Entity"}),
+            (503, {"status": "ERROR", "message": "Service unavailable"}),
+        )
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        limiter = AdaptiveRateLimiter(rate=50)
+        api = ResellerClub("reseller", "key", rate_limiter=limiter)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.customers.get_by_username("nobody@example.com")
+        assert limiter.rate == 50
+        with pytest.raises(ResellerClubAPIException):
+            api.customers.get_by_username("nobody@example.com")
+        assert limiter.rate == 25
+
+    def test_gateway_errors_back_off(self, monkeypatch):
+        """Test a gateway error lowers the adaptive rate"""
+        mock = MockSequenceRequests(
+            (502, {"status": "ERROR", "message": "Bad gateway"})
+        )
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        limiter = AdaptiveRateLimiter(rate=50)
+        api = ResellerClub("reseller", "key", rate_limiter=limiter)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.customers.get_by_username("nobody@example.com")
+        assert limiter.rate == 25
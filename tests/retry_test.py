@@ -0,0 +1,113 @@
+"""Retry Policy Unit Tests"""
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.retry import RetryPolicy
+from src.resellerclub.exceptions import ResellerClubAPIException
+
+from .mocks import MockSequenceRequests
+
+ERROR = (503, {"status": "ERROR", "message": "Service unavailable"})
+NO_ENTITY = (500, {"status": "ERROR", "message": "No Entity"})
+AVAILABLE = (200, {"github.com": {"classkey": "domcno", "status": "regthroughothers"}})
+
+
+@pytest.fixture(name="api")
+def api_fixture(monkeypatch):
+    """ResellerClub API with a retry policy that does not wait between attempts"""
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    policy = RetryPolicy(max_retries=2, backoff_factor=0, jitter=False)
+    return ResellerClub("reseller", "key", retry_policy=policy)
+
+
+class TestRetryPolicy:
+    """Retry Policy Test Cases"""
+
+    def test_backoff_is_exponential_and_capped(self):
+        """Test the backoff doubles on each retry up to the maximum"""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+
+        assert [policy.backoff(r) for r in range(5)] == [0.5, 1, 2, 3, 3]
+
+    def test_jitter_stays_under_backoff(self):
+        """Test the jittered backoff never exceeds the backoff"""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=8)
+
+        assert all(0 <= policy.backoff(3) <= 8 for _ in range(100))
+
+    def test_get_is_retried(self, api, monkeypatch):
+        """Test idempotent GET requests are retried on transient errors"""
+        mock = MockSequenceRequests(
+            requests.ConnectionError("Connection reset"), ERROR, AVAILABLE
+        )
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = api.domains.check_availability(["github"], ["com"])
+
+        assert result[0].domain == "github.com"
+        assert mock.calls == 3
+        assert api.retry_policy.stats().retries == 2
+
+    def test_retries_are_limited(self, api, monkeypatch):
+        """Test the last error is raised once the retries are used up"""
+        mock = MockSequenceRequests(ERROR, ERROR, ERROR)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.domains.check_availability(["github"], ["com"])
+        assert mock.calls == 3
+
+    def test_api_errors_are_not_retried(self, api, monkeypatch):
+        """Test errors reported by the API with a 500 status are final"""
+        mock = MockSequenceRequests(NO_ENTITY, NO_ENTITY, NO_ENTITY)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        with pytest.raises(ResellerClubAPIException, match="No Entity"):
+            api.customers.get_by_username("nobody@example.com")
+        assert mock.calls == 1
+        assert api.retry_policy.stats().retries == 0
+
+    def test_server_failures_are_retried(self, api, monkeypatch):
+        """Test 500 responses that are not API errors are retried"""
+        mock = MockSequenceRequests((500, "Internal Server Error"), AVAILABLE)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        result = api.domains.check_availability(["github"], ["com"])
+
+        assert result[0].domain == "github.com"
+        assert mock.calls == 2
+
+    def test_post_is_not_retried(self, api, monkeypatch):
+        """Test non-idempotent POST requests are never retried"""
+        mock = MockSequenceRequests(ERROR, (200, True))
+        monkeypatch.setattr(requests.Session, "post", mock.post)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.customers.delete(31068890)
+        assert mock.calls == 1
+
+    def test_non_idempotent_get_is_not_retried(self, api, monkeypatch):
+        """Test GET requests with side effects are never retried"""
+        mock = MockSequenceRequests(ERROR, (200, True))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.customers.forgot_password("email@email.com")
+        assert mock.calls == 1
+
+    def test_retry_budget(self, monkeypatch):
+        """Test retries stop once the budget is exhausted"""
+        monkeypatch.setattr("time.sleep", lambda seconds: None)
+        policy = RetryPolicy(
+            max_retries=5, backoff_factor=0, budget_min=1, budget_ratio=0
+        )
+        api = ResellerClub("reseller", "key", retry_policy=policy)
+        mock = MockSequenceRequests(ERROR, ERROR, ERROR)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        with pytest.raises(ResellerClubAPIException):
+            api.domains.check_availability(["github"], ["com"])
+        assert mock.calls == 2
+        assert policy.stats().budget_exhausted == 1
@@ -0,0 +1,108 @@
+"""Customer Snapshot Unit Tests"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.columnar import CustomerColumns
+from src.resellerclub.client.snapshot import CustomerSnapshot
+
+from .mocks import MockSearchRequests
+
+
+def search_columns(total: int) -> CustomerColumns:
+    """Build the columns of a search page of `total` customers, in reverse ID order"""
+    data = MockSearchRequests(total).page({"no-of-records": total, "page-no": 1})
+    return CustomerColumns.from_search(data)[::-1]
+
+
+class TestCustomerSnapshot:
+    """Customer Snapshot Test Cases"""
+
+    def test_round_trip(self, tmp_path):
+        """Test the saved customers are found by ID"""
+        path = tmp_path / "customers.snap"
+        columns = search_columns(30)
+        columns.columns["company"][0] = None
+        columns.columns["name"][1] = "Ñandú 客户"
+        taken_at = datetime(2025, 1, 1, 12, 30)
+
+        assert CustomerSnapshot.write(path, columns, taken_at) == 30
+        with CustomerSnapshot(path) as snapshot:
+            assert len(snapshot) == 30
+            assert snapshot.taken_at == taken_at
+            assert snapshot.ids() == [str(i) for i in range(1, 31)]
+            assert snapshot["7"] == columns[23]
+            assert snapshot[30].company is None
+            assert snapshot[29].name == "Ñandú 客户"
+            assert "31" not in snapshot and snapshot.get(0) is None
+            with pytest.raises(KeyError):
+                snapshot[31]  # pylint: disable=pointless-statement
+            assert list(snapshot) == list(columns[::-1])
+            loaded = snapshot.to_columns()
+
+        assert loaded.columns == columns[::-1].columns
+
+    def test_duplicates_keep_last_row(self, tmp_path):
+        """Test a customer saved twice keeps its last values"""
+        path = tmp_path / "customers.snap"
+        columns = search_columns(5)
+        update = search_columns(5)[:1]
+        update.columns["name"][0] = "Renamed"
+        columns.extend(update)
+
+        assert CustomerSnapshot.write(path, columns, datetime.now()) == 5
+        with CustomerSnapshot(path) as snapshot:
+            assert snapshot["5"].name == "Renamed"
+
+    def test_not_a_snapshot(self, tmp_path):
+        """Test other files are rejected"""
+        path = tmp_path / "customers.snap"
+        path.write_bytes(b"\0" * 64)
+
+        with pytest.raises(ValueError):
+            CustomerSnapshot(path)
+
+
+@pytest.mark.usefixtures("api_class")
+class TestClientSnapshots:
+    """Test writing and refreshing snapshots from the API"""
+
+    api: ResellerClub
+
+    def test_write_and_refresh(self, monkeypatch, tmp_path):
+        """Test a refresh only fetches the customers created since the snapshot"""
+        path = tmp_path / "customers.snap"
+        mock = MockSearchRequests(total=95)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        assert self.api.customers.write_snapshot(path, records=10) == 95
+        with CustomerSnapshot(path) as snapshot:
+            taken_at = snapshot.taken_at
+
+        mock.total, mock.new = 120, 25
+        mock.calls.clear()
+        assert self.api.customers.refresh_snapshot(path, records=10) == 25
+
+        since = float(mock.calls[0]["creation-date-start"])
+        assert since == (taken_at - timedelta(hours=1)).timestamp()
+        assert len(mock.calls) == 3
+        with CustomerSnapshot(path) as snapshot:
+            assert snapshot.ids() == [str(i) for i in range(1, 121)]
+            assert snapshot.taken_at > taken_at
+
+    def test_refresh_rejects_creation_date_start(self, monkeypatch, tmp_path):
+        """Test a refresh cannot be given its own creation date start"""
+        path = tmp_path / "customers.snap"
+        mock = MockSearchRequests(total=5)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        self.api.customers.write_snapshot(path, records=10)
+        mock.calls.clear()
+
+        with pytest.raises(ValueError):
+            self.api.customers.refresh_snapshot(
+                path, creation_date_start=datetime(2025, 1, 1)
+            )
+        assert not mock.calls
@@ -0,0 +1,82 @@
+"""Streaming JSON Parser Unit Tests"""
+
+import glob
+import json
+
+import pytest
+
+from src.resellerclub.client.streaming import ObjectItemParser
+
+RESPONSES = [
+    "tests/responses/customers/customers.txt",
+    "tests/responses/customers/customer_details.txt",
+    *sorted(glob.glob("tests/responses/domains/**/*.txt", recursive=True)),
+]
+
+
+def parse_in_chunks(content: bytes, size: int) -> list:
+    """Feed `content` to a parser `size` bytes at a time and return every item"""
+    parser = ObjectItemParser()
+    items = []
+    for start in range(0, len(content), size):
+        items.extend(parser.feed(content[start : start + size]))
+    items.extend(parser.close())
+    return items
+
+
+class TestObjectItemParser:
+    """Streaming JSON Parser Test Cases"""
+
+    @pytest.mark.parametrize("size", [1, 2, 7, 4096])
+    @pytest.mark.parametrize("path", RESPONSES)
+    def test_matches_json_loads(self, path, size):
+        """Test the streamed members match the whole decoded object"""
+        with open(path, "rb") as f:
+            content = f.read()
+
+        items = parse_in_chunks(content, size)
+
+        assert dict(items) == json.loads(content)
+        assert [key for key, _ in items] == list(json.loads(content))
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_split_values(self, size):
+        """Test numbers and multi-byte characters split across chunks"""
+        data = {"recsindb": 12345, "name": "Peñafiel ñandú 日本", "n": [1.5, -20]}
+        content = json.dumps(data, ensure_ascii=False).encode()
+
+        assert dict(parse_in_chunks(content, size)) == data
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b'{"a": 1.5, "b": 1e3, "c": -2.25E-2}',
+            b'{"a":0,"b":-0.5,"c":12345}',
+            b'{"a": 10 , "b": [1.5, 2e1], "c": "1.5"}',
+            b'{"a": true, "b": null, "c": "\\u00f1\\"", "d": 3.75}',
+        ],
+    )
+    def test_every_split_point(self, content):
+        """Test splitting the body in two at any point gives the same members"""
+        expected = list(json.loads(content).items())
+
+        for split in range(len(content) + 1):
+            parser = ObjectItemParser()
+            items = parser.feed(content[:split]) + parser.feed(content[split:])
+
+            assert items + parser.close() == expected, split
+
+    def test_yields_members_as_they_complete(self):
+        """Test a member is returned once the next one starts"""
+        parser = ObjectItemParser()
+
+        assert parser.feed(b'{"a": {"b": 1}') == []
+        assert parser.feed(b', "c": 2') == [("a", {"b": 1})]
+        assert parser.feed(b"}") == [("c", 2)]
+        assert parser.close() == []
+
+    @pytest.mark.parametrize("content", [b'{"a": 1', b'{"a": 1} x', b"[1, 2]", b""])
+    def test_invalid_documents(self, content):
+        """Test incomplete or non-object documents raise a decode error"""
+        with pytest.raises(json.JSONDecodeError):
+            parse_in_chunks(content, 2)
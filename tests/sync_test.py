@@ -0,0 +1,180 @@
+"""Customer Synchronization Unit Tests"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.sync import SyncState, bisect_window
+
+from .mocks import MockDatedSearchRequests
+
+EPOCH = datetime(2024, 1, 1).timestamp()
+
+
+def hourly_customers(total: int) -> dict:
+    """Build the creation timestamps of customers created one hour apart"""
+    return {i: EPOCH + i * 3600 for i in range(1, total + 1)}
+
+
+class TestSyncState:
+    """Synchronization State Test Cases"""
+
+    def test_save_and_load(self, tmp_path):
+        """Test the state is saved and loaded"""
+        path = tmp_path / "sync.json"
+        state = SyncState(datetime(2025, 1, 1, 8), {"1": "a", "2": "b"})
+
+        assert len(SyncState.load(path)) == 0
+        state.save(path)
+        loaded = SyncState.load(path)
+
+        assert loaded.high_water_mark == state.high_water_mark
+        assert loaded.hashes == state.hashes
+
+    def test_start(self):
+        """Test synchronizations start before the high-water mark"""
+        mark = datetime(2025, 1, 1)
+        state = SyncState(mark)
+
+        assert state.start() == mark - timedelta(hours=1)
+        assert state.start(full=True) < mark
+        assert SyncState().start() < mark
+
+    def test_bisect_window(self):
+        """Test both halves hold every second of the window once"""
+        for length in range(3, 12):
+            window = (
+                datetime.fromtimestamp(1000),
+                datetime.fromtimestamp(1000 + length),
+            )
+
+            left, right = bisect_window(window)
+
+            seconds = [
+                t
+                for low, high in (left, right)
+                for t in range(int(low.timestamp()) + 1, int(high.timestamp()))
+            ]
+            assert seconds == list(range(1001, 1000 + length))
+            assert left != window and right != window
+
+    @pytest.mark.parametrize("length", [0, 1, 2])
+    def test_single_second_window(self, length):
+        """Test windows holding at most one second are not split"""
+        window = (datetime.fromtimestamp(1000), datetime.fromtimestamp(1000 + length))
+
+        assert bisect_window(window) is None
+
+    def test_two_second_window(self):
+        """Test the shortest window that is split gives two single-second windows"""
+        window = (datetime.fromtimestamp(1000), datetime.fromtimestamp(1003))
+
+        halves = bisect_window(window)
+
+        assert [(int(a.timestamp()), int(b.timestamp())) for a, b in halves] == [
+            (1000, 1002),
+            (1001, 1003),
+        ]
+        assert all(bisect_window(half) is None for half in halves)
+
+
+@pytest.mark.usefixtures("api_class")
+class TestSync:
+    """Test incremental customer synchronizations"""
+
+    api: ResellerClub
+
+    def test_incremental_sync(self, monkeypatch):
+        """Test later synchronizations only fetch and return new or changed customers"""
+        mock = MockDatedSearchRequests(hourly_customers(300))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        state = SyncState()
+
+        changes = self.api.customers.sync(state, records=50, max_workers=4)
+
+        assert sorted(int(c.customer.id) for c in changes) == list(range(1, 301))
+        assert {c.kind for c in changes} == {"inserted"}
+        assert len(state) == 300
+
+        mock.calls.clear()
+        assert not self.api.customers.sync(state, records=50)
+        assert len(mock.calls) == 1
+
+        mock.created.update({i: time.time() for i in range(301, 306)})
+        mock.calls.clear()
+        changes = self.api.customers.sync(state, records=50)
+
+        assert [(c.kind, c.customer.id) for c in changes] == [
+            ("inserted", str(i)) for i in range(301, 306)
+        ]
+        assert len(mock.calls) == 1
+
+    def test_full_sync_finds_changes(self, monkeypatch):
+        """Test a full synchronization returns the customers changed since the last one"""
+        mock = MockDatedSearchRequests(hourly_customers(120))
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        state = SyncState()
+        self.api.customers.sync(state, records=50)
+
+        mock.names[7] = "Renamed"
+        assert not self.api.customers.sync(state, records=50)
+        changes = self.api.customers.sync(state, records=50, full=True)
+
+        assert [(c.kind, c.customer.id, c.customer.name) for c in changes] == [
+            ("changed", "7", "Renamed")
+        ]
+
+    def test_failed_window_keeps_state(self, monkeypatch):
+        """Test a failed synchronization leaves the state unchanged"""
+        mock = MockDatedSearchRequests(hourly_customers(120))
+        calls = []
+
+        def get(session, url, params=None, **kwargs):  # pylint: disable=unused-argument
+            calls.append(params)
+            if len(calls) == 3:
+                raise requests.ConnectionError("Connection reset")
+            return mock.get(url, params, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "get", get)
+        state = SyncState()
+
+        with pytest.raises(requests.ConnectionError):
+            self.api.customers.sync(state, records=50, max_workers=1)
+        assert state.high_water_mark is None and len(state) == 0
+
+    def test_search_range_splits_dense_windows(self, monkeypatch):
+        """Test a burst of sign-ups is split into windows of one page each"""
+        created = hourly_customers(100)
+        campaign = EPOCH + 50 * 3600
+        created.update({i: campaign + (i % 300) for i in range(101, 1001)})
+        mock = MockDatedSearchRequests(created)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        columns = self.api.customers.search_range(
+            datetime.fromtimestamp(EPOCH),
+            datetime.fromtimestamp(EPOCH + 200 * 3600),
+            records=50,
+            max_workers=4,
+        )
+
+        assert sorted(map(int, columns.columns["id"])) == list(range(1, 1001))
+        assert all(int(params["no-of-records"]) == 50 for params in mock.calls)
+        assert all(params["page-no"] == 1 for params in mock.calls)
+        assert len(mock.calls) < 100
+
+    def test_search_range_pages_single_seconds(self, monkeypatch):
+        """Test a window of a single second is paged through"""
+        mock = MockDatedSearchRequests({i: EPOCH + 3600 for i in range(1, 121)})
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+
+        columns = self.api.customers.search_range(
+            datetime.fromtimestamp(EPOCH),
+            datetime.fromtimestamp(EPOCH + 7200),
+            records=50,
+        )
+
+        assert sorted(map(int, columns.columns["id"])) == list(range(1, 121))
+        assert [params["page-no"] for params in mock.calls].count(3) == 1
@@ -0,0 +1,129 @@
+"""Multi-tenant Client Factory Unit Tests"""
+
+import asyncio
+
+import pytest
+import requests
+
+from src.resellerclub import (
+    AsyncResellerClubFactory,
+    ResellerClub,
+    ResellerClubFactory,
+)
+from src.resellerclub.client.ratelimit import RateLimiter
+
+from .mocks import MockSearchRequests
+
+
+class TestResellerClubFactory:
+    """Multi-tenant Client Factory Test Cases"""
+
+    def test_clients_share_resources(self):
+        """Test every account shares the transport, URLs and settings"""
+        factory = ResellerClubFactory(rate_limiter=RateLimiter(10))
+        first = factory.get("reseller1", "key1")
+        second = factory.get("reseller2", "key2")
+
+        assert isinstance(first, ResellerClub)
+        assert first is not second
+        assert first.transport is second.transport is factory.transport
+        assert first.rate_limiter is second.rate_limiter is factory.rate_limiter
+        assert first.customers._urls is second.domains._urls
+        assert first.customers._timeouts is second.customers._timeouts
+        assert factory.transport.thread_safe
+
+    def test_clients_are_reused(self):
+        """Test the same account gets the same client"""
+        factory = ResellerClubFactory()
+
+        assert factory.get("reseller", "key") is factory.get("reseller", "key")
+        assert factory.get("reseller", "key") is not factory.get("reseller", "other")
+        assert len(factory) == 2
+
+    def test_credentials_are_isolated(self, monkeypatch):
+        """Test each account sends its own credentials"""
+        mock = MockSearchRequests(total=5)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        factory = ResellerClubFactory()
+
+        for i in range(3):
+            factory.get(f"reseller{i}", f"key{i}").customers.search(10, 1)
+
+        assert [(c["auth-userid"], c["api-key"]) for c in mock.calls] == [
+            ("reseller0", "key0"),
+            ("reseller1", "key1"),
+            ("reseller2", "key2"),
+        ]
+
+    def test_least_recently_used_clients_are_dropped(self):
+        """Test the factory keeps at most max_clients clients"""
+        factory = ResellerClubFactory(max_clients=2)
+        first = factory.get("reseller1", "key")
+        factory.get("reseller2", "key")
+        factory.get("reseller1", "key")
+        factory.get("reseller3", "key")
+
+        assert len(factory) == 2
+        assert factory.get("reseller1", "key") is first
+        assert ("reseller2", "key") not in factory._clients
+
+    def test_tenant_rate_limiters(self):
+        """Test each account keeps its own rate limiter while it has a client"""
+        factory = ResellerClubFactory(
+            tenant_rate_limiter=lambda _: RateLimiter(5), max_clients=2
+        )
+        limiter = factory.get("reseller1", "key1").rate_limiter
+        other = factory.get("reseller2", "key").rate_limiter
+
+        assert limiter is not other
+        assert factory.get("reseller1", "key2").rate_limiter is limiter
+        with pytest.raises(ValueError):
+            ResellerClubFactory(
+                rate_limiter=RateLimiter(5), tenant_rate_limiter=lambda _: None
+            )
+
+    def test_tenant_rate_limiters_are_bounded(self):
+        """Test the limiters of accounts without a client are dropped like the clients"""
+        factory = ResellerClubFactory(
+            tenant_rate_limiter=lambda _: RateLimiter(5), max_clients=2
+        )
+        first = factory.get("reseller1", "key").rate_limiter
+        second = factory.get("reseller2", "key").rate_limiter
+        factory.get("reseller1", "key")
+        factory.get("reseller3", "key")
+
+        assert list(factory._rate_limiters) == ["reseller1", "reseller3"]
+        assert factory.get("reseller1", "key").rate_limiter is first
+        assert factory.get("reseller2", "key").rate_limiter is not second
+
+    def test_closing_a_client_keeps_the_shared_pool(self, monkeypatch):
+        """Test only the factory closes the shared transport"""
+        closed = []
+        factory = ResellerClubFactory()
+        monkeypatch.setattr(factory.transport, "close", lambda: closed.append(True))
+
+        with factory.get("reseller", "key"):
+            pass
+        assert not closed
+
+        with factory:
+            pass
+        assert closed == [True]
+
+    def test_async_factory(self):
+        """Test the asyncio factory shares one asyncio transport"""
+        pytest.importorskip("httpx")
+
+        async def run():
+            async with AsyncResellerClubFactory() as factory:
+                first = factory.get("reseller1", "key")
+                second = factory.get("reseller2", "key")
+                async with first:
+                    pass
+                assert not factory.transport._client.is_closed
+                return first, second, factory.transport
+
+        first, second, transport = asyncio.run(run())
+
+        assert first.transport is second.transport is transport
+        assert transport._client.is_closed
@@ -0,0 +1,204 @@
+"""Thread Safety Unit Tests"""
+
+import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.cache import ResponseCache
+from src.resellerclub.client.instrumentation import MetricsCollector
+from src.resellerclub.client.ratelimit import RateLimiter
+from src.resellerclub.client.retry import RetryPolicy
+from src.resellerclub.client.transport import Transport
+from src.resellerclub.client.urls import URLs
+
+from .mocks import MockSearchRequests
+
+WORKERS = 64
+CALLS_PER_WORKER = 20
+POOL_SIZE = 16
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local API stub building each response from the request parameters"""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.search = MockSearchRequests(total=1000)
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api/"
+
+    def count_connection(self) -> None:
+        """Counts a new client connection"""
+        with self._lock:
+            self.connections += 1
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers availability checks and customer searches"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: StubServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.count_connection()
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Builds the response of the requested endpoint"""
+        url = urlsplit(self.path)
+        params = {k: v if len(v) > 1 else v[0] for k, v in parse_qs(url.query).items()}
+        if url.path.endswith("/customers/search.json"):
+            data = self.server.search.page(params)
+        else:
+            names = params["domain-name"]
+            names = [names] if isinstance(names, str) else names
+            tlds = params["tlds"]
+            tlds = [tlds] if isinstance(tlds, str) else tlds
+            data = {
+                f"{name}.{tld}": {"classkey": f"dot{tld}", "status": "available"}
+                for name in names
+                for tld in tlds
+            }
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class StubTransport(Transport):
+    """Thread-safe transport sending the requests to the stub server"""
+
+    def __init__(self, server_url: str) -> None:
+        super().__init__(pool_maxsize=POOL_SIZE, pool_block=True, thread_safe=True)
+        self.server_url = server_url
+
+    def request(self, method, url, params, timeout, stream=False):
+        url = url.replace(URLs.test_url, self.server_url, 1)
+        return super().request(method, url, params, timeout, stream)
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """Runs the stub server for the test"""
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestThreadSafety:
+    """Thread Safety Test Cases"""
+
+    def test_sessions_per_thread(self):
+        """Test each thread gets its own session, all sharing one connection pool"""
+        transport = Transport(thread_safe=True)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(lambda _: transport._get_session(), range(4)))
+        sessions.append(transport._get_session())
+
+        adapters = {id(s.get_adapter("https://httpapi.com/")) for s in sessions}
+        assert len({id(s) for s in sessions}) > 1
+        assert adapters == {id(transport._adapter)}
+
+    def test_shared_session_without_thread_safety(self):
+        """Test the transport uses one session when not in thread-safe mode"""
+        transport = Transport(thread_safe=False)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = set(executor.map(lambda _: transport._get_session(), range(4)))
+
+        assert sessions == {transport._session}
+
+    def test_helpers_use_a_session_per_thread(self, monkeypatch):
+        """Test the concurrent helpers of a default client never share a session"""
+        mock = MockSearchRequests(total=100)
+        users = {}
+        lock = threading.Lock()
+
+        def get(session, url, params=None, **kwargs):
+            with lock:
+                users.setdefault(id(session), set()).add(threading.get_ident())
+            return mock.get(url, params, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "get", get)
+        api = ResellerClub("reseller", "key")
+
+        customers = list(api.customers.export(10, max_workers=4))
+
+        assert len(customers) == 100
+        assert all(len(threads) == 1 for threads in users.values())
+
+    def test_stress(self, server):
+        """Test concurrent availability checks and searches on one shared client"""
+        metrics = MetricsCollector()
+        cache = ResponseCache()
+        api = ResellerClub(
+            "reseller",
+            "key",
+            transport=StubTransport(server.url),
+            cache=cache,
+            rate_limiter=RateLimiter(100000, burst=1000),
+            retry_policy=RetryPolicy(),
+            hooks=[metrics],
+        )
+        names = [f"domain{i}" for i in range(50)]
+
+        def work(worker: int) -> int:
+            rng = random.Random(worker)
+            calls = 0
+            for _ in range(CALLS_PER_WORKER):
+                if rng.random() < 0.5:
+                    name = rng.choice(names)
+                    result = api.domains.check_availability([name], ["com", "net"])
+                    assert sorted(a.domain for a in result) == [
+                        f"{name}.com",
+                        f"{name}.net",
+                    ]
+                else:
+                    page = rng.randint(1, 100)
+                    response = api.customers.search(10, page)
+                    assert [c.id for c in response] == [
+                        str(i) for i in range((page - 1) * 10 + 1, page * 10 + 1)
+                    ]
+                    assert response.db_records == 1000
+                calls += 1
+            return calls
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            calls = sum(executor.map(work, range(WORKERS)))
+
+        snapshot = metrics.snapshot()
+        availability = snapshot["domains.availability_check"]
+        search = snapshot["customers.search"]
+        stats = cache.stats()
+        assert calls == WORKERS * CALLS_PER_WORKER
+        assert availability["latency"]["count"] + search["latency"]["count"] == calls
+        assert not availability["errors"] and not search["errors"]
+        assert stats.hits + stats.misses == availability["latency"]["count"]
+        assert availability["cache_hits"] == stats.hits
+        assert api.retry_policy.stats().retries == 0
+        # Requests wait for a pooled connection instead of opening new ones
+        assert server.connections <= POOL_SIZE
+        api.close()
@@ -0,0 +1,121 @@
+"""Timeouts and Deadlines Unit Tests"""
+
+import time
+
+import pytest
+import requests
+
+from src.resellerclub import ResellerClub, deadline
+from src.resellerclub.client.retry import RetryPolicy
+from src.resellerclub.client.timeouts import Timeout, Timeouts
+from src.resellerclub.exceptions import (
+    DeadlineExceededException,
+    ResellerClubAPIException,
+)
+
+from .mocks import MockSearchRequests, MockSequenceRequests
+
+ERROR = (503, {"status": "ERROR", "message": "Service unavailable"})
+
+
+class RecordingRequests(MockSearchRequests):
+    """Mock search recording the timeout of each request"""
+
+    def __init__(self, total: int):
+        super().__init__(total)
+        self.timeouts = []
+
+    def get(self, url, params=None, **kwargs):
+        self.timeouts.append(kwargs["timeout"])
+        return super().get(url, params)
+
+
+class TestTimeouts:
+    """Timeouts Test Cases"""
+
+    def test_endpoint_timeouts(self):
+        """Test availability endpoints get shorter timeouts than the default"""
+        timeouts = Timeouts()
+        base_url = "https://test.httpapi.com/api/"
+
+        assert timeouts.get(f"{base_url}domains/available.json") == (3.05, 10)
+        assert timeouts.get(f"{base_url}domains/premium/available.json") == (3.05, 20)
+        assert timeouts.get(f"{base_url}customers/search.json") == (10, 120)
+
+    def test_timeout_sent_to_transport(self, monkeypatch):
+        """Test the endpoint timeout is used for the request"""
+        mock = RecordingRequests(total=1)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        timeouts = Timeouts(default=Timeout(1, 5))
+        api = ResellerClub("reseller", "key", timeouts=timeouts)
+
+        api.customers.search(10, 1)
+
+        assert mock.timeouts == [(1, 5)]
+
+    def test_deadline_shortens_timeout(self, monkeypatch):
+        """Test the timeout never exceeds the time left before the deadline"""
+        mock = RecordingRequests(total=1)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        api = ResellerClub("reseller", "key")
+
+        with deadline(2):
+            api.customers.search(10, 1)
+
+        connect, read = mock.timeouts[0]
+        assert connect <= 2 and read <= 2
+
+    def test_nested_deadline_keeps_shortest(self):
+        """Test a longer deadline does not extend the one in effect"""
+        with deadline(1) as outer:
+            with deadline(10) as inner:
+                assert inner.expires_at == outer.expires_at
+
+    def test_expired_deadline_raises(self, monkeypatch):
+        """Test no request is sent once the deadline has passed"""
+        mock = RecordingRequests(total=1)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        api = ResellerClub("reseller", "key")
+
+        with pytest.raises(DeadlineExceededException):
+            with deadline(0.01):
+                time.sleep(0.02)
+                api.customers.search(10, 1)
+        assert not mock.calls
+
+    def test_retries_stop_at_deadline(self, monkeypatch):
+        """Test no retry is attempted if its backoff would overrun the deadline"""
+        mock = MockSequenceRequests(ERROR, ERROR)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        policy = RetryPolicy(backoff_factor=5, jitter=False)
+        api = ResellerClub("reseller", "key", retry_policy=policy)
+
+        with pytest.raises(ResellerClubAPIException):
+            with deadline(1):
+                api.customers.search(10, 1)
+        assert mock.calls == 1
+
+    @pytest.mark.parametrize("method", ["iter_search", "export"])
+    def test_deadline_counted_from_call(self, monkeypatch, method):
+        """Test the deadline of a lazy iteration starts at the call, not at the first item"""
+        mock = RecordingRequests(total=1)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        api = ResellerClub("reseller", "key")
+
+        customers = getattr(api.customers, method)(10, deadline=0.01)
+        time.sleep(0.02)
+
+        with pytest.raises(DeadlineExceededException):
+            next(customers)
+        assert not mock.calls
+
+    def test_deadline_carried_to_workers(self, monkeypatch):
+        """Test the export deadline applies to the pages fetched by worker threads"""
+        mock = RecordingRequests(total=50)
+        monkeypatch.setattr(requests.Session, "get", mock.get)
+        api = ResellerClub("reseller", "key")
+
+        list(api.customers.export(10, deadline=3))
+
+        assert len(mock.timeouts) == 5
+        assert all(read <= 3 for _, read in mock.timeouts)
@@ -0,0 +1,61 @@
+"""Transport Unit Tests"""
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.transport import Transport
+
+from .mocks import MockRequests
+
+
+class TestTransport:
+    """Transport Test Cases"""
+
+    def test_clients_share_transport(self):
+        """Test domains and customers clients use the same connection pool"""
+        api = ResellerClub("reseller", "key")
+
+        assert api.domains._transport is api.transport
+        assert api.customers._transport is api.transport
+
+    def test_given_transport_is_left_open(self, monkeypatch):
+        """Test a client only closes the transport it built"""
+        closed = []
+        transport = Transport()
+        monkeypatch.setattr(transport, "close", lambda: closed.append(True))
+
+        with ResellerClub("reseller", "key", transport=transport):
+            pass
+        assert not closed
+
+        with ResellerClub("reseller", "key") as api:
+            monkeypatch.setattr(api.transport, "close", lambda: closed.append(True))
+        assert closed == [True]
+
+    def test_pool_limits(self):
+        """Test pool limits are applied to the mounted adapters"""
+        transport = Transport(pool_connections=2, pool_maxsize=4, pool_block=True)
+        adapter = transport._session.get_adapter("https://httpapi.com/api/")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 4
+        assert adapter._pool_block is True
+
+    def test_keep_alive_disabled(self):
+        """Test connections are closed after each request when keep-alive is disabled"""
+        transport = Transport(keep_alive=False)
+
+        assert transport._session.headers["Connection"] == "close"
+
+    def test_custom_transport_without_stream(self):
+        """Test transports predating streaming still serve regular requests"""
+        with open("tests/responses/customers/customer_details.txt", "rb") as f:
+            response = MockRequests(f.read()).response
+
+        class LegacyTransport(Transport):
+            """Transport with the request signature from before streaming"""
+
+            def request(self, method, url, params, timeout):
+                return response
+
+        api = ResellerClub("reseller", "key", transport=LegacyTransport())
+
+        assert api.customers.get_by_id(30930235).id == "30930235"
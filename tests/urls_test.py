@@ -0,0 +1,73 @@
+"""URLs Unit Tests"""
+
+import pytest
+
+from src.resellerclub import ResellerClub
+from src.resellerclub.client.urls import URLs
+from src.resellerclub.client.urls.base import BaseURLs, Endpoint
+
+
+class ContactsURLs(BaseURLs):
+    """Contacts endpoints used to test group registration"""
+
+    base_url = "contacts/"
+
+    add = Endpoint("add.json", "Endpoint to add a contact")
+
+
+class ContactsAPIURLs(URLs):
+    """URLs with an extra endpoint group"""
+
+    groups = {**URLs.groups, "contacts": ContactsURLs}
+
+
+class TestURLs:
+    """URLs Test Cases"""
+
+    def test_shared_per_mode(self):
+        """Test every client of the same mode shares the same URLs"""
+        test_api = ResellerClub("reseller", "key")
+        other_test_api = ResellerClub("other", "key")
+        live_api = ResellerClub("reseller", "key", test_mode=False)
+
+        assert test_api.domains._urls is other_test_api.customers._urls
+        assert test_api.domains._urls is URLs.shared(True)
+        assert live_api.domains._urls is URLs.shared(False)
+        assert live_api.domains._urls.base_url == URLs.prod_url
+
+    def test_read_only(self):
+        """Test URLs cannot be changed once built"""
+        urls = URLs.shared()
+
+        with pytest.raises(AttributeError):
+            urls.customers.search = "https://example.com"
+        with pytest.raises(AttributeError):
+            del urls.domains
+
+    def test_endpoints(self):
+        """Test endpoint URLs and names"""
+        urls = URLs.shared()
+
+        assert urls.customers.search == f"{URLs.test_url}customers/search.json"
+        assert (
+            urls.domains.get_availability_check_url("premium")
+            == urls.domains.premium_availability_check
+        )
+        assert urls.domains.get_availability_check_url() == (
+            f"{URLs.test_url}domains/available.json"
+        )
+        assert urls.get_endpoint_name(urls.customers.search) == "customers.search"
+        assert (
+            urls.get_endpoint_name(urls.domains.idn_availability_check)
+            == "domains.availability_check.idn"
+        )
+        assert urls.get_endpoint_name(f"{URLs.test_url}other.json") == "other.json"
+
+    def test_registered_group(self):
+        """Test endpoint groups declared in a subclass"""
+        urls = ContactsAPIURLs.shared()
+
+        assert urls is not URLs.shared()
+        assert urls.contacts.add == f"{URLs.test_url}contacts/add.json"
+        assert urls.get_endpoint_name(urls.contacts.add) == "contacts.add"
+        assert urls.customers.search == URLs.shared().customers.search